@@ -0,0 +1,70 @@
+// Compares the old per-assignment submission lookup in getAssignments with
+// the batched loader. Seed first with:
+//   SEED_LARGE_COURSE=1 npm run db:seed
+// then run: npm run bench:assignments [-- <courseId>]
+require('dotenv').config();
+const prisma = require('../src/config/database');
+const { loadLatestSubmissions } = require('../src/services/submissionLoader');
+const { measure, report } = require('./lib');
+
+const ITERATIONS = parseInt(process.env.BENCH_ITERATIONS) || 200;
+
+const loadAssignments = (courseId) =>
+  prisma.assignment.findMany({
+    where: { courseId, deletedAt: null },
+    include: { _count: { select: { submissions: true } } },
+    orderBy: { dueDate: 'asc' },
+  });
+
+// Previous implementation: one findFirst per assignment
+const sequentialLookup = async (courseId, userId) => {
+  const assignments = await loadAssignments(courseId);
+  for (const assignment of assignments) {
+    assignment.mySubmission =
+      (await prisma.assignmentSubmission.findFirst({
+        where: { assignmentId: assignment.id, userId },
+        orderBy: { submissionNumber: 'desc' },
+        include: { grade: true },
+      })) || null;
+  }
+  return assignments;
+};
+
+const batchedLookup = async (courseId, userId) => {
+  const assignments = await loadAssignments(courseId);
+  const latest = await loadLatestSubmissions(userId, assignments.map((a) => a.id));
+  for (const assignment of assignments) {
+    assignment.mySubmission = latest.get(assignment.id) || null;
+  }
+  return assignments;
+};
+
+async function main() {
+  const course = process.argv[2]
+    ? await prisma.course.findUnique({ where: { id: process.argv[2] } })
+    : await prisma.course.findFirst({ where: { code: { startsWith: 'BENCH' } }, orderBy: { createdAt: 'desc' } });
+
+  if (!course) {
+    throw new Error('No benchmark course found. Run SEED_LARGE_COURSE=1 npm run db:seed first.');
+  }
+
+  const student = await prisma.user.findUnique({ where: { email: 'student@conceptspro.com' } });
+  const before = JSON.stringify(await sequentialLookup(course.id, student.id));
+  const after = JSON.stringify(await batchedLookup(course.id, student.id));
+  if (before !== after) {
+    throw new Error('Batched loader returned different JSON from the sequential lookup');
+  }
+
+  console.log(`getAssignments for course ${course.id}, ${ITERATIONS} iterations`);
+  report('before (findFirst per assignment)', await measure(() => sequentialLookup(course.id, student.id), { iterations: ITERATIONS }));
+  report('after (batched loader)', await measure(() => batchedLookup(course.id, student.id), { iterations: ITERATIONS }));
+}
+
+main()
+  .catch((e) => {
+    console.error(e);
+    process.exit(1);
+  })
+  .finally(async () => {
+    await prisma.$disconnect();
+  });
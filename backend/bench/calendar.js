@@ -0,0 +1,180 @@
+// Calendar month and semester views for a student in many busy courses.
+// Creates BENCH_COURSES courses, each with weekly lecture/lab/office-hour
+// series, hundreds of one-off events and dozens of assignments, plus
+// BENCH_NOISE_EVENTS events in an unrelated course so the date-range index
+// has something to skip. Times GET /api/calendar against a naive baseline
+// that loads every event and assignment and filters the whole list once per
+// day (what CalendarPage used to do).
+// Run: npm run bench:calendar
+require('dotenv').config();
+const jwt = require('jsonwebtoken');
+const app = require('../src/server');
+const prisma = require('../src/config/database');
+const { measure, report } = require('./lib');
+
+const COURSES = parseInt(process.env.BENCH_COURSES) || 8;
+const EVENTS_PER_COURSE = parseInt(process.env.BENCH_EVENTS) || 300;
+const ASSIGNMENTS_PER_COURSE = parseInt(process.env.BENCH_ASSIGNMENTS) || 40;
+const NOISE_EVENTS = parseInt(process.env.BENCH_NOISE_EVENTS) || 100000;
+const ITERATIONS = parseInt(process.env.BENCH_ITERATIONS) || 100;
+const DAY_MS = 24 * 60 * 60 * 1000;
+const TERM_START = new Date('2024-09-02T00:00:00Z');
+
+const SERIES = [
+  { title: 'Lecture', eventType: 'lecture', hour: 14, minutes: 75, rule: 'FREQ=WEEKLY;BYDAY=MO,WE,FR;UNTIL=20241213' },
+  { title: 'Lab', eventType: 'lecture', hour: 18, minutes: 120, rule: 'FREQ=WEEKLY;BYDAY=TU' },
+  { title: 'Office Hours', eventType: 'custom', hour: 16, minutes: 60, rule: 'FREQ=WEEKLY;INTERVAL=1;BYDAY=TH' },
+  { title: 'Weekly Quiz', eventType: 'exam', hour: 9, minutes: 30, rule: 'FREQ=WEEKLY;BYDAY=FR;COUNT=14' },
+];
+
+const at = (days, hour = 0, minutes = 0) => new Date(TERM_START.getTime() + days * DAY_MS + (hour * 60 + minutes) * 60000);
+
+async function createCourse(instructor, code, events, assignments) {
+  const course = await prisma.course.create({
+    data: {
+      code,
+      title: `Calendar Benchmark ${code}`,
+      instructorId: instructor.id,
+      term: 'Fall 2024',
+      academicYear: 2024,
+      startDate: TERM_START,
+      endDate: new Date('2024-12-15'),
+      status: 'published',
+    },
+  });
+
+  for (let i = 0; i < events; i += 5000) {
+    await prisma.calendarEvent.createMany({
+      data: Array.from({ length: Math.min(5000, events - i) }, (_, j) => {
+        const start = at(((i + j) * 7) % 365 - 60, 8 + ((i + j) % 10));
+        return {
+          courseId: course.id,
+          title: `Event ${i + j}`,
+          eventType: (i + j) % 10 === 0 ? 'exam' : 'deadline',
+          startDate: start,
+          endDate: new Date(start.getTime() + 60 * 60000),
+          createdBy: instructor.id,
+        };
+      }),
+    });
+  }
+
+  if (assignments > 0) {
+    await prisma.assignment.createMany({
+      data: Array.from({ length: assignments }, (_, i) => ({
+        courseId: course.id,
+        title: `Problem Set ${i + 1}`,
+        points: 10,
+        dueDate: at(Math.floor((i * 105) / assignments), 23, 59),
+        isPublished: true,
+      })),
+    });
+  }
+
+  return course;
+}
+
+async function main() {
+  const instructor = await prisma.user.findUnique({ where: { email: 'instructor@conceptspro.com' } });
+  if (!instructor) {
+    throw new Error('Seed the database first (npm run db:seed).');
+  }
+
+  const stamp = Date.now();
+  const student = await prisma.user.create({
+    data: {
+      email: `calendar-${stamp}@conceptspro.com`,
+      passwordHash: 'bench',
+      firstName: 'Calendar',
+      lastName: 'Bench',
+      role: 'student',
+    },
+  });
+
+  const courses = [];
+  for (let i = 0; i < COURSES; i++) {
+    const course = await createCourse(instructor, `BENCH-CAL ${stamp} ${i}`, EVENTS_PER_COURSE, ASSIGNMENTS_PER_COURSE);
+    await prisma.calendarEvent.createMany({
+      data: SERIES.map((series) => ({
+        courseId: course.id,
+        title: series.title,
+        eventType: series.eventType,
+        startDate: at(0, series.hour),
+        endDate: at(0, series.hour, series.minutes),
+        recurrenceRule: series.rule,
+        createdBy: instructor.id,
+      })),
+    });
+    courses.push(course);
+  }
+  const noise = await createCourse(instructor, `BENCH-CAL ${stamp} noise`, NOISE_EVENTS, 0);
+  await prisma.courseEnrollment.createMany({
+    data: courses.map((course) => ({ courseId: course.id, userId: student.id })),
+  });
+  await prisma.$executeRaw`ANALYZE calendar_events`;
+
+  const token = jwt.sign({ userId: student.id, email: student.email, role: student.role }, process.env.JWT_SECRET, {
+    expiresIn: '1h',
+  });
+  const server = app.listen(0);
+  const base = `http://127.0.0.1:${server.address().port}/api/calendar`;
+
+  const windows = [
+    { label: 'month', from: at(29), to: at(60) },
+    { label: 'semester', from: at(-2), to: at(120) },
+  ];
+
+  console.log(
+    `${COURSES} courses x (${EVENTS_PER_COURSE} events + ${SERIES.length} weekly series + ` +
+      `${ASSIGNMENTS_PER_COURSE} assignments), ${NOISE_EVENTS} unrelated events`
+  );
+
+  for (const { label, from, to } of windows) {
+    const url = `${base}?${new URLSearchParams({ from: from.toISOString(), to: to.toISOString(), tz: 'America/Chicago' })}`;
+    const get = async () => {
+      const response = await fetch(url, { headers: { Authorization: `Bearer ${token}` } });
+      if (!response.ok) {
+        throw new Error(`Calendar failed: ${response.status} ${await response.text()}`);
+      }
+      return response.json();
+    };
+
+    const { total, days } = await get();
+    report(`GET /calendar (${label})`, await measure(get, { iterations: ITERATIONS }));
+    console.log(`${''.padEnd(36)} ${total} entries over ${Object.keys(days).length} days`);
+
+    // Baseline: every event and assignment, then one full filter per day
+    const naive = async () => {
+      const courseIds = courses.map((course) => course.id);
+      const [events, assignments] = await Promise.all([
+        prisma.calendarEvent.findMany({ where: { courseId: { in: courseIds }, deletedAt: null } }),
+        prisma.assignment.findMany({ where: { courseId: { in: courseIds }, deletedAt: null } }),
+      ]);
+      const all = [
+        ...events.map((event) => ({ ...event, date: event.startDate.toISOString().slice(0, 10) })),
+        ...assignments.map((assignment) => ({ ...assignment, date: assignment.dueDate.toISOString().slice(0, 10) })),
+      ];
+      const buckets = [];
+      for (let ms = from.getTime(); ms < to.getTime(); ms += DAY_MS) {
+        const day = new Date(ms).toISOString().slice(0, 10);
+        buckets.push(all.filter((entry) => entry.date === day));
+      }
+      return buckets;
+    };
+    report(`naive load-all (${label})`, await measure(naive, { iterations: ITERATIONS }));
+  }
+
+  server.close();
+
+  await prisma.course.deleteMany({ where: { id: { in: [...courses.map((course) => course.id), noise.id] } } });
+  await prisma.user.delete({ where: { id: student.id } });
+}
+
+main()
+  .catch((e) => {
+    console.error(e);
+    process.exit(1);
+  })
+  .finally(async () => {
+    await prisma.$disconnect();
+  });
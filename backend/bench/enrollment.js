@@ -0,0 +1,122 @@
+// Registration-open load test: thousands of students hit
+// POST /api/courses/:id/enroll at once for a course with few seats.
+// Verifies nobody is admitted past maxEnrollment, that currentEnrollment
+// matches the enrollment rows, and reports throughput.
+// Run: npm run bench:enrollment
+require('dotenv').config();
+const jwt = require('jsonwebtoken');
+const app = require('../src/server');
+const prisma = require('../src/config/database');
+const { report, summarize } = require('./lib');
+
+const STUDENTS = parseInt(process.env.BENCH_STUDENTS) || 2000;
+const SEATS = parseInt(process.env.BENCH_SEATS) || 150;
+const CONCURRENCY = parseInt(process.env.BENCH_CONCURRENCY) || 500;
+
+async function main() {
+  const instructor = await prisma.user.findUnique({ where: { email: 'instructor@conceptspro.com' } });
+  if (!instructor) {
+    throw new Error('Seed the database first (npm run db:seed).');
+  }
+
+  const course = await prisma.course.create({
+    data: {
+      code: `BENCH-ENROLL ${Date.now()}`,
+      title: 'Enrollment Rush',
+      instructorId: instructor.id,
+      term: 'Fall 2024',
+      academicYear: 2024,
+      endDate: new Date('2024-12-15'),
+      maxEnrollment: SEATS,
+      status: 'published',
+    },
+  });
+
+  // Passwords are never checked here; tokens are signed directly
+  const emails = Array.from({ length: STUDENTS }, (_, i) => `enroll-${course.id}-${i}@conceptspro.com`);
+  await prisma.user.createMany({
+    data: emails.map((email, i) => ({
+      email,
+      passwordHash: 'bench',
+      firstName: 'Rush',
+      lastName: `Student ${i}`,
+      role: 'student',
+    })),
+  });
+  const students = await prisma.user.findMany({
+    where: { email: { in: emails } },
+    select: { id: true, email: true, role: true },
+  });
+  const tokens = students.map((student) =>
+    jwt.sign({ userId: student.id, email: student.email, role: student.role }, process.env.JWT_SECRET, {
+      expiresIn: '1h',
+    })
+  );
+
+  const server = app.listen(0);
+  const url = `http://127.0.0.1:${server.address().port}/api/courses/${course.id}/enroll`;
+
+  const statuses = {};
+  const latencies = [];
+  let next = 0;
+
+  const worker = async () => {
+    while (next < tokens.length) {
+      const token = tokens[next++];
+      const start = process.hrtime.bigint();
+      const response = await fetch(url, { method: 'POST', headers: { Authorization: `Bearer ${token}` } });
+      latencies.push(Number(process.hrtime.bigint() - start) / 1e6);
+
+      const body = await response.json();
+      const key = response.ok ? body.enrollmentStatus : `http ${response.status}`;
+      statuses[key] = (statuses[key] || 0) + 1;
+    }
+  };
+
+  const start = process.hrtime.bigint();
+  await Promise.all(Array.from({ length: CONCURRENCY }, worker));
+  const seconds = Number(process.hrtime.bigint() - start) / 1e9;
+  server.close();
+
+  const [updated, enrolledRows, waitlistedRows] = await Promise.all([
+    prisma.course.findUnique({ where: { id: course.id } }),
+    prisma.courseEnrollment.count({ where: { courseId: course.id, enrollmentStatus: 'enrolled' } }),
+    prisma.courseEnrollment.count({ where: { courseId: course.id, enrollmentStatus: 'waitlisted' } }),
+  ]);
+
+  console.log(`${STUDENTS} students, ${SEATS} seats, ${CONCURRENCY} concurrent clients`);
+  console.log(`responses: ${JSON.stringify(statuses)}`);
+  report('POST /courses/:id/enroll', latencies);
+  console.log(`throughput: ${(summarize(latencies).count / seconds).toFixed(0)} enrollments/s over ${seconds.toFixed(2)}s`);
+  console.log(
+    `enrolled rows=${enrolledRows}  waitlisted rows=${waitlistedRows}  currentEnrollment=${updated.currentEnrollment}`
+  );
+
+  const expected = Math.min(SEATS, STUDENTS);
+  const failures = [
+    enrolledRows > SEATS && `oversubscribed: ${enrolledRows} enrolled for ${SEATS} seats`,
+    enrolledRows !== expected && `expected ${expected} enrolled, found ${enrolledRows}`,
+    updated.currentEnrollment !== enrolledRows &&
+      `currentEnrollment ${updated.currentEnrollment} drifted from ${enrolledRows} rows`,
+    enrolledRows + waitlistedRows !== STUDENTS && `lost enrollments: ${enrolledRows + waitlistedRows}/${STUDENTS}`,
+  ].filter(Boolean);
+
+  if (failures.length > 0) {
+    failures.forEach((failure) => console.error(`FAIL ${failure}`));
+    process.exitCode = 1;
+  } else {
+    console.log('OK no oversubscription');
+  }
+
+  await prisma.course.delete({ where: { id: course.id } });
+  await prisma.user.deleteMany({ where: { email: { in: emails } } });
+}
+
+main()
+  .catch((e) => {
+    console.error(e);
+    process.exit(1);
+  })
+  .finally(async () => {
+    await prisma.$disconnect();
+  });
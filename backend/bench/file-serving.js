@@ -0,0 +1,102 @@
+// Concurrent HTTP Range reads of a large video, through the previous
+// existsSync + sendFile handler and through the current file server.
+// Run: npm run bench:files
+require('dotenv').config();
+const fs = require('fs');
+const path = require('path');
+const crypto = require('crypto');
+const express = require('express');
+const jwt = require('jsonwebtoken');
+const app = require('../src/server');
+const prisma = require('../src/config/database');
+const { authenticate } = require('../src/middleware/auth');
+const { uploadDir } = require('../src/services/fileService');
+const { summarize } = require('./lib');
+
+const FILE_MB = parseInt(process.env.BENCH_FILE_MB) || 100;
+const REQUESTS = parseInt(process.env.BENCH_REQUESTS) || 2000;
+const CONCURRENCY = parseInt(process.env.BENCH_CONCURRENCY) || 64;
+const RANGE_BYTES = 1024 * 1024;
+
+// The handler routes/files.js used before the file server
+const legacyApp = express();
+legacyApp.get('/api/files/:folder/:filename', authenticate, (req, res, next) => {
+  try {
+    const { folder, filename } = req.params;
+    const filePath = path.join(uploadDir, folder, filename);
+
+    if (!fs.existsSync(filePath)) {
+      return res.status(404).json({ error: 'File not found' });
+    }
+
+    res.sendFile(path.resolve(filePath));
+  } catch (error) {
+    next(error);
+  }
+});
+
+const rangeReads = async (baseUrl, filePath, token) => {
+  const size = FILE_MB * 1024 * 1024;
+  const samples = [];
+  let next = 0;
+
+  const worker = async () => {
+    while (next < REQUESTS) {
+      next++;
+      const offset = Math.floor(Math.random() * (size - RANGE_BYTES));
+      const start = process.hrtime.bigint();
+      const response = await fetch(`${baseUrl}/api/files/${filePath}`, {
+        headers: { Authorization: `Bearer ${token}`, Range: `bytes=${offset}-${offset + RANGE_BYTES - 1}` },
+      });
+      await response.arrayBuffer();
+      if (response.status !== 206) {
+        throw new Error(`Expected 206, got ${response.status}`);
+      }
+      samples.push(Number(process.hrtime.bigint() - start) / 1e6);
+    }
+  };
+
+  const start = process.hrtime.bigint();
+  await Promise.all(Array.from({ length: CONCURRENCY }, worker));
+  return { seconds: Number(process.hrtime.bigint() - start) / 1e9, samples };
+};
+
+async function main() {
+  const student = await prisma.user.findUnique({ where: { email: 'student@conceptspro.com' } });
+  if (!student) {
+    throw new Error('Seed the database first (npm run db:seed).');
+  }
+  const token = jwt.sign({ userId: student.id, email: student.email, role: student.role }, process.env.JWT_SECRET, {
+    expiresIn: '1h',
+  });
+
+  // A large "lecture video" in the content-addressed store
+  const content = crypto.randomBytes(FILE_MB * 1024 * 1024);
+  const storedName = `${crypto.createHash('sha256').update(content).digest('hex')}.mp4`;
+  const videoPath = path.join(uploadDir, 'objects', storedName);
+  await fs.promises.writeFile(videoPath, content);
+
+  const servers = { 'before (existsSync + sendFile)': legacyApp.listen(0), 'after (file server)': app.listen(0) };
+
+  console.log(`${REQUESTS} x 1MB range reads of a ${FILE_MB}MB file, concurrency ${CONCURRENCY}`);
+  for (const [label, server] of Object.entries(servers)) {
+    const { seconds, samples } = await rangeReads(`http://127.0.0.1:${server.address().port}`, `objects/${storedName}`, token);
+    const s = summarize(samples);
+    console.log(
+      `${label.padEnd(32)} ${(REQUESTS / seconds).toFixed(0)} req/s  ` +
+        `p50=${s.p50.toFixed(2)}ms  p99=${s.p99.toFixed(2)}ms`
+    );
+    server.close();
+  }
+
+  await fs.promises.unlink(videoPath);
+}
+
+main()
+  .catch((e) => {
+    console.error(e);
+    process.exit(1);
+  })
+  .finally(async () => {
+    await prisma.$disconnect();
+  });
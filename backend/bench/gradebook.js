@@ -0,0 +1,99 @@
+// Peak RSS and time-to-first-byte for the nested getCourseGrades payload
+// versus the streaming gradebook export. Seed a large section first:
+//   SEED_LARGE_COURSE=1 SEED_STUDENTS=5000 npm run db:seed
+// then run: npm run bench:gradebook [-- <courseId>]
+require('dotenv').config();
+const http = require('http');
+const jwt = require('jsonwebtoken');
+const app = require('../src/server');
+const prisma = require('../src/config/database');
+
+const RUNS = parseInt(process.env.BENCH_ITERATIONS) || 5;
+
+// GET `path`, sampling this process's RSS until the body has been consumed
+const probe = (port, path, token) =>
+  new Promise((resolve, reject) => {
+    if (global.gc) global.gc();
+    const baseline = process.memoryUsage().rss;
+    let peak = baseline;
+    const sampler = setInterval(() => {
+      peak = Math.max(peak, process.memoryUsage().rss);
+    }, 5);
+
+    const start = process.hrtime.bigint();
+    let ttfb = null;
+    let bytes = 0;
+
+    http
+      .get({ port, path, headers: { Authorization: `Bearer ${token}` } }, (res) => {
+        res.on('data', (chunk) => {
+          if (ttfb === null) ttfb = Number(process.hrtime.bigint() - start) / 1e6;
+          bytes += chunk.length;
+        });
+        res.on('end', () => {
+          clearInterval(sampler);
+          resolve({
+            status: res.statusCode,
+            ttfb,
+            total: Number(process.hrtime.bigint() - start) / 1e6,
+            bytes,
+            peakRssDelta: peak - baseline,
+          });
+        });
+      })
+      .on('error', (error) => {
+        clearInterval(sampler);
+        reject(error);
+      });
+  });
+
+async function main() {
+  const course = process.argv[2]
+    ? await prisma.course.findUnique({ where: { id: process.argv[2] } })
+    : await prisma.course.findFirst({ where: { code: { startsWith: 'BENCH' } }, orderBy: { createdAt: 'desc' } });
+
+  if (!course) {
+    throw new Error('No benchmark course found. Run SEED_LARGE_COURSE=1 npm run db:seed first.');
+  }
+
+  const instructor = await prisma.user.findUnique({ where: { id: course.instructorId } });
+  const token = jwt.sign(
+    { userId: instructor.id, email: instructor.email, role: instructor.role },
+    process.env.JWT_SECRET,
+    { expiresIn: '1h' }
+  );
+
+  const server = app.listen(0);
+  const { port } = server.address();
+  const mb = (bytes) => (bytes / 1024 / 1024).toFixed(1);
+
+  const paths = {
+    'nested JSON (getCourseGrades)': `/api/courses/${course.id}/grades`,
+    'streaming CSV export': `/api/courses/${course.id}/gradebook/export?format=csv`,
+    'streaming NDJSON export': `/api/courses/${course.id}/gradebook/export?format=ndjson`,
+  };
+
+  console.log(`Gradebook for course ${course.id} (${course.currentEnrollment} students), ${RUNS} runs each`);
+  for (const [label, path] of Object.entries(paths)) {
+    const results = [];
+    for (let i = 0; i < RUNS; i++) {
+      results.push(await probe(port, path, token));
+    }
+    const worst = (key) => Math.max(...results.map((r) => r[key]));
+    console.log(
+      `${label.padEnd(32)} ttfb=${worst('ttfb').toFixed(1)}ms  total=${worst('total').toFixed(1)}ms  ` +
+        `body=${mb(results[0].bytes)}MB  peakRssDelta=${mb(worst('peakRssDelta'))}MB`
+    );
+  }
+
+  server.close();
+}
+
+main()
+  .catch((e) => {
+    console.error(e);
+    process.exit(1);
+  })
+  .finally(async () => {
+    await prisma.$disconnect();
+  });
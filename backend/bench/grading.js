@@ -0,0 +1,123 @@
+// Grading a stack of essays: the per-submission endpoints
+// (POST /submissions/:id/grade and /release) versus one bulk grade and one
+// bulk release call. Both paths include draining the notification queue.
+// Seed first: SEED_LARGE_COURSE=1 npm run db:seed
+// Run: npm run bench:grading [-- <courseId>]
+require('dotenv').config();
+const jwt = require('jsonwebtoken');
+const app = require('../src/server');
+const prisma = require('../src/config/database');
+const notificationFanout = require('../src/services/notificationFanout');
+
+const GRADES = parseInt(process.env.BENCH_GRADES) || 400;
+const BATCH = 1000; // BULK_GRADE_MAX default
+const CONCURRENCY = parseInt(process.env.BENCH_CONCURRENCY) || 8;
+
+const post = async (url, token, body) => {
+  const response = await fetch(url, {
+    method: 'POST',
+    headers: { Authorization: `Bearer ${token}`, 'Content-Type': 'application/json' },
+    body: JSON.stringify(body),
+  });
+  if (!response.ok) {
+    throw new Error(`POST ${url} failed: ${response.status} ${await response.text()}`);
+  }
+  return response.json();
+};
+
+const timed = async (fn) => {
+  const start = process.hrtime.bigint();
+  await fn();
+  await notificationFanout.whenIdle();
+  return Number(process.hrtime.bigint() - start) / 1e6;
+};
+
+const inParallel = async (items, fn) => {
+  let next = 0;
+  const worker = async () => {
+    while (next < items.length) {
+      const i = next++;
+      await fn(items[i], i);
+    }
+  };
+  await Promise.all(Array.from({ length: CONCURRENCY }, worker));
+};
+
+const scoreFor = (i) => ({ pointsEarned: 60 + (i % 40), feedback: `Essay feedback ${i}` });
+
+async function main() {
+  const course = process.argv[2]
+    ? await prisma.course.findUnique({ where: { id: process.argv[2] } })
+    : await prisma.course.findFirst({ where: { code: { startsWith: 'BENCH ' } }, orderBy: { createdAt: 'desc' } });
+
+  if (!course) {
+    throw new Error('No benchmark course found. Run SEED_LARGE_COURSE=1 npm run db:seed first.');
+  }
+
+  const submissions = await prisma.assignmentSubmission.findMany({
+    where: { assignment: { courseId: course.id } },
+    select: { id: true },
+    orderBy: { id: 'asc' },
+    take: GRADES,
+  });
+  const ids = submissions.map((submission) => submission.id);
+
+  const instructor = await prisma.user.findUnique({ where: { id: course.instructorId } });
+  const token = jwt.sign(
+    { userId: instructor.id, email: instructor.email, role: instructor.role },
+    process.env.JWT_SECRET,
+    { expiresIn: '1h' }
+  );
+
+  const server = app.listen(0);
+  const base = `http://127.0.0.1:${server.address().port}/api`;
+
+  const reset = () => prisma.grade.deleteMany({ where: { submissionId: { in: ids } } });
+
+  await reset();
+  const singleGrade = await timed(() =>
+    inParallel(ids, (id, i) => post(`${base}/submissions/${id}/grade`, token, scoreFor(i)))
+  );
+  const singleRelease = await timed(() => inParallel(ids, (id) => post(`${base}/submissions/${id}/release`, token, {})));
+
+  await reset();
+  const batches = [];
+  for (let i = 0; i < ids.length; i += BATCH) {
+    batches.push(ids.slice(i, i + BATCH));
+  }
+  const bulkGrade = await timed(async () => {
+    for (const [b, batch] of batches.entries()) {
+      await post(`${base}/courses/${course.id}/grades/bulk`, token, {
+        grades: batch.map((submissionId, i) => ({ submissionId, ...scoreFor(b * BATCH + i) })),
+      });
+    }
+  });
+  const bulkRelease = await timed(async () => {
+    for (const batch of batches) {
+      await post(`${base}/courses/${course.id}/grades/release`, token, { submissionIds: batch });
+    }
+  });
+
+  server.close();
+
+  const line = (label, ms) =>
+    console.log(`${label.padEnd(36)} ${ms.toFixed(0).padStart(7)}ms  ${((ids.length / ms) * 1000).toFixed(0)} grades/s`);
+
+  console.log(`${ids.length} submissions in course ${course.id}; per-submission path uses ${CONCURRENCY} clients`);
+  line('per-submission grade', singleGrade);
+  line('bulk grade', bulkGrade);
+  line('per-submission release + notify', singleRelease);
+  line('bulk release + notify', bulkRelease);
+  console.log(
+    `speedup: grade ${(singleGrade / bulkGrade).toFixed(1)}x, release ${(singleRelease / bulkRelease).toFixed(1)}x`
+  );
+}
+
+main()
+  .catch((e) => {
+    console.error(e);
+    process.exit(1);
+  })
+  .finally(async () => {
+    await prisma.$disconnect();
+  });
@@ -0,0 +1,136 @@
+// Sustained content-progress heartbeats from thousands of simulated viewers
+// posting batched heartbeats to /api/progress/heartbeats. Reports accepted
+// heartbeats/s, request latency and how many rows the coalescing buffer
+// actually wrote, then checks that no watch time was lost.
+// Seed first: SEED_LARGE_COURSE=1 SEED_STUDENTS=5000 npm run db:seed
+// Run: npm run bench:heartbeats [-- <courseId>]
+require('dotenv').config();
+const jwt = require('jsonwebtoken');
+const app = require('../src/server');
+const prisma = require('../src/config/database');
+const progressTracker = require('../src/services/progressTracker');
+const { report } = require('./lib');
+
+const VIEWERS = parseInt(process.env.BENCH_VIEWERS) || 5000;
+const CONTENTS = parseInt(process.env.BENCH_CONTENTS) || 20;
+const SECONDS = parseInt(process.env.BENCH_SECONDS) || 15;
+const CONCURRENCY = parseInt(process.env.BENCH_CONCURRENCY) || 100;
+// Heartbeats a player collects before posting (one per 5s of playback)
+const PER_REQUEST = parseInt(process.env.BENCH_HEARTBEATS_PER_REQUEST) || 4;
+
+async function main() {
+  const course = process.argv[2]
+    ? await prisma.course.findUnique({ where: { id: process.argv[2] } })
+    : await prisma.course.findFirst({ where: { code: { startsWith: 'BENCH ' } }, orderBy: { createdAt: 'desc' } });
+
+  if (!course) {
+    throw new Error('No benchmark course found. Run SEED_LARGE_COURSE=1 npm run db:seed first.');
+  }
+
+  const videos = await prisma.module.create({
+    data: {
+      courseId: course.id,
+      title: 'Heartbeat Benchmark Videos',
+      orderIndex: 999,
+      isPublished: true,
+      contents: {
+        create: Array.from({ length: CONTENTS }, (_, i) => ({
+          title: `Lecture ${i + 1}`,
+          contentType: 'video',
+          orderIndex: i,
+          durationMinutes: 50,
+          isPublished: true,
+        })),
+      },
+    },
+    include: { contents: { select: { id: true } } },
+  });
+  const contentIds = videos.contents.map((content) => content.id);
+
+  const enrollments = await prisma.courseEnrollment.findMany({
+    where: { courseId: course.id, enrollmentStatus: 'enrolled' },
+    select: { user: { select: { id: true, email: true, role: true } } },
+    take: VIEWERS,
+  });
+  const viewers = enrollments.map(({ user }, i) => ({
+    token: jwt.sign({ userId: user.id, email: user.email, role: user.role }, process.env.JWT_SECRET, {
+      expiresIn: '1h',
+    }),
+    contentId: contentIds[i % contentIds.length],
+    position: 0,
+  }));
+
+  const server = app.listen(0);
+  const url = `http://127.0.0.1:${server.address().port}/api/progress/heartbeats`;
+
+  const latencies = [];
+  let accepted = 0;
+  let secondsSent = 0;
+  let next = 0;
+  const deadline = Date.now() + SECONDS * 1000;
+
+  const worker = async () => {
+    while (Date.now() < deadline) {
+      const viewer = viewers[next++ % viewers.length];
+      const heartbeats = Array.from({ length: PER_REQUEST }, () => {
+        viewer.position += 5;
+        return { contentId: viewer.contentId, position: viewer.position, secondsSpent: 5, completionPercentage: 0 };
+      });
+
+      const start = process.hrtime.bigint();
+      const response = await fetch(url, {
+        method: 'POST',
+        headers: { Authorization: `Bearer ${viewer.token}`, 'Content-Type': 'application/json' },
+        body: JSON.stringify({ heartbeats }),
+      });
+      latencies.push(Number(process.hrtime.bigint() - start) / 1e6);
+
+      if (response.status !== 202) {
+        throw new Error(`Heartbeat failed: ${response.status} ${await response.text()}`);
+      }
+      const result = await response.json();
+      accepted += result.accepted;
+      secondsSent += result.accepted * 5;
+    }
+  };
+
+  await Promise.all(Array.from({ length: CONCURRENCY }, worker));
+  server.close();
+  await progressTracker.flush();
+
+  const stats = progressTracker.getStats();
+  const stored = await prisma.contentProgress.aggregate({
+    where: { contentId: { in: contentIds } },
+    _sum: { timeSpentSeconds: true },
+    _count: true,
+  });
+
+  console.log(`${viewers.length} viewers, ${CONCURRENCY} clients, ${PER_REQUEST} heartbeats/request, ${SECONDS}s`);
+  report('POST /progress/heartbeats', latencies);
+  console.log(`throughput: ${(accepted / SECONDS).toFixed(0)} heartbeats/s`);
+  console.log(
+    `coalescing: ${stats.heartbeats} heartbeats -> ${stats.rowsWritten} row upserts in ${stats.flushes} flushes ` +
+      `(${(stats.heartbeats / Math.max(stats.rowsWritten, 1)).toFixed(1)}x), ${stored._count} progress rows`
+  );
+
+  // Viewers here send faster than real time, so only part of what they
+  // claim is credited; every credited second must be stored
+  const storedSeconds = stored._sum.timeSpentSeconds || 0;
+  if (storedSeconds !== stats.secondsCredited) {
+    console.error(`FAIL watch time: credited ${stats.secondsCredited}s, stored ${storedSeconds}s`);
+    process.exitCode = 1;
+  } else {
+    console.log(`OK watch time: ${secondsSent}s sent, ${storedSeconds}s credited and stored`);
+  }
+
+  await prisma.module.delete({ where: { id: videos.id } });
+}
+
+main()
+  .catch((e) => {
+    console.error(e);
+    process.exit(1);
+  })
+  .finally(async () => {
+    await prisma.$disconnect();
+  });
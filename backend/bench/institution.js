@@ -0,0 +1,280 @@
+// Institution-scale dataset for the load suite (bench/suite.js): students
+// and instructors sharing one password, courses with enrollments,
+// assignments with past submissions and grades, and a notification backlog
+// per user. A handful of courses are left empty with limited seats for
+// registration-day runs, and every course has one assignment still open.
+// Every id is derived from its position, so the same scale always produces
+// the same rows and runs can be compared across commits.
+// Scale: BENCH_STUDENTS, BENCH_INSTRUCTORS, BENCH_COURSES,
+// BENCH_ENROLLMENTS_PER_STUDENT, BENCH_ASSIGNMENTS_PER_COURSE,
+// BENCH_NOTIFICATIONS_PER_USER, BENCH_REGISTRATION_COURSES,
+// BENCH_REGISTRATION_SEATS. The defaults give ~1.1M submissions and ~2M
+// notifications.
+const crypto = require('crypto');
+const prisma = require('../src/config/database');
+const passwordHasher = require('../src/services/passwordHasher');
+
+const SCALE = {
+  students: parseInt(process.env.BENCH_STUDENTS) || 20000,
+  instructors: parseInt(process.env.BENCH_INSTRUCTORS) || 500,
+  courses: parseInt(process.env.BENCH_COURSES) || 2000,
+  enrollmentsPerStudent: parseInt(process.env.BENCH_ENROLLMENTS_PER_STUDENT) || 5,
+  assignmentsPerCourse: parseInt(process.env.BENCH_ASSIGNMENTS_PER_COURSE) || 12,
+  notificationsPerUser: parseInt(process.env.BENCH_NOTIFICATIONS_PER_USER) || 100,
+  registrationCourses: parseInt(process.env.BENCH_REGISTRATION_COURSES) || 20,
+  registrationSeats: parseInt(process.env.BENCH_REGISTRATION_SEATS) || 150,
+};
+const PASSWORD = 'institution-password';
+const EMAIL_DOMAIN = 'bench.conceptspro.com';
+const CODE_PREFIX = 'BENCH-INST';
+const GRADED_FRACTION = 0.8;
+const INSERT_CHUNK = 5000;
+const DAY = 24 * 60 * 60 * 1000;
+
+// Stable UUID-shaped id for a row, e.g. uuidFor('submission', s, c, a)
+const uuidFor = (...parts) => {
+  const hex = crypto.createHash('md5').update(`${CODE_PREFIX}:${parts.join(':')}`).digest('hex');
+  return `${hex.slice(0, 8)}-${hex.slice(8, 12)}-4${hex.slice(13, 16)}-a${hex.slice(17, 20)}-${hex.slice(20, 32)}`;
+};
+
+// Courses [0, regular) hold the enrollments; the rest open for registration
+const regularCourses = SCALE.courses - SCALE.registrationCourses;
+if (regularCourses < SCALE.enrollmentsPerStudent) {
+  throw new Error('BENCH_COURSES must leave at least BENCH_ENROLLMENTS_PER_STUDENT courses besides registration');
+}
+
+const student = (s) => ({ id: uuidFor('student', s), email: `student-${s}@${EMAIL_DOMAIN}`, role: 'student' });
+const instructor = (i) => ({ id: uuidFor('instructor', i), email: `instructor-${i}@${EMAIL_DOMAIN}`, role: 'instructor' });
+const courseId = (c) => uuidFor('course', c);
+const instructorOf = (c) => instructor(c % SCALE.instructors);
+const assignmentId = (c, a) => uuidFor('assignment', c, a);
+// The last assignment of each course is due in the future
+const openAssignmentId = (c) => assignmentId(c, SCALE.assignmentsPerCourse - 1);
+const coursesOf = (s) =>
+  Array.from({ length: SCALE.enrollmentsPerStudent }, (_, k) => (s * SCALE.enrollmentsPerStudent + k) % regularCourses);
+const registrationCourseIds = () =>
+  Array.from({ length: SCALE.registrationCourses }, (_, r) => courseId(regularCourses + r));
+const openAssignmentIds = () => Array.from({ length: regularCourses }, (_, c) => openAssignmentId(c));
+
+// Deterministic PRNG so every seed makes the same grades and read flags
+let seed = 42;
+const random = () => {
+  seed = (seed * 1664525 + 1013904223) % 4294967296;
+  return seed / 4294967296;
+};
+
+async function insertAll(model, label, rows) {
+  let chunk = [];
+  let inserted = 0;
+  const flush = async () => {
+    await prisma[model].createMany({ data: chunk });
+    inserted += chunk.length;
+    chunk = [];
+    if ((inserted / INSERT_CHUNK) % 20 === 0) {
+      console.log(`  ${inserted} ${label}`);
+    }
+  };
+
+  for (const row of rows) {
+    chunk.push(row);
+    if (chunk.length === INSERT_CHUNK) {
+      await flush();
+    }
+  }
+  if (chunk.length > 0) {
+    await flush();
+  }
+  console.log(`  ${inserted} ${label} in total`);
+  return inserted;
+}
+
+function* users(passwordHash) {
+  for (let i = 0; i < SCALE.instructors; i++) {
+    yield { ...instructor(i), passwordHash, firstName: 'Instructor', lastName: `${i}` };
+  }
+  for (let s = 0; s < SCALE.students; s++) {
+    yield { ...student(s), passwordHash, firstName: 'Student', lastName: `${s}` };
+  }
+}
+
+function* courses(now) {
+  const enrolled = new Array(SCALE.courses).fill(0);
+  for (let s = 0; s < SCALE.students; s++) {
+    for (const c of coursesOf(s)) enrolled[c]++;
+  }
+
+  for (let c = 0; c < SCALE.courses; c++) {
+    const registration = c >= regularCourses;
+    yield {
+      id: courseId(c),
+      code: `${CODE_PREFIX} ${String(c).padStart(5, '0')}`,
+      title: `Institution course ${c}`,
+      instructorId: instructorOf(c).id,
+      term: 'Fall 2024',
+      academicYear: 2024,
+      startDate: new Date(now - 60 * DAY),
+      endDate: new Date(now + 60 * DAY),
+      status: 'published',
+      enrollmentStart: registration ? new Date(now - DAY) : null,
+      enrollmentEnd: registration ? new Date(now + 30 * DAY) : null,
+      maxEnrollment: registration ? SCALE.registrationSeats : null,
+      currentEnrollment: enrolled[c],
+    };
+  }
+}
+
+function* enrollments() {
+  for (let s = 0; s < SCALE.students; s++) {
+    for (const c of coursesOf(s)) {
+      yield { id: uuidFor('enrollment', s, c), courseId: courseId(c), userId: student(s).id };
+    }
+  }
+}
+
+function* assignments(now) {
+  for (let c = 0; c < SCALE.courses; c++) {
+    for (let a = 0; a < SCALE.assignmentsPerCourse; a++) {
+      const weeksAgo = SCALE.assignmentsPerCourse - 1 - a;
+      yield {
+        id: assignmentId(c, a),
+        courseId: courseId(c),
+        title: `Assignment ${a + 1}`,
+        points: 100,
+        dueDate: new Date(weeksAgo > 0 ? now - weeksAgo * 7 * DAY : now + 14 * DAY),
+        submissionType: 'text',
+        isPublished: true,
+        publishedAt: new Date(now - 60 * DAY),
+      };
+    }
+  }
+}
+
+// One submission per enrolled student for every assignment already due
+function* pastSubmissions() {
+  for (let s = 0; s < SCALE.students; s++) {
+    for (const c of coursesOf(s)) {
+      for (let a = 0; a < SCALE.assignmentsPerCourse - 1; a++) {
+        yield { s, c, a, id: uuidFor('submission', s, c, a) };
+      }
+    }
+  }
+}
+
+function* submissions(now) {
+  for (const { s, c, a, id } of pastSubmissions()) {
+    const weeksAgo = SCALE.assignmentsPerCourse - 1 - a;
+    yield {
+      id,
+      assignmentId: assignmentId(c, a),
+      userId: student(s).id,
+      submissionText: `Submission from student ${s}`,
+      submissionDate: new Date(now - weeksAgo * 7 * DAY - DAY),
+    };
+  }
+}
+
+function* grades(now) {
+  for (const { c, id } of pastSubmissions()) {
+    if (random() >= GRADED_FRACTION) continue;
+    const points = 50 + Math.floor(random() * 51);
+    yield {
+      id: uuidFor('grade', id),
+      submissionId: id,
+      graderId: instructorOf(c).id,
+      pointsEarned: points,
+      pointsPossible: 100,
+      percentage: points,
+      gradedAt: new Date(now),
+      releasedAt: new Date(now),
+    };
+  }
+}
+
+function* notifications(now) {
+  const everyone = [
+    ...Array.from({ length: SCALE.instructors }, (_, i) => instructor(i).id),
+    ...Array.from({ length: SCALE.students }, (_, s) => student(s).id),
+  ];
+  for (const userId of everyone) {
+    for (let n = 0; n < SCALE.notificationsPerUser; n++) {
+      yield {
+        id: uuidFor('notification', userId, n),
+        userId,
+        notificationType: 'announcement',
+        title: `Notification ${n}`,
+        isRead: random() < 0.7,
+        createdAt: new Date(now - n * 60 * 60 * 1000),
+      };
+    }
+  }
+}
+
+const lastNotificationId = () =>
+  uuidFor('notification', student(SCALE.students - 1).id, SCALE.notificationsPerUser - 1);
+
+async function isSeeded() {
+  const [students, courseCount, marker] = await Promise.all([
+    prisma.user.count({ where: { email: { endsWith: `@${EMAIL_DOMAIN}` }, role: 'student' } }),
+    prisma.course.count({ where: { code: { startsWith: CODE_PREFIX } } }),
+    prisma.notification.findUnique({ where: { id: lastNotificationId() }, select: { id: true } }),
+  ]);
+  return students === SCALE.students && courseCount === SCALE.courses && marker !== null;
+}
+
+// Courses first: their rows cascade to everything that references the
+// instructors, so the users can go after
+async function cleanup() {
+  await prisma.course.deleteMany({ where: { code: { startsWith: CODE_PREFIX } } });
+  await prisma.user.deleteMany({ where: { email: { endsWith: `@${EMAIL_DOMAIN}` } } });
+}
+
+// Seed the dataset unless this scale is already in place. A partial or
+// differently sized dataset is removed and seeded again.
+async function ensureSeeded({ reset = false } = {}) {
+  if (!reset && (await isSeeded())) {
+    return false;
+  }
+
+  console.log(`Seeding institution: ${JSON.stringify(SCALE)}`);
+  const start = Date.now();
+  await cleanup();
+  seed = 42;
+
+  // One real hash shared by every user, so setup stays quick
+  const passwordHash = await passwordHasher.hash(PASSWORD);
+  const now = Date.now();
+  await insertAll('user', 'users', users(passwordHash));
+  await insertAll('course', 'courses', courses(now));
+  await insertAll('courseEnrollment', 'enrollments', enrollments());
+  await insertAll('assignment', 'assignments', assignments(now));
+  await insertAll('assignmentSubmission', 'submissions', submissions(now));
+  await insertAll('grade', 'grades', grades(now));
+  await insertAll('notification', 'notifications', notifications(now));
+
+  await prisma.$executeRaw`ANALYZE users`;
+  await prisma.$executeRaw`ANALYZE courses`;
+  await prisma.$executeRaw`ANALYZE course_enrollments`;
+  await prisma.$executeRaw`ANALYZE assignments`;
+  await prisma.$executeRaw`ANALYZE assignment_submissions`;
+  await prisma.$executeRaw`ANALYZE grades`;
+  await prisma.$executeRaw`ANALYZE notifications`;
+  console.log(`Seeded in ${((Date.now() - start) / 1000).toFixed(1)}s`);
+  return true;
+}
+
+module.exports = {
+  SCALE,
+  PASSWORD,
+  regularCourses,
+  student,
+  instructor,
+  courseId,
+  instructorOf,
+  assignmentId,
+  openAssignmentId,
+  coursesOf,
+  registrationCourseIds,
+  openAssignmentIds,
+  ensureSeeded,
+  cleanup,
+};
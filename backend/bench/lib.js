@@ -0,0 +1,54 @@
+// Shared helpers for the benchmark scripts in this directory.
+
+const percentile = (sorted, p) => {
+  if (sorted.length === 0) return 0;
+  const index = Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1);
+  return sorted[Math.max(0, index)];
+};
+
+const summarize = (samples) => {
+  const sorted = [...samples].sort((a, b) => a - b);
+  const total = sorted.reduce((sum, value) => sum + value, 0);
+
+  return {
+    count: sorted.length,
+    mean: sorted.length ? total / sorted.length : 0,
+    p50: percentile(sorted, 50),
+    p95: percentile(sorted, 95),
+    p99: percentile(sorted, 99),
+    max: sorted.length ? sorted[sorted.length - 1] : 0,
+  };
+};
+
+// Run fn `iterations` times sequentially (after `warmup` runs) and
+// return per-call latencies in milliseconds.
+const measure = async (fn, { iterations = 100, warmup = 5 } = {}) => {
+  for (let i = 0; i < warmup; i++) {
+    await fn();
+  }
+
+  const samples = [];
+  for (let i = 0; i < iterations; i++) {
+    const start = process.hrtime.bigint();
+    await fn();
+    samples.push(Number(process.hrtime.bigint() - start) / 1e6);
+  }
+
+  return samples;
+};
+
+const report = (label, samples) => {
+  const s = summarize(samples);
+  console.log(
+    `${label.padEnd(36)} n=${s.count}  p50=${s.p50.toFixed(2)}ms  p95=${s.p95.toFixed(2)}ms  ` +
+      `p99=${s.p99.toFixed(2)}ms  max=${s.max.toFixed(2)}ms`
+  );
+  return s;
+};
+
+module.exports = {
+  percentile,
+  summarize,
+  measure,
+  report,
+};
@@ -0,0 +1,113 @@
+// Login storm: hundreds of users sign in at once (start of an exam, say).
+// Reports login latency and throughput, logins shed with 503, and what the
+// storm does to everyone else: /health latency and, in-process, event-loop
+// delay. With hashing off the event loop, /health should stay fast while
+// logins queue on the bcrypt threads.
+// Run in-process:   npm run bench:logins
+// Against a cluster: npm run start:cluster, then
+//                    BENCH_URL=http://localhost:5000 npm run bench:logins
+require('dotenv').config();
+const { monitorEventLoopDelay } = require('perf_hooks');
+const prisma = require('../src/config/database');
+const passwordHasher = require('../src/services/passwordHasher');
+const { report } = require('./lib');
+
+const USERS = parseInt(process.env.BENCH_USERS) || 500;
+const CONCURRENCY = parseInt(process.env.BENCH_CONCURRENCY) || 200;
+const SECONDS = parseInt(process.env.BENCH_SECONDS) || 15;
+const PASSWORD = 'storm-password';
+
+async function main() {
+  // One real cost-12 hash shared by every user, so setup stays quick
+  const passwordHash = await passwordHasher.hash(PASSWORD);
+  const prefix = `login-storm-${Date.now()}`;
+  const emails = Array.from({ length: USERS }, (_, i) => `${prefix}-${i}@conceptspro.com`);
+  await prisma.user.createMany({
+    data: emails.map((email, i) => ({
+      email,
+      passwordHash,
+      firstName: 'Storm',
+      lastName: `User ${i}`,
+      role: 'student',
+    })),
+  });
+
+  let server = null;
+  let base = process.env.BENCH_URL;
+  if (!base) {
+    server = require('../src/server').listen(0);
+    base = `http://127.0.0.1:${server.address().port}`;
+  }
+
+  const loopDelay = monitorEventLoopDelay({ resolution: 10 });
+  const latencies = { login: [], health: [] };
+  const counts = { ok: 0, shed: 0, failed: 0 };
+  const deadline = Date.now() + SECONDS * 1000;
+  let next = 0;
+
+  const client = async () => {
+    while (Date.now() < deadline) {
+      const email = emails[next++ % emails.length];
+      const start = process.hrtime.bigint();
+      const response = await fetch(`${base}/api/auth/login`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ email, password: PASSWORD }),
+      });
+      await response.arrayBuffer();
+
+      if (response.status === 200) {
+        latencies.login.push(Number(process.hrtime.bigint() - start) / 1e6);
+        counts.ok++;
+      } else if (response.status === 503) {
+        counts.shed++;
+      } else {
+        counts.failed++;
+      }
+    }
+  };
+
+  // A bystander polling a cheap endpoint throughout the storm
+  const prober = async () => {
+    while (Date.now() < deadline) {
+      const start = process.hrtime.bigint();
+      const response = await fetch(`${base}/health`);
+      await response.arrayBuffer();
+      latencies.health.push(Number(process.hrtime.bigint() - start) / 1e6);
+      await new Promise((resolve) => setTimeout(resolve, 50));
+    }
+  };
+
+  loopDelay.enable();
+  await Promise.all([prober(), ...Array.from({ length: CONCURRENCY }, client)]);
+  loopDelay.disable();
+
+  if (server) {
+    server.close();
+  }
+
+  console.log(`${CONCURRENCY} concurrent logins for ${SECONDS}s against ${process.env.BENCH_URL || 'in-process app'}`);
+  report('POST /auth/login', latencies.login);
+  report('GET /health (during storm)', latencies.health);
+  console.log(
+    `throughput: ${(counts.ok / SECONDS).toFixed(1)} logins/s  shed(503)=${counts.shed}  failed=${counts.failed}`
+  );
+  if (server) {
+    console.log(
+      `event loop delay: p50=${(loopDelay.percentile(50) / 1e6).toFixed(2)}ms ` +
+        `p99=${(loopDelay.percentile(99) / 1e6).toFixed(2)}ms max=${(loopDelay.max / 1e6).toFixed(2)}ms`
+    );
+    console.log(`password hasher: ${JSON.stringify(passwordHasher.getStats())}`);
+  }
+
+  await prisma.user.deleteMany({ where: { email: { startsWith: prefix } } });
+}
+
+main()
+  .catch((e) => {
+    console.error(e);
+    process.exit(1);
+  })
+  .finally(async () => {
+    await prisma.$disconnect();
+  });
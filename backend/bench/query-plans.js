@@ -0,0 +1,158 @@
+// Query-plan regression check. Runs EXPLAIN ANALYZE for the SQL behind each
+// hot controller query and exits non-zero if any of them sequentially scans
+// a large table or exceeds its latency budget. Seed volume first, e.g.:
+//   SEED_LARGE_COURSE=1 SEED_STUDENTS=2000 npm run db:seed
+// then run: npm run bench:plans
+require('dotenv').config();
+const prisma = require('../src/config/database');
+
+const BUDGET_MS = parseFloat(process.env.PLAN_BUDGET_MS) || 50;
+// Seq scans on tables smaller than this are cheaper than an index lookup
+const MIN_SEQ_SCAN_ROWS = parseInt(process.env.PLAN_MIN_SEQ_SCAN_ROWS) || 10000;
+
+// Each entry mirrors a Prisma query in src/controllers or src/services
+const queries = ({ courseId, userId, assignmentId, assignmentIds }) => [
+  {
+    name: 'notifications.list',
+    sql: 'SELECT * FROM notifications WHERE user_id = $1 ORDER BY created_at DESC LIMIT 50',
+    params: [userId],
+  },
+  {
+    name: 'notifications.unreadList',
+    sql: 'SELECT * FROM notifications WHERE user_id = $1 AND is_read = false ORDER BY created_at DESC LIMIT 50',
+    params: [userId],
+  },
+  {
+    name: 'notifications.unreadCount',
+    sql: 'SELECT count(*) FROM notifications WHERE user_id = $1 AND is_read = false',
+    params: [userId],
+  },
+  {
+    name: 'courses.enrolledForStudent',
+    sql: `SELECT c.* FROM courses c
+          WHERE EXISTS (SELECT 1 FROM course_enrollments e
+                        WHERE e.course_id = c.id AND e.user_id = $1 AND e.enrollment_status = 'enrolled')
+          ORDER BY c.created_at DESC`,
+    params: [userId],
+  },
+  {
+    name: 'courses.modules',
+    sql: `SELECT * FROM modules WHERE course_id = $1 AND deleted_at IS NULL AND is_published = true
+          ORDER BY order_index ASC`,
+    params: [courseId],
+  },
+  {
+    name: 'enrollments.lookup',
+    sql: 'SELECT * FROM course_enrollments WHERE course_id = $1 AND user_id = $2',
+    params: [courseId, userId],
+  },
+  {
+    name: 'enrollments.fanoutChunk',
+    sql: `SELECT e.id, e.user_id FROM course_enrollments e JOIN users u ON u.id = e.user_id
+          WHERE e.course_id = $1 AND e.enrollment_status = 'enrolled' AND u.role = 'student'
+          ORDER BY e.id ASC LIMIT 1000`,
+    params: [courseId],
+  },
+  {
+    name: 'assignments.forCourse',
+    sql: 'SELECT * FROM assignments WHERE course_id = $1 AND deleted_at IS NULL ORDER BY due_date ASC',
+    params: [courseId],
+  },
+  {
+    name: 'submissions.latestForUser',
+    sql: `SELECT * FROM assignment_submissions WHERE user_id = $1 AND assignment_id = ANY($2::text[])
+          ORDER BY submission_number DESC`,
+    params: [userId, assignmentIds],
+  },
+  {
+    name: 'submissions.forAssignment',
+    sql: 'SELECT * FROM assignment_submissions WHERE assignment_id = $1 ORDER BY submission_date DESC',
+    params: [assignmentId],
+  },
+  {
+    name: 'submissions.myGrades',
+    sql: 'SELECT * FROM assignment_submissions WHERE user_id = $1 ORDER BY submission_date DESC',
+    params: [userId],
+  },
+  {
+    name: 'gradebook.chunk',
+    sql: `SELECT s.* FROM assignment_submissions s JOIN assignments a ON a.id = s.assignment_id
+          WHERE a.course_id = $1 AND a.deleted_at IS NULL ORDER BY s.id ASC LIMIT 500`,
+    params: [courseId],
+  },
+  {
+    name: 'announcements.forCourse',
+    sql: `SELECT * FROM announcements
+          WHERE course_id = $1 AND deleted_at IS NULL AND is_published = true
+            AND (expires_at IS NULL OR expires_at > now())
+          ORDER BY is_pinned DESC, published_at DESC`,
+    params: [courseId],
+  },
+];
+
+// Collect every node in an EXPLAIN (FORMAT JSON) plan tree
+const planNodes = (plan) => [plan, ...(plan.Plans || []).flatMap(planNodes)];
+
+async function main() {
+  const course =
+    (await prisma.course.findFirst({ where: { code: { startsWith: 'BENCH' } }, orderBy: { createdAt: 'desc' } })) ||
+    (await prisma.course.findFirst({ orderBy: { currentEnrollment: 'desc' } }));
+  const student = await prisma.user.findUnique({ where: { email: 'student@conceptspro.com' } });
+
+  if (!course || !student) {
+    throw new Error('Seed the database first (npm run db:seed).');
+  }
+
+  const assignments = await prisma.assignment.findMany({ where: { courseId: course.id }, select: { id: true } });
+  const assignmentIds = assignments.map((a) => a.id);
+
+  await prisma.$executeRawUnsafe('ANALYZE');
+  const tableRows = new Map(
+    (
+      await prisma.$queryRawUnsafe("SELECT relname, reltuples::bigint AS rows FROM pg_class WHERE relkind = 'r'")
+    ).map((row) => [row.relname, Number(row.rows)])
+  );
+
+  const failures = [];
+
+  for (const query of queries({
+    courseId: course.id,
+    userId: student.id,
+    assignmentId: assignmentIds[0] || '',
+    assignmentIds,
+  })) {
+    const [row] = await prisma.$queryRawUnsafe(`EXPLAIN (ANALYZE, FORMAT JSON) ${query.sql}`, ...query.params);
+    const [explain] = row['QUERY PLAN'];
+    const time = explain['Execution Time'];
+
+    const seqScans = planNodes(explain.Plan)
+      .filter((node) => node['Node Type'] === 'Seq Scan')
+      .map((node) => node['Relation Name'])
+      .filter((table) => (tableRows.get(table) || 0) >= MIN_SEQ_SCAN_ROWS);
+
+    const problems = [
+      ...seqScans.map((table) => `seq scan on ${table} (${tableRows.get(table)} rows)`),
+      ...(time > BUDGET_MS ? [`${time.toFixed(2)}ms over ${BUDGET_MS}ms budget`] : []),
+    ];
+
+    console.log(`${problems.length ? 'FAIL' : 'ok  '} ${query.name.padEnd(30)} ${time.toFixed(2)}ms`);
+    problems.forEach((problem) => console.log(`       ${problem}`));
+    if (problems.length) {
+      failures.push(query.name);
+    }
+  }
+
+  if (failures.length) {
+    console.error(`\n${failures.length} query plan regression(s): ${failures.join(', ')}`);
+    process.exitCode = 1;
+  }
+}
+
+main()
+  .catch((e) => {
+    console.error(e);
+    process.exit(1);
+  })
+  .finally(async () => {
+    await prisma.$disconnect();
+  });
@@ -0,0 +1,131 @@
+// Report reads versus grading writes with a read replica configured.
+// Instructor clients hammer the gradebook and course grades (routed to the
+// replica) while an admin bulk-grades (primary). Each admin write is
+// immediately read back, which must see the write: with two independent
+// local Postgres instances (no replication) that only passes if the
+// writer's reads stick to the primary.
+//   DATABASE_URL=postgresql://localhost:5432/conceptspro \
+//   DATABASE_REPLICA_URL=postgresql://localhost:5433/conceptspro \
+//   npm run bench:replica [-- <courseId>]
+// Seed the primary (SEED_LARGE_COURSE=1 npm run db:seed), then copy it to
+// the second instance: pg_dump -h localhost -p 5432 conceptspro | psql -h localhost -p 5433 conceptspro
+require('dotenv').config();
+const jwt = require('jsonwebtoken');
+const app = require('../src/server');
+const prisma = require('../src/config/database');
+const readRouting = require('../src/services/readRouting');
+const { getPoolStats, disconnectAll } = require('../src/config/pool');
+const { report } = require('./lib');
+
+const SECONDS = parseInt(process.env.BENCH_SECONDS) || 15;
+const READERS = parseInt(process.env.BENCH_READERS) || 20;
+const GRADES_PER_WRITE = parseInt(process.env.BENCH_GRADES) || 50;
+
+const sign = (user) =>
+  jwt.sign({ userId: user.id, email: user.email, role: user.role }, process.env.JWT_SECRET, { expiresIn: '1h' });
+
+async function main() {
+  if (!readRouting.getStats().replicaConfigured) {
+    console.warn('DATABASE_REPLICA_URL is not set; every read goes to the primary.');
+  }
+
+  const course = process.argv[2]
+    ? await prisma.course.findUnique({ where: { id: process.argv[2] } })
+    : await prisma.course.findFirst({ where: { code: { startsWith: 'BENCH ' } }, orderBy: { createdAt: 'desc' } });
+  const admin = await prisma.user.findUnique({ where: { email: 'admin@conceptspro.com' } });
+
+  if (!course || !admin) {
+    throw new Error('No benchmark course found. Run SEED_LARGE_COURSE=1 npm run db:seed first.');
+  }
+
+  const instructor = await prisma.user.findUnique({ where: { id: course.instructorId } });
+  const submissions = await prisma.assignmentSubmission.findMany({
+    where: { assignment: { courseId: course.id } },
+    select: { id: true },
+    orderBy: { id: 'asc' },
+    take: GRADES_PER_WRITE,
+  });
+
+  const server = app.listen(0);
+  const base = `http://127.0.0.1:${server.address().port}/api`;
+  const deadline = Date.now() + SECONDS * 1000;
+  const latencies = { gradebook: [], grades: [], write: [] };
+  let staleReads = 0;
+  let checks = 0;
+
+  const call = async (label, token, path, body) => {
+    const start = process.hrtime.bigint();
+    const response = await fetch(`${base}${path}`, {
+      method: body ? 'POST' : 'GET',
+      headers: { Authorization: `Bearer ${token}`, 'Content-Type': 'application/json' },
+      ...(body && { body: JSON.stringify(body) }),
+    });
+    const data = await response.json();
+    latencies[label].push(Number(process.hrtime.bigint() - start) / 1e6);
+    if (!response.ok) {
+      throw new Error(`${path} failed: ${response.status} ${JSON.stringify(data)}`);
+    }
+    return data;
+  };
+
+  const reader = async (i) => {
+    const token = sign(instructor);
+    while (Date.now() < deadline) {
+      if (i % 2 === 0) {
+        await call('gradebook', token, `/courses/${course.id}/gradebook?limit=1000`);
+      } else {
+        await call('grades', token, `/courses/${course.id}/grades`);
+      }
+    }
+  };
+
+  const writer = async () => {
+    const token = sign(admin);
+    for (let round = 0; Date.now() < deadline; round++) {
+      const feedback = `read-your-writes ${round}`;
+      await call('write', token, `/courses/${course.id}/grades/bulk`, {
+        grades: submissions.map(({ id }) => ({ submissionId: id, pointsEarned: round % 100, feedback })),
+      });
+
+      // Read straight back through a routed endpoint
+      const { rows } = await call('gradebook', token, `/courses/${course.id}/gradebook?limit=1000`);
+      const row = rows.find((r) => r.submissionId === submissions[0].id);
+      checks++;
+      if (!row || Number(row.pointsEarned) !== round % 100) {
+        staleReads++;
+      }
+    }
+  };
+
+  await Promise.all([writer(), ...Array.from({ length: READERS }, (_, i) => reader(i))]);
+  server.close();
+
+  console.log(`${READERS} report readers + 1 bulk grader for ${SECONDS}s`);
+  report('GET /courses/:id/gradebook', latencies.gradebook);
+  report('GET /courses/:id/grades', latencies.grades);
+  report('POST /courses/:id/grades/bulk', latencies.write);
+  console.log(`reads routed: ${JSON.stringify(readRouting.getStats().reads)}`);
+
+  for (const [pool, stats] of Object.entries(await getPoolStats())) {
+    const wait = stats.waitMs
+      ? `wait mean=${stats.waitMs.mean.toFixed(2)}ms p50<=${stats.waitMs.p50}ms p99<=${stats.waitMs.p99}ms`
+      : 'wait n/a';
+    console.log(`pool ${pool.padEnd(8)} open=${stats.open} busy=${stats.busy} idle=${stats.idle} ${wait}`);
+  }
+
+  if (staleReads > 0) {
+    console.error(`FAIL read-your-writes: ${staleReads}/${checks} reads missed the writer's own grades`);
+    process.exitCode = 1;
+  } else {
+    console.log(`OK read-your-writes: ${checks}/${checks} reads saw the writer's grades`);
+  }
+}
+
+main()
+  .catch((e) => {
+    console.error(e);
+    process.exit(1);
+  })
+  .finally(async () => {
+    await disconnectAll();
+  });
@@ -0,0 +1,198 @@
+// Full-text search latency at institution scale. Seeds BENCH_SEARCH_ROWS
+// announcements (default 1M) across BENCH_SEARCH_COURSES courses, indexes
+// them once, then times GET /api/search for a student enrolled in a few of
+// those courses and for an admin searching everything. Terms follow a skewed
+// distribution, so queries cover very common, mid-frequency and rare words.
+// The corpus is kept for later runs; BENCH_CLEANUP=1 removes it.
+// Run: npm run bench:search
+require('dotenv').config();
+const jwt = require('jsonwebtoken');
+const app = require('../src/server');
+const prisma = require('../src/config/database');
+const searchIndex = require('../src/services/searchIndex');
+const { measure, report } = require('./lib');
+
+const ROWS = parseInt(process.env.BENCH_SEARCH_ROWS) || 1000000;
+const COURSES = parseInt(process.env.BENCH_SEARCH_COURSES) || 50;
+const ENROLLED = parseInt(process.env.BENCH_SEARCH_ENROLLED) || 6;
+const ITERATIONS = parseInt(process.env.BENCH_ITERATIONS) || 50;
+const INSERT_CHUNK = 5000;
+const CODE_PREFIX = 'BENCH-SEARCH';
+
+const TOPICS = [
+  'signal', 'network', 'protocol', 'packet', 'modulation', 'frequency', 'bandwidth', 'latency',
+  'encoding', 'channel', 'router', 'switch', 'ethernet', 'wireless', 'spectrum', 'antenna',
+  'amplitude', 'phase', 'carrier', 'multiplexing', 'error', 'checksum', 'parity', 'fiber',
+  'topology', 'routing', 'congestion', 'throughput', 'handshake', 'encryption', 'firewall', 'subnet',
+  'homework', 'exam', 'lecture', 'reading', 'project', 'deadline', 'quiz', 'lab',
+];
+const QUERIES = [
+  { label: 'common word', q: 'signal' },
+  { label: 'two words', q: 'packet routing' },
+  { label: 'phrase', q: '"carrier frequency"' },
+  { label: 'rare word', q: 'term7331' },
+  { label: 'excluded word', q: 'network -wireless' },
+];
+
+// Deterministic PRNG so every run indexes the same corpus
+let seed = 42;
+const random = () => {
+  seed = (seed * 1664525 + 1013904223) % 4294967296;
+  return seed / 4294967296;
+};
+
+// Low indexes are picked far more often than high ones
+const word = () =>
+  random() < 0.97
+    ? TOPICS[Math.floor(TOPICS.length * random() * random())]
+    : `term${Math.floor(10000 * random())}`;
+const sentence = (words) => Array.from({ length: words }, word).join(' ');
+
+const sign = (user) =>
+  jwt.sign({ userId: user.id, email: user.email, role: user.role }, process.env.JWT_SECRET, { expiresIn: '1h' });
+
+async function seedCorpus(instructor) {
+  const existing = await prisma.course.findMany({
+    where: { code: { startsWith: CODE_PREFIX } },
+    select: { id: true },
+    orderBy: { code: 'asc' },
+  });
+  if (existing.length > 0) {
+    return existing.map(({ id }) => id);
+  }
+
+  console.log(`Seeding ${ROWS} announcements across ${COURSES} courses...`);
+  await prisma.course.createMany({
+    data: Array.from({ length: COURSES }, (_, i) => ({
+      code: `${CODE_PREFIX} ${String(i).padStart(3, '0')}`,
+      title: `${TOPICS[i % TOPICS.length]} systems ${i}`,
+      description: sentence(30),
+      instructorId: instructor.id,
+      term: 'Fall 2024',
+      academicYear: 2024,
+      endDate: new Date('2024-12-15'),
+      status: 'published',
+    })),
+  });
+  const courseIds = (
+    await prisma.course.findMany({
+      where: { code: { startsWith: CODE_PREFIX } },
+      select: { id: true },
+      orderBy: { code: 'asc' },
+    })
+  ).map(({ id }) => id);
+
+  for (let done = 0; done < ROWS; done += INSERT_CHUNK) {
+    const now = new Date();
+    await prisma.announcement.createMany({
+      data: Array.from({ length: Math.min(INSERT_CHUNK, ROWS - done) }, (_, i) => ({
+        courseId: courseIds[(done + i) % courseIds.length],
+        authorId: instructor.id,
+        title: sentence(6),
+        content: sentence(60),
+        isPublished: random() < 0.9,
+        publishedAt: now,
+      })),
+    });
+    if ((done / INSERT_CHUNK) % 20 === 0) {
+      console.log(`  ${done + INSERT_CHUNK} announcements`);
+    }
+  }
+
+  const start = Date.now();
+  const { rows } = await searchIndex.rebuildAll({
+    types: ['course', 'announcement'],
+    onBatch: (entityType, indexed) => {
+      if (indexed % 50000 === 0) console.log(`  ${indexed} documents indexed`);
+    },
+  });
+  console.log(`Indexed ${rows} documents in ${((Date.now() - start) / 1000).toFixed(1)}s`);
+  await prisma.$executeRaw`ANALYZE search_documents`;
+
+  return courseIds;
+}
+
+async function main() {
+  const instructor = await prisma.user.findUnique({ where: { email: 'instructor@conceptspro.com' } });
+  const admin = await prisma.user.findUnique({ where: { email: 'admin@conceptspro.com' } });
+  if (!instructor || !admin) {
+    throw new Error('Seed the database first (npm run db:seed).');
+  }
+
+  const courseIds = await seedCorpus(instructor);
+
+  const student = await prisma.user.upsert({
+    where: { email: 'search-bench-student@conceptspro.com' },
+    update: {},
+    create: {
+      email: 'search-bench-student@conceptspro.com',
+      passwordHash: 'bench',
+      firstName: 'Search',
+      lastName: 'Bench',
+      role: 'student',
+    },
+  });
+  await prisma.courseEnrollment.createMany({
+    data: courseIds.slice(0, ENROLLED).map((courseId) => ({ courseId, userId: student.id })),
+    skipDuplicates: true,
+  });
+
+  const documents = await prisma.searchDocument.count();
+  const server = app.listen(0);
+  const base = `http://127.0.0.1:${server.address().port}/api/search`;
+
+  const run = async (token, params) => {
+    const response = await fetch(`${base}?${new URLSearchParams(params)}`, {
+      headers: { Authorization: `Bearer ${token}` },
+    });
+    if (!response.ok) {
+      throw new Error(`Search failed: ${response.status} ${await response.text()}`);
+    }
+    return response.json();
+  };
+
+  console.log(`${documents} indexed documents; student enrolled in ${ENROLLED}/${courseIds.length} bench courses`);
+  for (const [who, user] of [['student', student], ['admin', admin]]) {
+    const token = sign(user);
+    for (const { label, q } of QUERIES) {
+      const { results, hasMore } = await run(token, { q });
+      const samples = await measure(() => run(token, { q }), { iterations: ITERATIONS });
+      report(`${who}: ${label}`, samples);
+      console.log(`${''.padEnd(36)} ${results.length} results${hasMore ? ', more pages' : ''}`);
+    }
+
+    const deep = await measure(() => run(token, { q: 'signal', offset: 200, limit: 20 }), { iterations: ITERATIONS });
+    report(`${who}: common word, page 11`, deep);
+  }
+
+  server.close();
+
+  // The student query should start from the GIN index, not a scan
+  const [plan] = await prisma.$queryRaw`
+    EXPLAIN (FORMAT JSON)
+    SELECT sd.entity_id FROM search_documents sd
+    WHERE sd.search_vector @@ websearch_to_tsquery('english', 'packet routing')
+      AND sd.course_id IN (${courseIds[0]}, ${courseIds[1]})`;
+  const planText = JSON.stringify(plan['QUERY PLAN']);
+  if (planText.includes('"Seq Scan"')) {
+    console.error('FAIL search plan: sequential scan of search_documents');
+    process.exitCode = 1;
+  } else {
+    console.log('OK search plan: search_documents read through its indexes');
+  }
+
+  if (process.env.BENCH_CLEANUP) {
+    await prisma.courseEnrollment.deleteMany({ where: { userId: student.id } });
+    await prisma.user.delete({ where: { id: student.id } });
+    await prisma.course.deleteMany({ where: { code: { startsWith: CODE_PREFIX } } });
+  }
+}
+
+main()
+  .catch((e) => {
+    console.error(e);
+    process.exit(1);
+  })
+  .finally(async () => {
+    await prisma.$disconnect();
+  });
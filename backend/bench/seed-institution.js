@@ -0,0 +1,30 @@
+// Seed (or check) the institution-scale dataset used by bench/suite.js.
+// Seeding the default scale takes a while, so it can be done once ahead of
+// benchmark runs. BENCH_RESET=1 seeds again from scratch; BENCH_CLEANUP=1
+// removes the dataset instead. See bench/institution.js for the scale.
+// Run: npm run bench:seed
+require('dotenv').config();
+const prisma = require('../src/config/database');
+const institution = require('./institution');
+
+async function main() {
+  if (process.env.BENCH_CLEANUP) {
+    await institution.cleanup();
+    console.log('Institution dataset removed');
+    return;
+  }
+
+  const seeded = await institution.ensureSeeded({ reset: Boolean(process.env.BENCH_RESET) });
+  if (!seeded) {
+    console.log(`Institution dataset already in place: ${JSON.stringify(institution.SCALE)}`);
+  }
+}
+
+main()
+  .catch((e) => {
+    console.error(e);
+    process.exit(1);
+  })
+  .finally(async () => {
+    await prisma.$disconnect();
+  });
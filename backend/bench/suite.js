@@ -0,0 +1,402 @@
+// Load suite for the whole API against the institution-scale dataset
+// (bench/institution.js, seeded on first run). Each scenario runs closed-loop
+// virtual users for BENCH_SECONDS after a BENCH_WARMUP period:
+//   login-storm        students signing in at once
+//   registration-open  students enrolling in limited-seat courses
+//   deadline-spike     students submitting the open assignment before it closes
+//   gradebook          instructors reviewing gradebooks, grades and submissions
+//   mixed-browsing     students on dashboards, courses, notifications, calendar
+// Reports throughput and, per route, p50/p95/p99 latency, status codes and
+// database queries per request (read from the http_request_db_queries
+// histogram on /metrics; against a cluster that is one worker's sample).
+// BENCH_SCENARIOS=a,b runs a subset; BENCH_CONCURRENCY overrides the users
+// per scenario. BENCH_SAVE=name writes bench/baselines/<name>.json with the
+// commit it was taken at; BENCH_COMPARE=name checks this run against it and
+// exits non-zero when p95, throughput or queries per request regress by more
+// than BENCH_TOLERANCE (default 0.2).
+// Run in-process:   npm run bench:suite
+// Against a cluster: npm run start:cluster, then
+//                    BENCH_URL=http://localhost:5000 npm run bench:suite
+require('dotenv').config();
+const fs = require('fs');
+const path = require('path');
+const { execSync } = require('child_process');
+const jwt = require('jsonwebtoken');
+const prisma = require('../src/config/database');
+const institution = require('./institution');
+const { summarize } = require('./lib');
+
+const SECONDS = parseInt(process.env.BENCH_SECONDS) || 30;
+const WARMUP_SECONDS = parseInt(process.env.BENCH_WARMUP) || 5;
+const CONCURRENCY = parseInt(process.env.BENCH_CONCURRENCY) || 0;
+const TOLERANCE = parseFloat(process.env.BENCH_TOLERANCE) || 0.2;
+const SEED = parseInt(process.env.BENCH_SEED) || 42;
+const BASELINE_DIR = path.join(__dirname, 'baselines');
+const DAY = 24 * 60 * 60 * 1000;
+
+const { SCALE } = institution;
+
+// Deterministic PRNG, reset per scenario, so every run draws the same mix
+let seed = SEED;
+const random = () => {
+  seed = (seed * 1664525 + 1013904223) % 4294967296;
+  return seed / 4294967296;
+};
+const pick = (n) => Math.floor(random() * n);
+const shuffle = (items) => {
+  for (let i = items.length - 1; i > 0; i--) {
+    const j = pick(i + 1);
+    [items[i], items[j]] = [items[j], items[i]];
+  }
+  return items;
+};
+
+const tokens = new Map();
+const sign = (user) => {
+  let token = tokens.get(user.id);
+  if (!token) {
+    token = jwt.sign({ userId: user.id, email: user.email, role: user.role }, process.env.JWT_SECRET, {
+      expiresIn: '1h',
+    });
+    tokens.set(user.id, token);
+  }
+  return token;
+};
+
+const round = (value) => Math.round(value * 100) / 100;
+
+const randomStudent = () => pick(SCALE.students);
+const enrolledCourse = (s) => {
+  const courses = institution.coursesOf(s);
+  return courses[pick(courses.length)];
+};
+
+const calendarWindow = () => {
+  const now = Date.now();
+  return new URLSearchParams({
+    from: new Date(now - 7 * DAY).toISOString(),
+    to: new Date(now + 28 * DAY).toISOString(),
+  });
+};
+
+// [weight, route, path for student s]
+const BROWSING = [
+  [30, 'GET /api/progress/dashboard', () => '/api/progress/dashboard'],
+  [15, 'GET /api/notifications/unread/count', () => '/api/notifications/unread/count'],
+  [10, 'GET /api/notifications', () => '/api/notifications?limit=20'],
+  [10, 'GET /api/courses', () => '/api/courses'],
+  [10, 'GET /api/courses/:id', (s) => `/api/courses/${institution.courseId(enrolledCourse(s))}`],
+  [10, 'GET /api/courses/:id/assignments', (s) => `/api/courses/${institution.courseId(enrolledCourse(s))}/assignments`],
+  [5, 'GET /api/grades/me', () => '/api/grades/me'],
+  [5, 'GET /api/calendar', () => `/api/calendar?${calendarWindow()}`],
+  [5, 'GET /api/search', () => '/api/search?q=assignment'],
+];
+const BROWSING_WEIGHT = BROWSING.reduce((sum, [weight]) => sum + weight, 0);
+
+// step(call, state) is one iteration of a virtual user; call(user, route,
+// path, body) makes one request and records it under `route`, which is
+// written the way /metrics labels it
+const SCENARIOS = [
+  {
+    name: 'login-storm',
+    users: 200,
+    step: (call) => {
+      const { email } = institution.student(randomStudent());
+      return call(null, 'POST /api/auth/login', '/api/auth/login', { email, password: institution.PASSWORD });
+    },
+  },
+  {
+    name: 'registration-open',
+    users: 100,
+    setup: async () => {
+      const courseIds = institution.registrationCourseIds();
+      await prisma.courseEnrollment.deleteMany({ where: { courseId: { in: courseIds } } });
+      await prisma.course.updateMany({ where: { id: { in: courseIds } }, data: { currentEnrollment: 0 } });
+      return courseIds;
+    },
+    step: async (call, courseIds) => {
+      const user = institution.student(randomStudent());
+      const courseId = courseIds[pick(courseIds.length)];
+      await call(user, 'GET /api/courses/:id', `/api/courses/${courseId}`);
+      await call(user, 'POST /api/courses/:id/enroll', `/api/courses/${courseId}/enroll`);
+    },
+  },
+  {
+    name: 'deadline-spike',
+    users: 100,
+    // Every enrolled student still has the open assignment to hand in
+    setup: async () => {
+      await prisma.assignmentSubmission.deleteMany({ where: { assignmentId: { in: institution.openAssignmentIds() } } });
+      const pending = [];
+      for (let s = 0; s < SCALE.students; s++) {
+        for (const c of institution.coursesOf(s)) pending.push([s, c]);
+      }
+      return shuffle(pending);
+    },
+    step: async (call, pending) => {
+      const next = pending.pop();
+      if (!next) {
+        // Everyone has submitted; students keep checking the assignment
+        const s = randomStudent();
+        const assignmentId = institution.openAssignmentId(enrolledCourse(s));
+        return call(institution.student(s), 'GET /api/assignments/:id', `/api/assignments/${assignmentId}`);
+      }
+
+      const [s, c] = next;
+      const user = institution.student(s);
+      await call(user, 'GET /api/courses/:id/assignments', `/api/courses/${institution.courseId(c)}/assignments`);
+      return call(user, 'POST /api/assignments/:id/submit', `/api/assignments/${institution.openAssignmentId(c)}/submit`, {
+        submissionText: `Final answer from student ${s}`,
+      });
+    },
+  },
+  {
+    name: 'gradebook',
+    users: 50,
+    step: async (call) => {
+      const c = pick(institution.regularCourses);
+      const user = institution.instructorOf(c);
+      const courseId = institution.courseId(c);
+      await call(user, 'GET /api/courses/:id/gradebook', `/api/courses/${courseId}/gradebook`);
+      if (random() < 0.5) {
+        return call(user, 'GET /api/courses/:id/grades', `/api/courses/${courseId}/grades`);
+      }
+      const assignmentId = institution.assignmentId(c, pick(SCALE.assignmentsPerCourse - 1));
+      return call(user, 'GET /api/assignments/:id/submissions', `/api/assignments/${assignmentId}/submissions`);
+    },
+  },
+  {
+    name: 'mixed-browsing',
+    users: 200,
+    step: (call) => {
+      const s = randomStudent();
+      let roll = random() * BROWSING_WEIGHT;
+      const [, route, pathFor] = BROWSING.find(([weight]) => (roll -= weight) < 0) || BROWSING[0];
+      return call(institution.student(s), route, pathFor(s));
+    },
+  },
+];
+
+// Per-route totals of the http_request_db_queries histogram, keyed like the
+// suite's routes ("GET /api/courses/:id"; router roots lose their slash)
+const queryTotals = async (base) => {
+  const response = await fetch(`${base}/metrics`);
+  const totals = new Map();
+  for (const line of (await response.text()).split('\n')) {
+    const match = line.match(/^http_request_db_queries_(sum|count)\{(.*)\} (\S+)$/);
+    if (!match) continue;
+    const labels = Object.fromEntries([...match[2].matchAll(/(\w+)="((?:[^"\\]|\\.)*)"/g)].map(([, k, v]) => [k, v]));
+    const key = `${labels.method} ${labels.route.replace(/(.)\/$/, '$1')}`;
+    const entry = totals.get(key) || { sum: 0, count: 0 };
+    entry[match[1]] = Number(match[3]);
+    totals.set(key, entry);
+  }
+  return totals;
+};
+
+const queriesPerRequest = (before, after, route) => {
+  const end = after.get(route);
+  if (!end) return null;
+  const start = before.get(route) || { sum: 0, count: 0 };
+  const count = end.count - start.count;
+  return count > 0 ? round((end.sum - start.sum) / count) : null;
+};
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+async function runScenario(scenario, base) {
+  seed = SEED;
+  const state = scenario.setup ? await scenario.setup() : undefined;
+  const users = CONCURRENCY || scenario.users;
+  const run = { recording: false, done: false, routes: new Map() };
+
+  const call = async (user, route, url, body) => {
+    const headers = {};
+    if (user) headers.Authorization = `Bearer ${sign(user)}`;
+    if (body) headers['Content-Type'] = 'application/json';
+
+    const start = process.hrtime.bigint();
+    let status;
+    try {
+      const response = await fetch(`${base}${url}`, {
+        method: route.split(' ')[0],
+        headers,
+        body: body && JSON.stringify(body),
+      });
+      await response.arrayBuffer();
+      status = response.status;
+    } catch (e) {
+      status = 'error';
+    }
+
+    if (run.recording) {
+      const entry = run.routes.get(route) || { latencies: [], statuses: {} };
+      entry.latencies.push(Number(process.hrtime.bigint() - start) / 1e6);
+      entry.statuses[status] = (entry.statuses[status] || 0) + 1;
+      run.routes.set(route, entry);
+    }
+    return status;
+  };
+
+  const virtualUser = async () => {
+    while (!run.done) {
+      await scenario.step(call, state);
+    }
+  };
+
+  const running = Array.from({ length: users }, virtualUser);
+  await sleep(WARMUP_SECONDS * 1000);
+  const before = await queryTotals(base);
+  run.recording = true;
+  const start = Date.now();
+  await sleep(SECONDS * 1000);
+  run.recording = false;
+  const seconds = (Date.now() - start) / 1000;
+  const after = await queryTotals(base);
+  run.done = true;
+  await Promise.all(running);
+
+  const routes = {};
+  let requests = 0;
+  for (const [route, { latencies, statuses }] of [...run.routes].sort(([a], [b]) => a.localeCompare(b))) {
+    const s = summarize(latencies);
+    requests += s.count;
+    routes[route] = {
+      count: s.count,
+      p50: round(s.p50),
+      p95: round(s.p95),
+      p99: round(s.p99),
+      max: round(s.max),
+      statuses,
+      queries: queriesPerRequest(before, after, route),
+    };
+  }
+
+  return { users, seconds: round(seconds), throughput: round(requests / seconds), routes };
+}
+
+const print = (name, result) => {
+  console.log(`\n${name}: ${result.users} users, ${result.seconds}s, ${result.throughput} req/s`);
+  for (const [route, r] of Object.entries(result.routes)) {
+    const statuses = Object.entries(r.statuses)
+      .map(([status, count]) => `${status}=${count}`)
+      .join(' ');
+    console.log(
+      `${route.padEnd(36)} n=${r.count}  p50=${r.p50.toFixed(2)}ms  p95=${r.p95.toFixed(2)}ms  ` +
+        `p99=${r.p99.toFixed(2)}ms  max=${r.max.toFixed(2)}ms  queries=${r.queries ?? '-'}  ${statuses}`
+    );
+  }
+};
+
+const git = (command) => {
+  try {
+    return execSync(`git ${command}`, { cwd: __dirname, stdio: ['ignore', 'pipe', 'ignore'] }).toString().trim();
+  } catch (e) {
+    return null;
+  }
+};
+
+const baselinePath = (name) => {
+  if (!/^[\w.-]+$/.test(name)) {
+    throw new Error(`Invalid baseline name: ${name}`);
+  }
+  return path.join(BASELINE_DIR, `${name}.json`);
+};
+
+// p95 must grow by the tolerance and by more than 1ms to count, so fast
+// routes do not flag on noise
+const compare = (baseline, scenarios) => {
+  const regressions = [];
+  for (const [name, result] of Object.entries(scenarios)) {
+    const old = baseline.scenarios[name];
+    if (!old) continue;
+
+    if (result.throughput < old.throughput * (1 - TOLERANCE)) {
+      regressions.push(`${name}: throughput ${old.throughput} -> ${result.throughput} req/s`);
+    }
+    for (const [route, r] of Object.entries(result.routes)) {
+      const before = old.routes[route];
+      if (!before) continue;
+      if (r.p95 > before.p95 * (1 + TOLERANCE) && r.p95 - before.p95 > 1) {
+        regressions.push(`${name} ${route}: p95 ${before.p95} -> ${r.p95}ms`);
+      }
+      if (r.queries !== null && before.queries !== null && r.queries - before.queries >= 0.5) {
+        regressions.push(`${name} ${route}: queries per request ${before.queries} -> ${r.queries}`);
+      }
+    }
+  }
+  return regressions;
+};
+
+async function main() {
+  const names = process.env.BENCH_SCENARIOS ? process.env.BENCH_SCENARIOS.split(',').map((name) => name.trim()) : null;
+  const selected = names ? SCENARIOS.filter(({ name }) => names.includes(name)) : SCENARIOS;
+  if (names && selected.length !== names.length) {
+    throw new Error(`Unknown scenario in BENCH_SCENARIOS; available: ${SCENARIOS.map(({ name }) => name).join(', ')}`);
+  }
+  // Read the baseline up front so a typo fails before the run
+  const baseline = process.env.BENCH_COMPARE
+    ? JSON.parse(fs.readFileSync(baselinePath(process.env.BENCH_COMPARE), 'utf8'))
+    : null;
+
+  await institution.ensureSeeded();
+
+  let server = null;
+  let base = process.env.BENCH_URL;
+  if (!base) {
+    server = require('../src/server').listen(0);
+    base = `http://127.0.0.1:${server.address().port}`;
+  }
+
+  console.log(`Scale: ${JSON.stringify(SCALE)}`);
+  console.log(`${WARMUP_SECONDS}s warmup + ${SECONDS}s per scenario against ${process.env.BENCH_URL || 'in-process app'}`);
+  const scenarios = {};
+  for (const scenario of selected) {
+    scenarios[scenario.name] = await runScenario(scenario, base);
+    print(scenario.name, scenarios[scenario.name]);
+  }
+
+  if (server) {
+    server.close();
+  }
+
+  if (process.env.BENCH_SAVE) {
+    const file = baselinePath(process.env.BENCH_SAVE);
+    fs.mkdirSync(BASELINE_DIR, { recursive: true });
+    const saved = {
+      commit: git('rev-parse HEAD'),
+      dirty: Boolean(git('status --porcelain')),
+      createdAt: new Date().toISOString(),
+      node: process.version,
+      target: process.env.BENCH_URL || 'in-process',
+      scale: SCALE,
+      seconds: SECONDS,
+      scenarios,
+    };
+    fs.writeFileSync(file, `${JSON.stringify(saved, null, 2)}\n`);
+    console.log(`\nSaved baseline ${path.relative(process.cwd(), file)}`);
+  }
+
+  if (baseline) {
+    console.log(`\nCompared with ${process.env.BENCH_COMPARE} (commit ${(baseline.commit || 'unknown').slice(0, 12)}, ${baseline.createdAt})`);
+    if (JSON.stringify(baseline.scale) !== JSON.stringify(SCALE)) {
+      console.log('WARN baseline was taken at a different scale');
+    }
+    const regressions = compare(baseline, scenarios);
+    if (regressions.length > 0) {
+      regressions.forEach((line) => console.error(`REGRESSION ${line}`));
+      process.exitCode = 1;
+    } else {
+      console.log(`OK no regressions beyond ${TOLERANCE * 100}%`);
+    }
+  }
+}
+
+main()
+  .catch((e) => {
+    console.error(e);
+    process.exit(1);
+  })
+  .finally(async () => {
+    await prisma.$disconnect();
+  });
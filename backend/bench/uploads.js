@@ -0,0 +1,87 @@
+// Concurrent multi-file uploads through /api/files/upload/multiple, where
+// most students upload the same template alongside their own work.
+// Reports throughput and how much disk content-addressing saved.
+// Run: npm run bench:uploads
+require('dotenv').config();
+const fs = require('fs');
+const path = require('path');
+const crypto = require('crypto');
+const jwt = require('jsonwebtoken');
+const app = require('../src/server');
+const prisma = require('../src/config/database');
+const { uploadDir } = require('../src/services/fileService');
+
+const REQUESTS = parseInt(process.env.BENCH_REQUESTS) || 300;
+const CONCURRENCY = parseInt(process.env.BENCH_CONCURRENCY) || 50;
+const FILE_KB = parseInt(process.env.BENCH_FILE_KB) || 512;
+
+const dirBytes = async (dir) => {
+  const names = await fs.promises.readdir(dir);
+  const stats = await Promise.all(names.map((name) => fs.promises.stat(path.join(dir, name))));
+  return stats.reduce((sum, stat) => sum + stat.size, 0);
+};
+
+async function main() {
+  const student = await prisma.user.findUnique({ where: { email: 'student@conceptspro.com' } });
+  if (!student) {
+    throw new Error('Seed the database first (npm run db:seed).');
+  }
+
+  const token = jwt.sign({ userId: student.id, email: student.email, role: student.role }, process.env.JWT_SECRET, {
+    expiresIn: '1h',
+  });
+
+  const server = app.listen(0);
+  const url = `http://127.0.0.1:${server.address().port}/api/files/upload/multiple`;
+  const objectsDir = path.join(uploadDir, 'objects');
+
+  // Shared template plus one unique file per request
+  const template = crypto.randomBytes(FILE_KB * 1024);
+  const diskBefore = await dirBytes(objectsDir);
+  let logicalBytes = 0;
+  let next = 0;
+
+  const worker = async () => {
+    while (next < REQUESTS) {
+      next++;
+      const unique = crypto.randomBytes(FILE_KB * 1024);
+      const form = new FormData();
+      form.append('files', new Blob([template], { type: 'application/pdf' }), 'template.pdf');
+      form.append('files', new Blob([unique], { type: 'application/pdf' }), 'essay.pdf');
+
+      const response = await fetch(url, {
+        method: 'POST',
+        headers: { Authorization: `Bearer ${token}` },
+        body: form,
+      });
+      if (!response.ok) {
+        throw new Error(`Upload failed: ${response.status} ${await response.text()}`);
+      }
+      logicalBytes += template.length + unique.length;
+    }
+  };
+
+  const start = process.hrtime.bigint();
+  await Promise.all(Array.from({ length: CONCURRENCY }, worker));
+  const seconds = Number(process.hrtime.bigint() - start) / 1e9;
+  const storedBytes = (await dirBytes(objectsDir)) - diskBefore;
+  const mb = (bytes) => (bytes / 1024 / 1024).toFixed(1);
+
+  console.log(`${REQUESTS} requests x 2 files of ${FILE_KB}KB, concurrency ${CONCURRENCY}`);
+  console.log(`throughput: ${(REQUESTS / seconds).toFixed(1)} req/s, ${mb(logicalBytes / seconds)} MB/s`);
+  console.log(
+    `disk: ${mb(logicalBytes)}MB uploaded, ${mb(storedBytes)}MB stored ` +
+      `(${((1 - storedBytes / logicalBytes) * 100).toFixed(1)}% saved)`
+  );
+
+  server.close();
+}
+
+main()
+  .catch((e) => {
+    console.error(e);
+    process.exit(1);
+  })
+  .finally(async () => {
+    await prisma.$disconnect();
+  });
@@ -86,6 +86,94 @@ async function main() {
   console.log('- Instructor:', instructor.email);
   console.log('- Student:', student.email);
   console.log('- Course:', course.code, course.title);
+
+  if (process.env.SEED_LARGE_COURSE) {
+    await seedLargeCourse(instructor, student);
+  }
+}
+
+// Optional large course used by the benchmarks in bench/.
+// Enable with SEED_LARGE_COURSE=1; size with SEED_ASSIGNMENTS / SEED_STUDENTS.
+async function seedLargeCourse(instructor, student) {
+  const assignmentCount = parseInt(process.env.SEED_ASSIGNMENTS) || 60;
+  const studentCount = parseInt(process.env.SEED_STUDENTS) || 200;
+  const passwordHash = await bcrypt.hash('student123', 12);
+
+  const course = await prisma.course.create({
+    data: {
+      code: `BENCH ${Date.now()}`,
+      title: 'Large Benchmark Course',
+      instructorId: instructor.id,
+      term: 'Fall 2024',
+      academicYear: 2024,
+      startDate: new Date('2024-09-01'),
+      endDate: new Date('2024-12-15'),
+      status: 'published',
+    },
+  });
+
+  const emails = Array.from({ length: studentCount }, (_, i) => `bench-${course.id}-${i}@conceptspro.com`);
+  await prisma.user.createMany({
+    data: emails.map((email, i) => ({
+      email,
+      passwordHash,
+      firstName: 'Bench',
+      lastName: `Student ${i}`,
+      role: 'student',
+    })),
+  });
+  const students = await prisma.user.findMany({
+    where: { email: { in: emails } },
+    select: { id: true },
+  });
+  const studentIds = [student.id, ...students.map((s) => s.id)];
+
+  await prisma.courseEnrollment.createMany({
+    data: studentIds.map((userId) => ({ courseId: course.id, userId, enrollmentStatus: 'enrolled' })),
+  });
+  await prisma.course.update({
+    where: { id: course.id },
+    data: { currentEnrollment: studentIds.length },
+  });
+
+  await prisma.assignment.createMany({
+    data: Array.from({ length: assignmentCount }, (_, i) => ({
+      courseId: course.id,
+      title: `Assignment ${i + 1}`,
+      points: 100,
+      dueDate: new Date(Date.UTC(2024, 8, 1 + i)),
+      isPublished: true,
+    })),
+  });
+  const assignments = await prisma.assignment.findMany({
+    where: { courseId: course.id },
+    select: { id: true },
+  });
+
+  // Every student submits every assignment; the demo student submits twice
+  await prisma.assignmentSubmission.createMany({
+    data: assignments.flatMap((assignment) =>
+      studentIds.map((userId) => ({ assignmentId: assignment.id, userId, submissionNumber: 1 }))
+    ),
+  });
+  await prisma.assignmentSubmission.createMany({
+    data: assignments.map((assignment) => ({ assignmentId: assignment.id, userId: student.id, submissionNumber: 2 })),
+  });
+
+  // A backlog of notifications per student, a quarter of them unread
+  const notificationsPerStudent = parseInt(process.env.SEED_NOTIFICATIONS_PER_STUDENT) || 20;
+  for (const userId of studentIds) {
+    await prisma.notification.createMany({
+      data: Array.from({ length: notificationsPerStudent }, (_, i) => ({
+        userId,
+        notificationType: 'announcement',
+        title: `Benchmark notification ${i + 1}`,
+        isRead: i % 4 !== 0,
+      })),
+    });
+  }
+
+  console.log(`- Large course: ${course.id} (${assignmentCount} assignments, ${studentIds.length} students)`);
 }
 
 main()
@@ -0,0 +1,25 @@
+// Recompute course_progress_summaries for every enrolled student, e.g.
+// after a migration, a bulk data fix, or content added outside the API.
+// Run: npm run summaries:rebuild
+require('dotenv').config();
+const prisma = require('../src/config/database');
+const progressSummary = require('../src/services/progressSummary');
+
+async function main() {
+  const start = Date.now();
+
+  const { rows, pruned } = await progressSummary.rebuildAll({
+    onBatch: (done) => console.log(`  ${done} summaries refreshed`),
+  });
+
+  console.log(`Rebuilt ${rows} progress summaries, removed ${pruned} stale rows in ${Date.now() - start}ms`);
+}
+
+main()
+  .catch((e) => {
+    console.error(e);
+    process.exit(1);
+  })
+  .finally(async () => {
+    await prisma.$disconnect();
+  });
@@ -0,0 +1,27 @@
+// Re-index every course, announcement, assignment and module content into
+// search_documents, e.g. after a migration or data loaded outside the API.
+// Run: npm run search:rebuild [-- announcement assignment]
+require('dotenv').config();
+const prisma = require('../src/config/database');
+const searchIndex = require('../src/services/searchIndex');
+
+async function main() {
+  const start = Date.now();
+  const types = process.argv.slice(2);
+
+  const { rows, pruned } = await searchIndex.rebuildAll({
+    ...(types.length > 0 && { types }),
+    onBatch: (entityType, done) => console.log(`  ${done} documents indexed (${entityType})`),
+  });
+
+  console.log(`Indexed ${rows} documents, removed ${pruned} stale documents in ${Date.now() - start}ms`);
+}
+
+main()
+  .catch((e) => {
+    console.error(e);
+    process.exit(1);
+  })
+  .finally(async () => {
+    await prisma.$disconnect();
+  });
@@ -0,0 +1,116 @@
+require('dotenv').config();
+const cluster = require('cluster');
+const os = require('os');
+const logger = require('./utils/logger');
+const clusterBus = require('./utils/clusterBus');
+
+// Cluster mode: one primary process forking WEB_CONCURRENCY API workers that
+// share the listening port. The primary only supervises:
+//   - crashed workers are replaced after RESTART_DELAY_MS
+//   - SIGHUP (or SIGUSR2) rolls the workers one at a time: a replacement is
+//     forked and listening before the old worker is sent SIGTERM, so the
+//     port is always served (deploy new code, then `kill -HUP <primary pid>`)
+//   - SIGINT/SIGTERM stop every worker gracefully, then exit
+// Workers drain in-flight requests and flush buffers on SIGTERM (see
+// utils/shutdown.js); one that takes longer than SHUTDOWN_TIMEOUT_MS plus a
+// grace period is killed.
+const WORKERS = parseInt(process.env.WEB_CONCURRENCY) || os.availableParallelism();
+const RESTART_DELAY_MS = parseInt(process.env.RESTART_DELAY_MS) || 1000;
+const STOP_TIMEOUT_MS = (parseInt(process.env.SHUTDOWN_TIMEOUT_MS) || 30 * 1000) + 5000;
+
+if (cluster.isPrimary) {
+  // Workers being replaced or stopped on purpose, so 'exit' does not respawn them
+  const retiring = new Set();
+  let rolling = false;
+  let stopping = false;
+
+  const fork = () =>
+    new Promise((resolve, reject) => {
+      const worker = cluster.fork();
+      const onExit = (code) => reject(new Error(`Worker ${worker.id} exited with code ${code} before listening`));
+      worker.once('exit', onExit);
+      worker.once('listening', () => {
+        worker.off('exit', onExit);
+        resolve(worker);
+      });
+    });
+
+  const stop = (worker) =>
+    new Promise((resolve) => {
+      if (worker.isDead()) {
+        return resolve();
+      }
+
+      retiring.add(worker.id);
+      const timer = setTimeout(() => {
+        logger.warn(`Worker ${worker.id} did not stop within ${STOP_TIMEOUT_MS}ms, killing it`);
+        worker.process.kill('SIGKILL');
+      }, STOP_TIMEOUT_MS);
+
+      worker.once('exit', () => {
+        clearTimeout(timer);
+        resolve();
+      });
+      worker.process.kill('SIGTERM');
+    });
+
+  const rollingRestart = async () => {
+    if (rolling || stopping) {
+      return;
+    }
+    rolling = true;
+    logger.info('Rolling restart started');
+
+    try {
+      for (const worker of Object.values(cluster.workers)) {
+        if (retiring.has(worker.id)) {
+          continue;
+        }
+        const replacement = await fork();
+        logger.info(`Worker ${replacement.id} replaces worker ${worker.id}`);
+        await stop(worker);
+      }
+      logger.info('Rolling restart finished');
+    } catch (error) {
+      logger.error('Rolling restart aborted:', error);
+    } finally {
+      rolling = false;
+    }
+  };
+
+  const shutdown = async (signal) => {
+    if (stopping) {
+      return;
+    }
+    stopping = true;
+    logger.info(`${signal} received, stopping ${Object.keys(cluster.workers).length} workers`);
+
+    await Promise.all(Object.values(cluster.workers).map(stop));
+    process.exit(0);
+  };
+
+  cluster.on('exit', (worker, code, signal) => {
+    if (retiring.delete(worker.id) || stopping) {
+      return;
+    }
+
+    logger.error(`Worker ${worker.id} died (${signal || code}), restarting in ${RESTART_DELAY_MS}ms`);
+    setTimeout(() => {
+      fork().catch((error) => logger.error('Failed to restart worker:', error));
+    }, RESTART_DELAY_MS);
+  });
+
+  clusterBus.relay(cluster);
+
+  process.on('SIGHUP', rollingRestart);
+  process.on('SIGUSR2', rollingRestart);
+  process.once('SIGINT', () => shutdown('SIGINT'));
+  process.once('SIGTERM', () => shutdown('SIGTERM'));
+
+  logger.info(`Primary ${process.pid} starting ${WORKERS} workers`);
+  for (let i = 0; i < WORKERS; i++) {
+    fork().catch((error) => logger.error('Failed to start worker:', error));
+  }
+} else {
+  require('./server').start();
+}
@@ -1,13 +1,15 @@
-const { PrismaClient } = require('@prisma/client');
+const { onShutdown, runShutdownHooks, exitOnSignals } = require('../utils/shutdown');
+const { createClient, disconnectAll } = require('./pool');
 
-const prisma = new PrismaClient({
-  log: process.env.NODE_ENV === 'development' ? ['query', 'error', 'warn'] : ['error'],
-});
+// Primary (read-write) database. Pool sizing and statement timeout come
+// from DB_POOL_SIZE, DB_POOL_TIMEOUT_S and DB_STATEMENT_TIMEOUT_MS.
+const prisma = createClient('primary', process.env.DATABASE_URL, 'DB');
+
+// Disconnect every pool once requests are drained and buffers flushed
+onShutdown(disconnectAll, 'close');
 
 // Handle graceful shutdown
-process.on('beforeExit', async () => {
-  await prisma.$disconnect();
-});
+process.on('beforeExit', runShutdownHooks);
+exitOnSignals();
 
 module.exports = prisma;
-
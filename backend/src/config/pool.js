@@ -0,0 +1,101 @@
+const { PrismaClient } = require('@prisma/client');
+const { instrumentPrisma } = require('../utils/metrics');
+
+// Builds PrismaClients with explicit pool settings. Settings are read from
+// `${prefix}_POOL_SIZE`, `${prefix}_POOL_TIMEOUT_S` and
+// `${prefix}_STATEMENT_TIMEOUT_MS` and appended to the connection string,
+// unless the URL already sets them:
+//   connection_limit  connections in this process's pool
+//   pool_timeout      seconds a query may wait for a free connection
+//   statement_timeout Postgres cancels any statement running longer
+const clients = new Map();
+
+const poolUrl = (url, prefix) => {
+  const parsed = new URL(url);
+  const settings = {
+    connection_limit: process.env[`${prefix}_POOL_SIZE`],
+    pool_timeout: process.env[`${prefix}_POOL_TIMEOUT_S`],
+  };
+
+  for (const [param, value] of Object.entries(settings)) {
+    if (value && !parsed.searchParams.has(param)) {
+      parsed.searchParams.set(param, value);
+    }
+  }
+
+  const statementTimeout = process.env[`${prefix}_STATEMENT_TIMEOUT_MS`];
+  if (statementTimeout && !parsed.searchParams.has('options')) {
+    parsed.searchParams.set('options', `-c statement_timeout=${parseInt(statementTimeout)}`);
+  }
+
+  return parsed.toString();
+};
+
+// name labels the pool in /health and /metrics
+const createClient = (name, url, prefix) => {
+  const client = new PrismaClient({
+    ...(url && { datasources: { db: { url: poolUrl(url, prefix) } } }),
+    log: process.env.NODE_ENV === 'development' ? ['query', 'error', 'warn'] : ['error'],
+  });
+
+  // Per-query latency, attributed to the originating route
+  instrumentPrisma(client);
+  clients.set(name, client);
+
+  return client;
+};
+
+const findMetric = (list, key) => list.find((metric) => metric.key === key);
+
+// Prisma reports bucket counts per upper bound (not cumulative)
+const bucketQuantile = (histogram, q) => {
+  const target = histogram.count * q;
+  let seen = 0;
+  for (const [bound, count] of histogram.buckets) {
+    seen += count;
+    if (seen >= target) {
+      return bound;
+    }
+  }
+  return histogram.buckets.length > 0 ? histogram.buckets[histogram.buckets.length - 1][0] : 0;
+};
+
+// Connection counts and time spent waiting for a connection, per pool
+const getPoolStats = async () => {
+  const entries = await Promise.all(
+    // $metrics needs the "metrics" preview feature in schema.prisma
+    [...clients].filter(([, client]) => client.$metrics).map(async ([name, client]) => {
+      const { gauges, histograms } = await client.$metrics.json();
+      const gauge = (key) => (findMetric(gauges, key) || { value: 0 }).value;
+      const wait = (findMetric(histograms, 'prisma_client_queries_wait_histogram_ms') || {}).value;
+
+      return [
+        name,
+        {
+          open: gauge('prisma_pool_connections_open'),
+          busy: gauge('prisma_pool_connections_busy'),
+          idle: gauge('prisma_pool_connections_idle'),
+          waiting: gauge('prisma_client_queries_wait'),
+          waitMs: wait
+            ? {
+                count: wait.count,
+                mean: wait.count > 0 ? wait.sum / wait.count : 0,
+                p50: bucketQuantile(wait, 0.5),
+                p99: bucketQuantile(wait, 0.99),
+              }
+            : null,
+        },
+      ];
+    })
+  );
+
+  return Object.fromEntries(entries);
+};
+
+const disconnectAll = () => Promise.all([...clients.values()].map((client) => client.$disconnect()));
+
+module.exports = {
+  createClient,
+  getPoolStats,
+  disconnectAll,
+};
@@ -0,0 +1,11 @@
+const { createClient } = require('./pool');
+
+// Optional read replica for heavy read-only queries (reports, gradebooks,
+// listings), set with DATABASE_REPLICA_URL. Pool sizing and statement
+// timeout come from DB_REPLICA_POOL_SIZE, DB_REPLICA_POOL_TIMEOUT_S and
+// DB_REPLICA_STATEMENT_TIMEOUT_MS. Null when no replica is configured.
+const replica = process.env.DATABASE_REPLICA_URL
+  ? createClient('replica', process.env.DATABASE_REPLICA_URL, 'DB_REPLICA')
+  : null;
+
+module.exports = replica;
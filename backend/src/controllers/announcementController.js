@@ -1,5 +1,12 @@
 const prisma = require('../config/database');
 const logger = require('../utils/logger');
+const viewTracker = require('../services/viewTracker');
+const notificationFanout = require('../services/notificationFanout');
+const responseCache = require('../services/responseCache');
+const searchIndex = require('../services/searchIndex');
+
+// Cached lists are also bounded in time because expiresAt is evaluated at load
+const LIST_TTL_MS = 60 * 1000;
 
 const getAnnouncements = async (req, res, next) => {
   try {
@@ -24,50 +31,45 @@ const getAnnouncements = async (req, res, next) => {
       return res.status(403).json({ error: 'Access denied' });
     }
 
-    const announcements = await prisma.announcement.findMany({
-      where: {
-        courseId: courseId,
-        deletedAt: null,
-        isPublished: true,
-        OR: [
-          { expiresAt: null },
-          { expiresAt: { gt: new Date() } },
-        ],
-      },
-      include: {
-        author: {
-          select: {
-            id: true,
-            firstName: true,
-            lastName: true,
-            email: true,
+    const cached = await responseCache.load(
+      [`announcements:${courseId}`],
+      'shared',
+      () =>
+        prisma.announcement.findMany({
+          where: {
+            courseId: courseId,
+            deletedAt: null,
+            isPublished: true,
+            OR: [
+              { expiresAt: null },
+              { expiresAt: { gt: new Date() } },
+            ],
           },
-        },
-      },
-      orderBy: [
-        { isPinned: 'desc' },
-        { publishedAt: 'desc' },
-      ],
-    });
-
-    // Mark as viewed
-    for (const announcement of announcements) {
-      await prisma.announcementView.upsert({
-        where: {
-          announcementId_userId: {
-            announcementId: announcement.id,
-            userId: userId,
+          include: {
+            author: {
+              select: {
+                id: true,
+                firstName: true,
+                lastName: true,
+                email: true,
+              },
+            },
           },
-        },
-        create: {
-          announcementId: announcement.id,
-          userId: userId,
-        },
-        update: {},
-      });
-    }
-
-    res.json(announcements);
+          orderBy: [
+            { isPinned: 'desc' },
+            { publishedAt: 'desc' },
+          ],
+        }),
+      {
+        ttlMs: LIST_TTL_MS,
+        meta: (announcements) => announcements.map((announcement) => announcement.id),
+      }
+    );
+
+    // Mark as viewed (buffered, written in bulk off the request path)
+    viewTracker.recordViews(userId, cached.meta);
+
+    responseCache.send(req, res, cached);
   } catch (error) {
     next(error);
   }
@@ -116,29 +118,19 @@ const createAnnouncement = async (req, res, next) => {
       },
     });
 
-    // Create notifications for all enrolled students
-    const enrollments = await prisma.courseEnrollment.findMany({
-      where: {
-        courseId: courseId,
-        enrollmentStatus: 'enrolled',
-        user: {
-          role: 'student',
-        },
-      },
-      select: {
-        userId: true,
-      },
-    });
-
-    await prisma.notification.createMany({
-      data: enrollments.map((enrollment) => ({
-        userId: enrollment.userId,
+    // Notify all enrolled students in the background
+    notificationFanout.enqueue(
+      { courseId: courseId },
+      {
         notificationType: 'announcement',
         title: `New Announcement: ${title}`,
         message: content.substring(0, 100),
         linkUrl: `/courses/${courseId}/announcements`,
-      })),
-    });
+      }
+    );
+
+    responseCache.invalidate(`announcements:${courseId}`);
+    searchIndex.markDirty('announcement', announcement.id);
 
     logger.info(`Announcement created: ${announcement.id} by user ${userId}`);
 
@@ -188,6 +180,9 @@ const updateAnnouncement = async (req, res, next) => {
       },
     });
 
+    responseCache.invalidate(`announcements:${announcement.courseId}`);
+    searchIndex.markDirty('announcement', id);
+
     res.json(updated);
   } catch (error) {
     next(error);
@@ -221,6 +216,9 @@ const deleteAnnouncement = async (req, res, next) => {
       },
     });
 
+    responseCache.invalidate(`announcements:${announcement.courseId}`);
+    searchIndex.markDirty('announcement', id);
+
     res.json({ message: 'Announcement deleted successfully' });
   } catch (error) {
     next(error);
@@ -1,5 +1,44 @@
 const prisma = require('../config/database');
 const logger = require('../utils/logger');
+const { loadLatestSubmissions } = require('../services/submissionLoader');
+const responseCache = require('../services/responseCache');
+const progressSummary = require('../services/progressSummary');
+const searchIndex = require('../services/searchIndex');
+const readRouting = require('../services/readRouting');
+
+// Assignment list for a course, with the caller's latest submission for students
+const listAssignments = async (courseId, role, userId) => {
+  const assignments = await prisma.assignment.findMany({
+    where: {
+      courseId: courseId,
+      deletedAt: null,
+    },
+    include: {
+      _count: {
+        select: {
+          submissions: true,
+        },
+      },
+    },
+    orderBy: {
+      dueDate: 'asc',
+    },
+  });
+
+  // Add submission status for students
+  if (role === 'student') {
+    const latestSubmissions = await loadLatestSubmissions(
+      userId,
+      assignments.map((assignment) => assignment.id)
+    );
+
+    for (const assignment of assignments) {
+      assignment.mySubmission = latestSubmissions.get(assignment.id) || null;
+    }
+  }
+
+  return assignments;
+};
 
 const getAssignments = async (req, res, next) => {
   try {
@@ -31,44 +70,15 @@ const getAssignments = async (req, res, next) => {
       }
     }
 
-    const assignments = await prisma.assignment.findMany({
-      where: {
-        courseId: courseId,
-        deletedAt: null,
-      },
-      include: {
-        _count: {
-          select: {
-            submissions: true,
-          },
-        },
-      },
-      orderBy: {
-        dueDate: 'asc',
-      },
-    });
-
-    // Add submission status for students
-    if (role === 'student') {
-      for (const assignment of assignments) {
-        const submission = await prisma.assignmentSubmission.findFirst({
-          where: {
-            assignmentId: assignment.id,
-            userId: userId,
-          },
-          orderBy: {
-            submissionNumber: 'desc',
-          },
-          include: {
-            grade: true,
-          },
-        });
+    // Students get their own variant, which also depends on their submissions
+    const isStudent = role === 'student';
+    const cached = await responseCache.load(
+      isStudent ? [`assignments:${courseId}`, `submissions:${userId}`] : [`assignments:${courseId}`],
+      isStudent ? `user:${userId}` : 'staff',
+      () => listAssignments(courseId, role, userId)
+    );
 
-        assignment.mySubmission = submission || null;
-      }
-    }
-
-    res.json(assignments);
+    responseCache.send(req, res, cached);
   } catch (error) {
     next(error);
   }
@@ -112,21 +122,12 @@ const getAssignment = async (req, res, next) => {
       }
 
       // Get user's submission
-      const submission = await prisma.assignmentSubmission.findFirst({
-        where: {
-          assignmentId: id,
-          userId: userId,
-        },
-        orderBy: {
-          submissionNumber: 'desc',
-        },
-        include: {
-          files: true,
-          grade: true,
-        },
+      const latestSubmissions = await loadLatestSubmissions(userId, [id], {
+        files: true,
+        grade: true,
       });
 
-      assignment.mySubmission = submission || null;
+      assignment.mySubmission = latestSubmissions.get(id) || null;
     } else {
       // Instructor: get all submissions
       const submissions = await prisma.assignmentSubmission.findMany({
@@ -194,6 +195,10 @@ const createAssignment = async (req, res, next) => {
       },
     });
 
+    responseCache.invalidate(`assignments:${courseId}`, `course:${courseId}`);
+    progressSummary.markCourseDirty(courseId);
+    searchIndex.markDirty('assignment', assignment.id);
+
     logger.info(`Assignment created: ${assignment.id} by user ${userId}`);
 
     res.status(201).json(assignment);
@@ -231,6 +236,10 @@ const updateAssignment = async (req, res, next) => {
       data: updateData,
     });
 
+    responseCache.invalidate(`assignments:${assignment.courseId}`, `course:${assignment.courseId}`);
+    progressSummary.markCourseDirty(assignment.courseId);
+    searchIndex.markDirty('assignment', id);
+
     res.json(updated);
   } catch (error) {
     next(error);
@@ -281,6 +290,24 @@ const submitAssignment = async (req, res, next) => {
       return res.status(400).json({ error: 'Maximum submission limit reached' });
     }
 
+    // Upload URLs look like .../objects/<sha256>.<ext>?file=<id>; older
+    // ones have no ?file=, so fall back to the stored name
+    let refs;
+    try {
+      refs = fileUrls.map((url) => {
+        if (typeof url !== 'string') {
+          throw new TypeError('fileUrls must be strings');
+        }
+        const { pathname, searchParams } = new URL(url, 'http://localhost');
+        return {
+          id: searchParams.get('file'),
+          storedName: decodeURIComponent(pathname.split('/').pop()),
+        };
+      });
+    } catch (error) {
+      return res.status(400).json({ error: 'fileUrls must be upload URLs' });
+    }
+
     // Check if late
     const now = new Date();
     const isLate = now > new Date(assignment.dueDate);
@@ -302,19 +329,45 @@ const submitAssignment = async (req, res, next) => {
       },
     });
 
-    // Create file records
+    // Create file records, with size and type from the recorded uploads
     if (fileUrls.length > 0) {
+      const uploads = await prisma.file.findMany({
+        where: {
+          uploaderId: userId,
+          OR: [
+            { id: { in: refs.map((ref) => ref.id).filter(Boolean) } },
+            { storedName: { in: refs.filter((ref) => !ref.id).map((ref) => ref.storedName) } },
+          ],
+        },
+        select: {
+          id: true,
+          storedName: true,
+          originalName: true,
+          fileSizeBytes: true,
+          mimeType: true,
+        },
+      });
+      const uploadsById = new Map(uploads.map((file) => [file.id, file]));
+      const uploadsByName = new Map(uploads.map((file) => [file.storedName, file]));
+
       await prisma.submissionFile.createMany({
-        data: fileUrls.map((url) => ({
-          submissionId: submission.id,
-          fileName: url.split('/').pop(),
-          fileUrl: url,
-          fileSizeBytes: 0, // Would need to get from upload
-          mimeType: 'application/octet-stream',
-        })),
+        data: fileUrls.map((url, i) => {
+          const { id, storedName } = refs[i];
+          const uploaded = id ? uploadsById.get(id) : uploadsByName.get(storedName);
+          return {
+            submissionId: submission.id,
+            fileName: uploaded ? uploaded.originalName : storedName,
+            fileUrl: url,
+            fileSizeBytes: uploaded ? uploaded.fileSizeBytes : 0,
+            mimeType: (uploaded && uploaded.mimeType) || 'application/octet-stream',
+          };
+        }),
       });
     }
 
+    responseCache.invalidate(`assignments:${assignment.courseId}`);
+    progressSummary.markDirty(userId, assignment.courseId);
+
     logger.info(`Assignment submitted: ${submission.id} by user ${userId}`);
 
     const submissionWithFiles = await prisma.assignmentSubmission.findUnique({
@@ -334,8 +387,9 @@ const getSubmissions = async (req, res, next) => {
   try {
     const { id: assignmentId } = req.params;
     const { role, userId } = req.user;
+    const db = readRouting.forRead(req);
 
-    const assignment = await prisma.assignment.findUnique({
+    const assignment = await db.assignment.findUnique({
       where: { id: assignmentId },
       include: {
         course: true,
@@ -351,7 +405,7 @@ const getSubmissions = async (req, res, next) => {
       return res.status(403).json({ error: 'Access denied' });
     }
 
-    const submissions = await prisma.assignmentSubmission.findMany({
+    const submissions = await db.assignmentSubmission.findMany({
       where: {
         assignmentId: assignmentId,
       },
@@ -1,7 +1,8 @@
-const bcrypt = require('bcrypt');
 const jwt = require('jsonwebtoken');
 const prisma = require('../config/database');
 const logger = require('../utils/logger');
+const { invalidateUser } = require('../services/authCache');
+const passwordHasher = require('../services/passwordHasher');
 
 const register = async (req, res, next) => {
   try {
@@ -17,7 +18,7 @@ const register = async (req, res, next) => {
     }
 
     // Hash password
-    const passwordHash = await bcrypt.hash(password, 12);
+    const passwordHash = await passwordHasher.hash(password);
 
     // Create user
     const user = await prisma.user.create({
@@ -79,7 +80,7 @@ const login = async (req, res, next) => {
     }
 
     // Verify password
-    const isValid = await bcrypt.compare(password, user.passwordHash);
+    const isValid = await passwordHasher.compare(password, user.passwordHash);
     if (!isValid) {
       return res.status(401).json({ error: 'Invalid email or password' });
     }
@@ -168,6 +169,8 @@ const updateMe = async (req, res, next) => {
       },
     });
 
+    invalidateUser(updatedUser.id);
+
     res.json({
       ...updatedUser,
       name: `${updatedUser.firstName} ${updatedUser.lastName}`,
@@ -0,0 +1,65 @@
+// Several GETs in one round trip. Each sub-request is replayed against this
+// server, on the address the batch arrived at, with the caller's
+// Authorization header, so it gets the same authentication, response cache
+// and ETag handling as a direct request; only the client's network round
+// trips are saved.
+const MAX_REQUESTS = 20;
+
+// POST /api/batch { requests: [{ path: '/courses/:id', etag }] }
+const executeBatch = async (req, res, next) => {
+  try {
+    const { requests } = req.body;
+
+    if (!Array.isArray(requests) || requests.length === 0 || requests.length > MAX_REQUESTS) {
+      return res.status(400).json({ error: `requests must be an array of 1 to ${MAX_REQUESTS} items` });
+    }
+
+    // The address this connection arrived on, so it works whatever
+    // interface (IPv4 or IPv6) the server is bound to
+    const address = req.socket.localAddress;
+    const { host } = new URL(`http://${address.includes(':') ? `[${address}]` : address}:${req.socket.localPort}`);
+    const urls = requests.map((item) => {
+      const url = item && typeof item.path === 'string' && item.path.startsWith('/')
+        ? new URL(`http://${host}/api${item.path}`)
+        : null;
+      // Dot segments are resolved by URL, so /../metrics ends up outside
+      // /api/ and is refused; routing ignores case, hence toLowerCase()
+      const pathname = url && url.pathname.toLowerCase();
+      return url && url.host === host && pathname.startsWith('/api/') && !pathname.startsWith('/api/batch')
+        ? url
+        : null;
+    });
+
+    if (urls.includes(null)) {
+      return res.status(400).json({ error: 'Every request needs a path under /api, e.g. /courses' });
+    }
+
+    const responses = await Promise.all(
+      urls.map(async (url, i) => {
+        const response = await fetch(url, {
+          headers: {
+            ...(req.headers.authorization && { Authorization: req.headers.authorization }),
+            ...(requests[i].etag && { 'If-None-Match': requests[i].etag }),
+          },
+        });
+        const contentType = response.headers.get('content-type') || '';
+        const body =
+          response.status === 304
+            ? null
+            : contentType.includes('application/json')
+              ? await response.json()
+              : await response.text();
+
+        return { status: response.status, etag: response.headers.get('etag'), body };
+      })
+    );
+
+    res.json({ responses });
+  } catch (error) {
+    next(error);
+  }
+};
+
+module.exports = {
+  executeBatch,
+};
@@ -0,0 +1,43 @@
+const calendar = require('../services/calendar');
+const readRouting = require('../services/readRouting');
+
+// Longest window one request may expand (a semester plus margin)
+const MAX_WINDOW_DAYS = parseInt(process.env.CALENDAR_MAX_WINDOW_DAYS) || 200;
+
+// GET /api/calendar?from=2024-09-01&to=2024-10-01&tz=America/New_York&courseId=
+const getCalendar = async (req, res, next) => {
+  try {
+    const from = new Date(req.query.from);
+    const to = new Date(req.query.to);
+    const timeZone = req.query.tz || 'UTC';
+
+    if (Number.isNaN(from.getTime()) || Number.isNaN(to.getTime()) || to <= from) {
+      return res.status(400).json({ error: 'from and to must be dates with from before to' });
+    }
+
+    if (to - from > MAX_WINDOW_DAYS * 24 * 60 * 60 * 1000) {
+      return res.status(400).json({ error: `The window may span at most ${MAX_WINDOW_DAYS} days` });
+    }
+
+    try {
+      calendar.validateTimeZone(timeZone);
+    } catch (error) {
+      return res.status(400).json({ error: `Unknown time zone: ${timeZone}` });
+    }
+
+    const result = await calendar.getCalendar(readRouting.forRead(req), req.user, {
+      from,
+      to,
+      timeZone,
+      courseId: req.query.courseId,
+    });
+
+    res.json(result);
+  } catch (error) {
+    next(error);
+  }
+};
+
+module.exports = {
+  getCalendar,
+};
@@ -1,15 +1,20 @@
 const prisma = require('../config/database');
 const logger = require('../utils/logger');
+const responseCache = require('../services/responseCache');
+const enrollmentService = require('../services/enrollment');
+const readRouting = require('../services/readRouting');
+const searchIndex = require('../services/searchIndex');
 
 const getCourses = async (req, res, next) => {
   try {
     const { role, userId } = req.user;
+    const db = readRouting.forRead(req);
 
     let courses;
 
     if (role === 'student') {
       // Get enrolled courses
-      courses = await prisma.course.findMany({
+      courses = await db.course.findMany({
         where: {
           enrollments: {
             some: {
@@ -41,7 +46,7 @@ const getCourses = async (req, res, next) => {
       });
     } else if (role === 'instructor' || role === 'ta') {
       // Get courses taught by instructor or where user is TA
-      courses = await prisma.course.findMany({
+      courses = await db.course.findMany({
         where: {
           OR: [
             { instructorId: userId },
@@ -78,7 +83,7 @@ const getCourses = async (req, res, next) => {
       });
     } else {
       // Admin: get all courses
-      courses = await prisma.course.findMany({
+      courses = await db.course.findMany({
         include: {
           instructor: {
             select: {
@@ -113,48 +118,50 @@ const getCourse = async (req, res, next) => {
     const { id } = req.params;
     const { role, userId } = req.user;
 
-    const course = await prisma.course.findUnique({
-      where: { id },
-      include: {
-        instructor: {
-          select: {
-            id: true,
-            firstName: true,
-            lastName: true,
-            email: true,
-          },
-        },
-        modules: {
-          where: {
-            deletedAt: null,
-            isPublished: true,
-          },
-          orderBy: {
-            orderIndex: 'asc',
+    const cached = await responseCache.load([`course:${id}`], 'shared', () =>
+      prisma.course.findUnique({
+        where: { id },
+        include: {
+          instructor: {
+            select: {
+              id: true,
+              firstName: true,
+              lastName: true,
+              email: true,
+            },
           },
-          include: {
-            contents: {
-              where: {
-                deletedAt: null,
-                isPublished: true,
-              },
-              orderBy: {
-                orderIndex: 'asc',
+          modules: {
+            where: {
+              deletedAt: null,
+              isPublished: true,
+            },
+            orderBy: {
+              orderIndex: 'asc',
+            },
+            include: {
+              contents: {
+                where: {
+                  deletedAt: null,
+                  isPublished: true,
+                },
+                orderBy: {
+                  orderIndex: 'asc',
+                },
               },
             },
           },
-        },
-        _count: {
-          select: {
-            enrollments: true,
-            assignments: true,
-            modules: true,
+          _count: {
+            select: {
+              enrollments: true,
+              assignments: true,
+              modules: true,
+            },
           },
         },
-      },
-    });
+      })
+    );
 
-    if (!course) {
+    if (!cached) {
       return res.status(404).json({ error: 'Course not found' });
     }
 
@@ -174,7 +181,7 @@ const getCourse = async (req, res, next) => {
       }
     }
 
-    res.json(course);
+    responseCache.send(req, res, cached);
   } catch (error) {
     next(error);
   }
@@ -211,6 +218,8 @@ const createCourse = async (req, res, next) => {
       },
     });
 
+    searchIndex.markDirty('course', course.id);
+
     logger.info(`Course created: ${course.id} by user ${userId}`);
 
     res.status(201).json(course);
@@ -257,6 +266,14 @@ const updateCourse = async (req, res, next) => {
       },
     });
 
+    // Raising the cap admits students from the waitlist
+    if (updateData.maxEnrollment !== undefined) {
+      await enrollmentService.promoteWaitlist(id);
+    }
+
+    responseCache.invalidate(`course:${id}`);
+    searchIndex.markDirty('course', id);
+
     res.json(updatedCourse);
   } catch (error) {
     next(error);
@@ -268,102 +285,92 @@ const enrollInCourse = async (req, res, next) => {
     const { id } = req.params;
     const { userId } = req.user;
 
-    // Check if already enrolled
-    const existingEnrollment = await prisma.courseEnrollment.findUnique({
-      where: {
-        courseId_userId: {
-          courseId: id,
-          userId: userId,
-        },
-      },
-    });
+    // Admits the student, or waitlists them when the course is full
+    const enrollment = await enrollmentService.enroll(id, userId);
 
-    if (existingEnrollment) {
-      return res.status(409).json({ error: 'Already enrolled in this course' });
-    }
+    responseCache.invalidate(`course:${id}`);
 
-    // Check course exists and get max enrollment
-    const course = await prisma.course.findUnique({
-      where: { id },
-    });
-
-    if (!course) {
-      return res.status(404).json({ error: 'Course not found' });
-    }
+    logger.info(`User ${userId} ${enrollment.enrollmentStatus} in course ${id}`);
 
-    if (course.maxEnrollment && course.currentEnrollment >= course.maxEnrollment) {
-      return res.status(400).json({ error: 'Course is full' });
-    }
+    res.status(201).json(enrollment);
+  } catch (error) {
+    next(error);
+  }
+};
 
-    // Create enrollment
-    const enrollment = await prisma.courseEnrollment.create({
-      data: {
-        courseId: id,
-        userId: userId,
-        enrollmentStatus: 'enrolled',
-      },
-    });
+const unenrollFromCourse = async (req, res, next) => {
+  try {
+    const { id } = req.params;
+    const { userId } = req.user;
 
-    // Update course enrollment count
-    await prisma.course.update({
-      where: { id },
-      data: {
-        currentEnrollment: {
-          increment: 1,
-        },
-      },
-    });
+    await enrollmentService.unenroll(id, userId);
 
-    logger.info(`User ${userId} enrolled in course ${id}`);
+    responseCache.invalidate(`course:${id}`);
 
-    res.status(201).json(enrollment);
+    res.json({ message: 'Successfully unenrolled from course' });
   } catch (error) {
     next(error);
   }
 };
 
-const unenrollFromCourse = async (req, res, next) => {
+const importRoster = async (req, res, next) => {
   try {
     const { id } = req.params;
-    const { userId } = req.user;
+    const { role, userId } = req.user;
+    const { emails = [], studentIds = [] } = req.body;
 
-    const enrollment = await prisma.courseEnrollment.findUnique({
-      where: {
-        courseId_userId: {
-          courseId: id,
-          userId: userId,
-        },
-      },
+    if (emails.length === 0 && studentIds.length === 0) {
+      return res.status(400).json({ error: 'Provide emails or studentIds to import' });
+    }
+
+    const course = await prisma.course.findUnique({
+      where: { id },
     });
 
-    if (!enrollment) {
-      return res.status(404).json({ error: 'Enrollment not found' });
+    if (!course) {
+      return res.status(404).json({ error: 'Course not found' });
+    }
+
+    if (course.instructorId !== userId && role !== 'admin') {
+      return res.status(403).json({ error: 'Access denied' });
     }
 
-    await prisma.courseEnrollment.update({
+    const users = await prisma.user.findMany({
       where: {
-        courseId_userId: {
-          courseId: id,
-          userId: userId,
-        },
+        OR: [
+          { email: { in: emails } },
+          { studentId: { in: studentIds } },
+        ],
       },
-      data: {
-        enrollmentStatus: 'dropped',
-        dropDate: new Date(),
+      select: {
+        id: true,
+        email: true,
+        studentId: true,
+        role: true,
       },
     });
 
-    // Update course enrollment count
-    await prisma.course.update({
-      where: { id },
-      data: {
-        currentEnrollment: {
-          decrement: 1,
-        },
-      },
-    });
+    const foundEmails = new Set(users.map((user) => user.email));
+    const foundStudentIds = new Set(users.map((user) => user.studentId));
+    const notFound = [
+      ...emails.filter((email) => !foundEmails.has(email)),
+      ...studentIds.filter((studentId) => !foundStudentIds.has(studentId)),
+    ];
 
-    res.json({ message: 'Successfully unenrolled from course' });
+    // Only students take seats; instructors, TAs and admins are reported back
+    const students = users.filter((user) => user.role === 'student');
+    const notStudents = users.filter((user) => user.role !== 'student').map((user) => user.email);
+
+    const result = await enrollmentService.importRoster(
+      id,
+      students.map((student) => student.id)
+    );
+
+    responseCache.invalidate(`course:${id}`);
+
+    logger.info(`Roster imported into course ${id}: ${result.enrolled} enrolled, ${result.waitlisted} waitlisted`);
+
+    res.json({ ...result, notFound, notStudents });
   } catch (error) {
     next(error);
   }
@@ -373,9 +380,10 @@ const getCourseStudents = async (req, res, next) => {
   try {
     const { id } = req.params;
     const { role, userId } = req.user;
+    const db = readRouting.forRead(req);
 
     // Check if user is instructor
-    const course = await prisma.course.findUnique({
+    const course = await db.course.findUnique({
       where: { id },
     });
 
@@ -387,7 +395,7 @@ const getCourseStudents = async (req, res, next) => {
       return res.status(403).json({ error: 'Access denied' });
     }
 
-    const enrollments = await prisma.courseEnrollment.findMany({
+    const enrollments = await db.courseEnrollment.findMany({
       where: {
         courseId: id,
         enrollmentStatus: 'enrolled',
@@ -418,6 +426,7 @@ module.exports = {
   updateCourse,
   enrollInCourse,
   unenrollFromCourse,
+  importRoster,
   getCourseStudents,
 };
 
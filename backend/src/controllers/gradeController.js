@@ -1,5 +1,11 @@
 const prisma = require('../config/database');
 const logger = require('../utils/logger');
+const notificationFanout = require('../services/notificationFanout');
+const gradebook = require('../services/gradebook');
+const responseCache = require('../services/responseCache');
+const grading = require('../services/grading');
+const progressSummary = require('../services/progressSummary');
+const readRouting = require('../services/readRouting');
 
 const gradeSubmission = async (req, res, next) => {
   try {
@@ -76,6 +82,9 @@ const gradeSubmission = async (req, res, next) => {
       },
     });
 
+    responseCache.invalidate(`submissions:${submission.userId}`);
+    progressSummary.markDirty(submission.userId, course.id);
+
     logger.info(`Grade created/updated: ${grade.id} for submission ${submissionId}`);
 
     res.json(grade);
@@ -117,16 +126,19 @@ const releaseGrade = async (req, res, next) => {
       },
     });
 
-    // Create notification for student
-    await prisma.notification.create({
-      data: {
-        userId: submission.userId,
+    responseCache.invalidate(`submissions:${submission.userId}`);
+    progressSummary.markDirty(submission.userId, course.id);
+
+    // Notify the student
+    notificationFanout.enqueue(
+      { userIds: [submission.userId] },
+      {
         notificationType: 'grade_posted',
         title: 'Grade Posted',
         message: `Your grade for "${submission.assignment.title}" has been posted.`,
         linkUrl: `/courses/${course.id}/assignments/${submission.assignmentId}`,
-      },
-    });
+      }
+    );
 
     res.json(grade);
   } catch (error) {
@@ -134,6 +146,105 @@ const releaseGrade = async (req, res, next) => {
   }
 };
 
+const bulkGradeSubmissions = async (req, res, next) => {
+  try {
+    const { id: courseId } = req.params;
+    const { userId, role } = req.user;
+    const { grades, release = false } = req.body;
+
+    if (!Array.isArray(grades) || grades.length === 0) {
+      return res.status(400).json({ error: 'grades must be a non-empty array' });
+    }
+
+    if (grades.length > grading.MAX_BATCH) {
+      return res.status(400).json({ error: `At most ${grading.MAX_BATCH} grades per request` });
+    }
+
+    if (grades.some((entry) => !entry || typeof entry.submissionId !== 'string')) {
+      return res.status(400).json({ error: 'Every grade needs a submissionId' });
+    }
+
+    // A string "false" would otherwise release the whole batch
+    if (typeof release !== 'boolean') {
+      return res.status(400).json({ error: 'release must be true or false' });
+    }
+
+    const course = await prisma.course.findUnique({
+      where: { id: courseId },
+    });
+
+    if (!course) {
+      return res.status(404).json({ error: 'Course not found' });
+    }
+
+    // Check if user can grade (instructor or TA), once for the whole batch
+    if (course.instructorId !== userId && role !== 'admin' && role !== 'ta') {
+      return res.status(403).json({ error: 'Access denied' });
+    }
+
+    const result = await grading.bulkGrade(courseId, userId, grades, { release });
+
+    responseCache.invalidate(...result.userIds.map((studentId) => `submissions:${studentId}`));
+    result.userIds.forEach((studentId) => progressSummary.markDirty(studentId, courseId));
+
+    logger.info(`Bulk graded ${result.grades.length} submissions in course ${courseId}`);
+
+    res.json({
+      graded: result.grades.length,
+      grades: result.grades,
+      notFound: result.notFound,
+    });
+  } catch (error) {
+    next(error);
+  }
+};
+
+const bulkReleaseGrades = async (req, res, next) => {
+  try {
+    const { id: courseId } = req.params;
+    const { userId, role } = req.user;
+    const { submissionIds, assignmentId } = req.body;
+
+    if (Array.isArray(submissionIds) ? submissionIds.length === 0 : !assignmentId) {
+      return res.status(400).json({ error: 'Provide submissionIds or an assignmentId' });
+    }
+
+    if (Array.isArray(submissionIds) && submissionIds.length > grading.MAX_BATCH) {
+      return res.status(400).json({ error: `At most ${grading.MAX_BATCH} submissions per request` });
+    }
+
+    const course = await prisma.course.findUnique({
+      where: { id: courseId },
+    });
+
+    if (!course) {
+      return res.status(404).json({ error: 'Course not found' });
+    }
+
+    // Check permissions
+    if (course.instructorId !== userId && role !== 'admin') {
+      return res.status(403).json({ error: 'Access denied' });
+    }
+
+    const result = await grading.releaseGrades(courseId, {
+      submissionIds: Array.isArray(submissionIds) ? submissionIds : null,
+      assignmentId,
+    });
+
+    responseCache.invalidate(...result.userIds.map((studentId) => `submissions:${studentId}`));
+    result.userIds.forEach((studentId) => progressSummary.markDirty(studentId, courseId));
+
+    logger.info(`Released ${result.submissionIds.length} grades in course ${courseId}`);
+
+    res.json({
+      released: result.submissionIds.length,
+      submissionIds: result.submissionIds,
+    });
+  } catch (error) {
+    next(error);
+  }
+};
+
 const getMyGrades = async (req, res, next) => {
   try {
     const { userId } = req.user;
@@ -177,8 +288,9 @@ const getCourseGrades = async (req, res, next) => {
   try {
     const { id: courseId } = req.params;
     const { userId, role } = req.user;
+    const db = readRouting.forRead(req);
 
-    const course = await prisma.course.findUnique({
+    const course = await db.course.findUnique({
       where: { id: courseId },
     });
 
@@ -191,7 +303,7 @@ const getCourseGrades = async (req, res, next) => {
       return res.status(403).json({ error: 'Access denied' });
     }
 
-    const assignments = await prisma.assignment.findMany({
+    const assignments = await db.assignment.findMany({
       where: {
         courseId: courseId,
         deletedAt: null,
@@ -220,10 +332,87 @@ const getCourseGrades = async (req, res, next) => {
   }
 };
 
+const getGradebook = async (req, res, next) => {
+  try {
+    const { id: courseId } = req.params;
+    const { userId, role } = req.user;
+    const db = readRouting.forRead(req);
+    const { cursor = null, limit: limitParam } = req.query;
+
+    // ?cursor=a&cursor=b arrives as an array
+    const single = (value) => value === undefined || value === null || typeof value === 'string';
+    if (!single(cursor) || !single(limitParam)) {
+      return res.status(400).json({ error: 'cursor and limit must be single values' });
+    }
+    const limit = Math.min(Math.max(parseInt(limitParam) || 100, 1), 1000);
+
+    const course = await db.course.findUnique({
+      where: { id: courseId },
+    });
+
+    if (!course) {
+      return res.status(404).json({ error: 'Course not found' });
+    }
+
+    // Check permissions
+    if (course.instructorId !== userId && role !== 'admin') {
+      return res.status(403).json({ error: 'Access denied' });
+    }
+
+    const rows = await gradebook.fetchGradebookRows(courseId, { cursor, limit, db });
+
+    res.json({
+      rows,
+      nextCursor: rows.length === limit ? rows[rows.length - 1].submissionId : null,
+    });
+  } catch (error) {
+    next(error);
+  }
+};
+
+const exportGradebook = async (req, res, next) => {
+  try {
+    const { id: courseId } = req.params;
+    const { userId, role } = req.user;
+    const db = readRouting.forRead(req);
+    const { format = 'csv' } = req.query;
+
+    if (typeof format !== 'string' || !Object.hasOwn(gradebook.formats, format)) {
+      return res.status(400).json({ error: 'Format must be csv or ndjson' });
+    }
+
+    const course = await db.course.findUnique({
+      where: { id: courseId },
+    });
+
+    if (!course) {
+      return res.status(404).json({ error: 'Course not found' });
+    }
+
+    // Check permissions
+    if (course.instructorId !== userId && role !== 'admin') {
+      return res.status(403).json({ error: 'Access denied' });
+    }
+
+    await gradebook.streamGradebook(courseId, format, res, db);
+  } catch (error) {
+    // Headers are gone once streaming starts; just cut the response
+    if (res.headersSent) {
+      logger.error('Gradebook export failed:', error);
+      return res.destroy(error);
+    }
+    next(error);
+  }
+};
+
 module.exports = {
   gradeSubmission,
   releaseGrade,
+  bulkGradeSubmissions,
+  bulkReleaseGrades,
   getMyGrades,
   getCourseGrades,
+  getGradebook,
+  exportGradebook,
 };
 
@@ -1,4 +1,13 @@
 const prisma = require('../config/database');
+const unreadCounter = require('../services/unreadCounter');
+const realtime = require('../services/realtime');
+
+// Keep other open tabs/devices in sync after the count changes
+const pushUnreadCount = (userId, count) => {
+  if (count !== undefined) {
+    realtime.emitToUser(userId, 'unread_count', { count });
+  }
+};
 
 const getNotifications = async (req, res, next) => {
   try {
@@ -28,12 +37,7 @@ const getUnreadCount = async (req, res, next) => {
   try {
     const { userId } = req.user;
 
-    const count = await prisma.notification.count({
-      where: {
-        userId: userId,
-        isRead: false,
-      },
-    });
+    const count = await unreadCounter.getUnreadCount(userId);
 
     res.json({ count });
   } catch (error) {
@@ -54,15 +58,24 @@ const markAsRead = async (req, res, next) => {
       return res.status(404).json({ error: 'Notification not found' });
     }
 
-    const updated = await prisma.notification.update({
-      where: { id },
+    // Only the request that flips isRead adjusts the count, so concurrent
+    // calls for the same notification decrement it once
+    const readAt = new Date();
+    const { count } = await prisma.notification.updateMany({
+      where: { id, isRead: false },
       data: {
         isRead: true,
-        readAt: new Date(),
+        readAt,
+        updatedAt: readAt,
       },
     });
 
-    res.json(updated);
+    if (count === 1) {
+      pushUnreadCount(userId, await unreadCounter.increment(userId, -1));
+      return res.json({ ...notification, isRead: true, readAt, updatedAt: readAt });
+    }
+
+    res.json(notification.isRead ? notification : await prisma.notification.findUnique({ where: { id } }));
   } catch (error) {
     next(error);
   }
@@ -83,6 +96,9 @@ const markAllAsRead = async (req, res, next) => {
       },
     });
 
+    await unreadCounter.reset(userId);
+    pushUnreadCount(userId, 0);
+
     res.json({ message: 'All notifications marked as read' });
   } catch (error) {
     next(error);
@@ -102,10 +118,19 @@ const deleteNotification = async (req, res, next) => {
       return res.status(404).json({ error: 'Notification not found' });
     }
 
-    await prisma.notification.delete({
-      where: { id },
+    // As in markAsRead, only a delete that removed an unread row decrements
+    const unread = await prisma.notification.deleteMany({
+      where: { id, isRead: false },
     });
 
+    if (unread.count === 1) {
+      pushUnreadCount(userId, await unreadCounter.increment(userId, -1));
+    } else {
+      await prisma.notification.deleteMany({
+        where: { id },
+      });
+    }
+
     res.json({ message: 'Notification deleted' });
   } catch (error) {
     next(error);
@@ -0,0 +1,48 @@
+const progressSummary = require('../services/progressSummary');
+const progressTracker = require('../services/progressTracker');
+
+const MAX_HEARTBEATS = 500;
+
+const getDashboard = async (req, res, next) => {
+  try {
+    const { userId } = req.user;
+
+    const courses = await progressSummary.getDashboard(userId);
+
+    res.json({ courses });
+  } catch (error) {
+    next(error);
+  }
+};
+
+// Players batch heartbeats client-side and post them every few seconds;
+// they are buffered and written in bulk, so this only acknowledges receipt
+const recordHeartbeats = async (req, res, next) => {
+  try {
+    const { userId } = req.user;
+    const { heartbeats } = req.body;
+
+    if (!Array.isArray(heartbeats) || heartbeats.length === 0) {
+      return res.status(400).json({ error: 'heartbeats must be a non-empty array' });
+    }
+
+    if (heartbeats.length > MAX_HEARTBEATS) {
+      return res.status(400).json({ error: `At most ${MAX_HEARTBEATS} heartbeats per request` });
+    }
+
+    if (heartbeats.some((heartbeat) => !heartbeat || typeof heartbeat.contentId !== 'string')) {
+      return res.status(400).json({ error: 'Every heartbeat needs a contentId' });
+    }
+
+    const result = await progressTracker.recordHeartbeats(userId, heartbeats);
+
+    res.status(202).json(result);
+  } catch (error) {
+    next(error);
+  }
+};
+
+module.exports = {
+  getDashboard,
+  recordHeartbeats,
+};
@@ -0,0 +1,40 @@
+const searchIndex = require('../services/searchIndex');
+const readRouting = require('../services/readRouting');
+
+const MAX_QUERY_LENGTH = 200;
+
+// GET /api/search?q=...&type=announcement,assignment&courseId=...&limit=20&offset=0
+const search = async (req, res, next) => {
+  try {
+    const q = typeof req.query.q === 'string' ? req.query.q.trim() : '';
+    const types = req.query.type ? String(req.query.type).split(',') : [];
+
+    if (!q) {
+      return res.status(400).json({ error: 'q is required' });
+    }
+
+    if (q.length > MAX_QUERY_LENGTH) {
+      return res.status(400).json({ error: `q must be at most ${MAX_QUERY_LENGTH} characters` });
+    }
+
+    if (types.some((type) => !searchIndex.ENTITY_TYPES.includes(type))) {
+      return res.status(400).json({ error: `type must be one of: ${searchIndex.ENTITY_TYPES.join(', ')}` });
+    }
+
+    const result = await searchIndex.search(readRouting.forRead(req), req.user, {
+      q,
+      types,
+      courseId: req.query.courseId,
+      limit: req.query.limit,
+      offset: req.query.offset,
+    });
+
+    res.json(result);
+  } catch (error) {
+    next(error);
+  }
+};
+
+module.exports = {
+  search,
+};
@@ -1,5 +1,4 @@
-const jwt = require('jsonwebtoken');
-const prisma = require('../config/database');
+const { verifyToken, getPrincipal } = require('../services/authCache');
 
 const authenticate = async (req, res, next) => {
   try {
@@ -12,21 +11,10 @@ const authenticate = async (req, res, next) => {
     const token = authHeader.split(' ')[1];
 
     try {
-      const decoded = jwt.verify(token, process.env.JWT_SECRET);
+      const decoded = verifyToken(token);
       
-      // Verify user still exists and is active
-      const user = await prisma.user.findUnique({
-        where: { id: decoded.userId },
-        select: {
-          id: true,
-          email: true,
-          role: true,
-          firstName: true,
-          lastName: true,
-          isActive: true,
-          isSuspended: true,
-        },
-      });
+      // Verify user still exists and is active (cached for a bounded window)
+      const user = await getPrincipal(decoded.userId);
 
       if (!user || !user.isActive || user.isSuspended) {
         return res.status(401).json({ error: 'User account is inactive or suspended' });
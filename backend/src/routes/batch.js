@@ -0,0 +1,10 @@
+const express = require('express');
+const router = express.Router();
+const { executeBatch } = require('../controllers/batchController');
+const { authenticate } = require('../middleware/auth');
+
+router.use(authenticate);
+
+router.post('/', executeBatch);
+
+module.exports = router;
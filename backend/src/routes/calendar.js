@@ -0,0 +1,10 @@
+const express = require('express');
+const router = express.Router();
+const { getCalendar } = require('../controllers/calendarController');
+const { authenticate } = require('../middleware/auth');
+
+router.use(authenticate);
+
+router.get('/', getCalendar);
+
+module.exports = router;
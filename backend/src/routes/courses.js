@@ -7,6 +7,7 @@ const {
   updateCourse,
   enrollInCourse,
   unenrollFromCourse,
+  importRoster,
   getCourseStudents,
 } = require('../controllers/courseController');
 const { authenticate, authorize } = require('../middleware/auth');
@@ -21,6 +22,7 @@ router.post('/', authorize('instructor', 'admin'), validateCourse, createCourse)
 router.put('/:id', authorize('instructor', 'admin'), updateCourse);
 router.post('/:id/enroll', enrollInCourse);
 router.post('/:id/unenroll', unenrollFromCourse);
+router.post('/:id/roster', authorize('instructor', 'admin'), importRoster);
 router.get('/:id/students', authorize('instructor', 'admin', 'ta'), getCourseStudents);
 
 module.exports = router;
@@ -1,46 +1,30 @@
 const express = require('express');
 const router = express.Router();
-const path = require('path');
-const fs = require('fs');
 const { authenticate } = require('../middleware/auth');
-const { upload, uploadDir, getFileUrl } = require('../services/fileService');
+const { upload, recordFiles } = require('../services/fileService');
+const { serveFile } = require('../services/fileServer');
 
 router.use(authenticate);
 
-// Upload file
-router.post('/upload/:folder?', upload.single('file'), (req, res, next) => {
-  try {
-    if (!req.file) {
-      return res.status(400).json({ error: 'No file uploaded' });
-    }
-
-    const fileUrl = getFileUrl(req, req.file.path);
-
-    res.json({
-      fileName: req.file.originalname,
-      fileUrl: fileUrl,
-      filePath: req.file.path,
-      fileSize: req.file.size,
-      mimeType: req.file.mimetype,
-    });
-  } catch (error) {
-    next(error);
-  }
-});
-
-// Upload multiple files
-router.post('/upload/multiple/:folder?', upload.array('files', 10), (req, res, next) => {
+// Upload multiple files (registered first, or /upload/multiple would be
+// taken as a single upload into a folder named 'multiple')
+router.post('/upload/multiple/:folder?', upload.array('files', 10), async (req, res, next) => {
   try {
     if (!req.files || req.files.length === 0) {
       return res.status(400).json({ error: 'No files uploaded' });
     }
 
-    const files = req.files.map((file) => ({
+    const records = await recordFiles(req, req.files);
+
+    const files = req.files.map((file, i) => ({
+      fileId: records[i].id,
       fileName: file.originalname,
-      fileUrl: getFileUrl(req, file.path),
+      fileUrl: records[i].fileUrl,
       filePath: file.path,
       fileSize: file.size,
       mimeType: file.mimetype,
+      contentHash: file.contentHash,
+      deduplicated: file.deduplicated,
     }));
 
     res.json({ files });
@@ -49,21 +33,32 @@ router.post('/upload/multiple/:folder?', upload.array('files', 10), (req, res, n
   }
 });
 
-// Download/Serve file
-router.get('/:folder/:filename', (req, res, next) => {
+// Upload file
+router.post('/upload/:folder?', upload.single('file'), async (req, res, next) => {
   try {
-    const { folder, filename } = req.params;
-    const filePath = path.join(uploadDir, folder, filename);
-
-    if (!fs.existsSync(filePath)) {
-      return res.status(404).json({ error: 'File not found' });
+    if (!req.file) {
+      return res.status(400).json({ error: 'No file uploaded' });
     }
 
-    res.sendFile(path.resolve(filePath));
+    const [record] = await recordFiles(req, [req.file]);
+
+    res.json({
+      fileId: record.id,
+      fileName: req.file.originalname,
+      fileUrl: record.fileUrl,
+      filePath: req.file.path,
+      fileSize: req.file.size,
+      mimeType: req.file.mimetype,
+      contentHash: req.file.contentHash,
+      deduplicated: req.file.deduplicated,
+    });
   } catch (error) {
     next(error);
   }
 });
 
+// Download/Serve file (supports Range requests and conditional GETs)
+router.get('/:folder/:filename', serveFile);
+
 module.exports = router;
 
@@ -3,8 +3,12 @@ const router = express.Router();
 const {
   gradeSubmission,
   releaseGrade,
+  bulkGradeSubmissions,
+  bulkReleaseGrades,
   getMyGrades,
   getCourseGrades,
+  getGradebook,
+  exportGradebook,
 } = require('../controllers/gradeController');
 const { authenticate, authorize } = require('../middleware/auth');
 
@@ -12,8 +16,12 @@ router.use(authenticate);
 
 router.post('/submissions/:id/grade', authorize('instructor', 'admin', 'ta'), gradeSubmission);
 router.post('/submissions/:id/release', authorize('instructor', 'admin'), releaseGrade);
+router.post('/courses/:id/grades/bulk', authorize('instructor', 'admin', 'ta'), bulkGradeSubmissions);
+router.post('/courses/:id/grades/release', authorize('instructor', 'admin'), bulkReleaseGrades);
 router.get('/grades/me', getMyGrades);
 router.get('/courses/:id/grades', authorize('instructor', 'admin'), getCourseGrades);
+router.get('/courses/:id/gradebook', authorize('instructor', 'admin'), getGradebook);
+router.get('/courses/:id/gradebook/export', authorize('instructor', 'admin'), exportGradebook);
 
 module.exports = router;
 
@@ -0,0 +1,11 @@
+const express = require('express');
+const router = express.Router();
+const { getDashboard, recordHeartbeats } = require('../controllers/progressController');
+const { authenticate } = require('../middleware/auth');
+
+router.use(authenticate);
+
+router.get('/dashboard', getDashboard);
+router.post('/heartbeats', recordHeartbeats);
+
+module.exports = router;
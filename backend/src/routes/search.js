@@ -0,0 +1,10 @@
+const express = require('express');
+const router = express.Router();
+const { search } = require('../controllers/searchController');
+const { authenticate } = require('../middleware/auth');
+
+router.use(authenticate);
+
+router.get('/', search);
+
+module.exports = router;
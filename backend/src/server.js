@@ -1,4 +1,5 @@
 require('dotenv').config();
+const cluster = require('cluster');
 const express = require('express');
 const cors = require('cors');
 const helmet = require('helmet');
@@ -13,13 +14,39 @@ const gradeRoutes = require('./routes/grades');
 const announcementRoutes = require('./routes/announcements');
 const notificationRoutes = require('./routes/notifications');
 const fileRoutes = require('./routes/files');
+const progressRoutes = require('./routes/progress');
+const searchRoutes = require('./routes/search');
+const calendarRoutes = require('./routes/calendar');
+const batchRoutes = require('./routes/batch');
 
 // Import middleware
 const errorHandler = require('./middleware/errorHandler');
 const logger = require('./utils/logger');
+const metrics = require('./utils/metrics');
+const httpDrain = require('./utils/httpDrain');
+const { onShutdown } = require('./utils/shutdown');
+const authCache = require('./services/authCache');
+const notificationFanout = require('./services/notificationFanout');
+const realtime = require('./services/realtime');
+const responseCache = require('./services/responseCache');
+const progressTracker = require('./services/progressTracker');
+const readRouting = require('./services/readRouting');
+const passwordHasher = require('./services/passwordHasher');
+const searchIndex = require('./services/searchIndex');
+const { getPoolStats } = require('./config/pool');
+const { setStaticHeaders } = require('./services/fileServer');
 
 const app = express();
 
+// Latency and query metrics (first, so they cover every other middleware)
+app.use(metrics.httpMetrics);
+
+// Track in-flight requests so shutdown can wait for them
+app.use(httpDrain.track);
+
+// Pin users who just wrote something to the primary database
+app.use(readRouting.trackWrites);
+
 // Security middleware
 app.use(helmet());
 
@@ -38,6 +65,7 @@ app.use(
       }
     },
     credentials: true,
+    exposedHeaders: ['ETag'],
   })
 );
 
@@ -45,22 +73,89 @@ app.use(
 app.use(express.json({ limit: '10mb' }));
 app.use(express.urlencoded({ extended: true, limit: '10mb' }));
 
-// Logging
+// Logging (access lines go through the buffered logger)
+const accessLogStream = { write: (line) => logger.info(line.trimEnd()) };
 if (process.env.NODE_ENV === 'development') {
-  app.use(morgan('dev'));
+  app.use(morgan('dev', { stream: accessLogStream }));
 } else {
-  app.use(morgan('combined'));
+  app.use(morgan('combined', { stream: accessLogStream }));
 }
 
 // Health check
-app.get('/health', (req, res) => {
+app.get('/health', async (req, res) => {
   res.json({
     status: 'ok',
     timestamp: new Date().toISOString(),
     environment: process.env.NODE_ENV,
+    ...(cluster.isWorker && { worker: cluster.worker.id }),
+    http: httpDrain.getStats(),
+    passwordHasher: passwordHasher.getStats(),
+    authCache: authCache.getStats(),
+    notificationFanout: notificationFanout.getStats(),
+    realtime: realtime.getStats(),
+    responseCache: responseCache.getStats(),
+    progressTracker: progressTracker.getStats(),
+    readRouting: readRouting.getStats(),
+    searchIndex: searchIndex.getStats(),
+    databasePools: await getPoolStats().catch((error) => ({ error: error.message })),
   });
 });
 
+// Prometheus metrics
+metrics.counter('auth_cache_lookups', 'Auth cache hits and misses', () => {
+  const { principals, tokens } = authCache.getStats();
+  return [
+    [{ cache: 'principals', result: 'hit' }, principals.hits],
+    [{ cache: 'principals', result: 'miss' }, principals.misses],
+    [{ cache: 'tokens', result: 'hit' }, tokens.hits],
+    [{ cache: 'tokens', result: 'miss' }, tokens.misses],
+  ];
+});
+metrics.counter('response_cache_lookups', 'Response cache hits, misses and 304s', () => {
+  const stats = responseCache.getStats();
+  return [
+    [{ result: 'hit' }, stats.hits],
+    [{ result: 'miss' }, stats.misses],
+    [{ result: 'not_modified' }, stats.notModified],
+  ];
+});
+metrics.gauge('notification_jobs_queued', 'Notification fan-out jobs waiting', () => notificationFanout.getStats().queued);
+metrics.gauge('progress_heartbeats_buffered', 'Merged content progress rows awaiting a flush', () => progressTracker.getStats().buffered);
+metrics.gauge('bcrypt_queue_depth', 'Password hashing jobs waiting for a worker thread', () => passwordHasher.getStats().queued);
+metrics.gauge('realtime_connections', 'Connected notification sockets', () => realtime.getStats().connections);
+
+metrics.gauge('db_pool_connections', 'Database pool connections by state', async () => {
+  const pools = await getPoolStats();
+  return Object.entries(pools).flatMap(([pool, stats]) =>
+    ['open', 'busy', 'idle'].map((state) => [{ pool, state }, stats[state]])
+  );
+});
+metrics.gauge('db_pool_queries_waiting', 'Queries waiting for a pooled connection', async () => {
+  const pools = await getPoolStats();
+  return Object.entries(pools).map(([pool, stats]) => [{ pool }, stats.waiting]);
+});
+metrics.gauge('db_pool_wait_seconds', 'Time queries waited for a connection (bucket upper bounds)', async () => {
+  const pools = await getPoolStats();
+  return Object.entries(pools)
+    .filter(([, stats]) => stats.waitMs)
+    .flatMap(([pool, { waitMs }]) => [
+      [{ pool, quantile: '0.5' }, waitMs.p50 / 1000],
+      [{ pool, quantile: '0.99' }, waitMs.p99 / 1000],
+    ]);
+});
+metrics.counter('db_reads_routed', 'Read-only requests by database they were routed to', () => {
+  const { reads } = readRouting.getStats();
+  return Object.entries(reads).map(([target, count]) => [{ target }, count]);
+});
+
+app.get('/metrics', async (req, res, next) => {
+  try {
+    res.type('text/plain; version=0.0.4').send(await metrics.render());
+  } catch (error) {
+    next(error);
+  }
+});
+
 // API Routes
 app.use('/api/auth', authRoutes);
 app.use('/api/courses', courseRoutes);
@@ -69,10 +164,17 @@ app.use('/api', gradeRoutes);
 app.use('/api', announcementRoutes);
 app.use('/api/notifications', notificationRoutes);
 app.use('/api/files', fileRoutes);
+app.use('/api/progress', progressRoutes);
+app.use('/api/search', searchRoutes);
+app.use('/api/calendar', calendarRoutes);
+app.use('/api/batch', batchRoutes);
 
 // Serve uploaded files statically
 if (process.env.UPLOAD_DIR) {
-  app.use('/uploads', express.static(path.join(__dirname, '..', process.env.UPLOAD_DIR)));
+  app.use(
+    '/uploads',
+    express.static(path.join(__dirname, '..', process.env.UPLOAD_DIR), { setHeaders: setStaticHeaders })
+  );
 }
 
 // 404 handler
@@ -86,11 +188,37 @@ app.use(errorHandler);
 // Start server
 const PORT = process.env.PORT || 5000;
 
-app.listen(PORT, () => {
-  logger.info(`Server running on port ${PORT}`);
-  logger.info(`Environment: ${process.env.NODE_ENV || 'development'}`);
-  logger.info(`Database: ${process.env.DATABASE_URL ? 'Connected' : 'Not configured'}`);
-});
+// Listen, attach WebSockets and drain on shutdown. Called directly below and
+// by each worker in cluster mode (src/cluster.js).
+const start = (port = PORT) => {
+  const server = app.listen(port, () => {
+    logger.info(`Server running on port ${port}${cluster.isWorker ? ` (worker ${cluster.worker.id})` : ''}`);
+    logger.info(`Environment: ${process.env.NODE_ENV || 'development'}`);
+    logger.info(`Database: ${process.env.DATABASE_URL ? 'Connected' : 'Not configured'}`);
+  });
+
+  // WebSocket push for notifications. Workers share one port without sticky
+  // sessions, so they only accept WebSocket connections, not long-polling.
+  realtime.attach(server, {
+    origins: allowedOrigins,
+    ...(cluster.isWorker && { transports: ['websocket'] }),
+  });
+
+  // First shutdown phase: finish in-flight requests and uploads before
+  // buffers are flushed and the database pools close
+  onShutdown(async () => {
+    realtime.disconnectAll();
+    await httpDrain.drain(server);
+  }, 'drain');
+
+  return server;
+};
+
+// Only listen when run directly, so benchmarks can mount the app in-process
+if (require.main === module) {
+  start();
+}
 
 module.exports = app;
+module.exports.start = start;
 
@@ -0,0 +1,87 @@
+const jwt = require('jsonwebtoken');
+const prisma = require('../config/database');
+const LRUCache = require('../utils/lruCache');
+const clusterBus = require('../utils/clusterBus');
+
+// Principals are cached for a short window so a suspension or deactivation
+// that bypasses invalidateUser() still takes effect within PRINCIPAL_TTL_MS.
+const PRINCIPAL_TTL_MS = parseInt(process.env.AUTH_CACHE_TTL_MS) || 30 * 1000;
+const MAX_PRINCIPALS = parseInt(process.env.AUTH_CACHE_MAX_USERS) || 10000;
+const MAX_TOKENS = parseInt(process.env.AUTH_CACHE_MAX_TOKENS) || 20000;
+
+const principalCache = new LRUCache({ maxEntries: MAX_PRINCIPALS, ttlMs: PRINCIPAL_TTL_MS });
+const tokenCache = new LRUCache({ maxEntries: MAX_TOKENS });
+
+const principalSelect = {
+  id: true,
+  email: true,
+  role: true,
+  firstName: true,
+  lastName: true,
+  isActive: true,
+  isSuspended: true,
+};
+
+// Verify a JWT, skipping the signature check for tokens seen before.
+// Cached entries never outlive the token's own `exp` claim.
+const verifyToken = (token) => {
+  const cached = tokenCache.get(token);
+  if (cached) {
+    return cached;
+  }
+
+  const decoded = jwt.verify(token, process.env.JWT_SECRET);
+  const ttlMs = decoded.exp ? decoded.exp * 1000 - Date.now() : PRINCIPAL_TTL_MS;
+  tokenCache.set(token, decoded, ttlMs);
+
+  return decoded;
+};
+
+// Load the user record used by authenticate(), from cache when fresh
+const getPrincipal = async (userId) => {
+  const cached = principalCache.get(userId);
+  if (cached) {
+    return cached;
+  }
+
+  const user = await prisma.user.findUnique({
+    where: { id: userId },
+    select: principalSelect,
+  });
+
+  if (user) {
+    principalCache.set(userId, user);
+  }
+
+  return user;
+};
+
+// Drop a cached principal after its profile, role or status changes
+const dropPrincipal = (userId) => {
+  principalCache.delete(userId);
+};
+
+const invalidateUser = (userId) => {
+  dropPrincipal(userId);
+  clusterBus.publish('authCache:invalidateUser', userId);
+};
+
+clusterBus.subscribe('authCache:invalidateUser', dropPrincipal);
+
+const getStats = () => ({
+  principals: principalCache.stats(),
+  tokens: tokenCache.stats(),
+});
+
+const clear = () => {
+  principalCache.clear();
+  tokenCache.clear();
+};
+
+module.exports = {
+  verifyToken,
+  getPrincipal,
+  invalidateUser,
+  getStats,
+  clear,
+};
@@ -0,0 +1,206 @@
+const { expand } = require('./recurrence');
+
+// Calendar for a date window: course events (recurring series expanded
+// within the window only) merged with assignment due dates, bucketed by
+// day in the caller's time zone. Both queries are range scans on
+// (course_id, start_date) and (course_id, due_date).
+const DAY_MS = 24 * 60 * 60 * 1000;
+// One-off events that started up to this long before the window are still
+// fetched, so multi-day events overlapping its start are not missed
+const MAX_EVENT_DAYS = parseInt(process.env.CALENDAR_MAX_EVENT_DAYS) || 7;
+
+const dayFormatters = new Map();
+
+// 'YYYY-MM-DD' of `date` in `timeZone`
+const dayKey = (date, timeZone) => {
+  if (!dayFormatters.has(timeZone)) {
+    dayFormatters.set(
+      timeZone,
+      new Intl.DateTimeFormat('en-CA', { timeZone, year: 'numeric', month: '2-digit', day: '2-digit' })
+    );
+  }
+  return dayFormatters.get(timeZone).format(date);
+};
+
+// Throws RangeError for unknown zones
+const validateTimeZone = (timeZone) => dayKey(new Date(), timeZone);
+
+// Courses on the caller's calendar: enrolled courses for students, taught
+// or assisted courses for staff. A single courseId narrows the calendar to
+// that course if it is one of them (any course for admins).
+const findCourses = (db, { userId, role }, courseId) => {
+  const membership = [
+    { instructorId: userId },
+    { enrollments: { some: { userId: userId, enrollmentStatus: 'enrolled' } } },
+  ];
+
+  return db.course.findMany({
+    where: {
+      deletedAt: null,
+      ...(courseId && { id: courseId }),
+      ...(!(role === 'admin' && courseId) && { OR: membership }),
+    },
+    select: {
+      id: true,
+      code: true,
+      title: true,
+      instructorId: true,
+    },
+  });
+};
+
+// Every calendar day [start, end] touches, in `timeZone`
+const coveredDays = (start, end, timeZone) => {
+  const days = new Set([dayKey(start, timeZone)]);
+  for (let ms = start.getTime() + DAY_MS; ms < end.getTime(); ms += DAY_MS) {
+    days.add(dayKey(new Date(ms), timeZone));
+  }
+  if (end > start) {
+    // An event ending exactly at midnight does not touch the next day
+    days.add(dayKey(new Date(end.getTime() - 1), timeZone));
+  }
+  return [...days];
+};
+
+// All-day events are stored at UTC midnight and stay on that date
+const addToDays = (days, entry, from, to, timeZone) => {
+  const zone = entry.isAllDay ? 'UTC' : timeZone;
+  const windowFirst = dayKey(from, zone);
+  const windowLast = dayKey(new Date(to.getTime() - 1), zone);
+
+  for (const day of coveredDays(new Date(entry.start), new Date(entry.end || entry.start), zone)) {
+    if (day >= windowFirst && day <= windowLast) {
+      if (!days.has(day)) {
+        days.set(day, []);
+      }
+      days.get(day).push(entry);
+    }
+  }
+};
+
+const getCalendar = async (db, user, { from, to, timeZone = 'UTC', courseId }) => {
+  const courses = await findCourses(db, user, courseId);
+  const courseById = new Map(courses.map((course) => [course.id, course]));
+  const courseIds = courses.map((course) => course.id);
+
+  if (courseIds.length === 0) {
+    return { from, to, timeZone, total: 0, days: {} };
+  }
+
+  // Students only see published assignments in courses they do not teach
+  const staffCourseIds =
+    user.role === 'student' ? [] : courses.filter((course) => course.instructorId === user.userId).map((c) => c.id);
+
+  const [events, assignments] = await Promise.all([
+    db.calendarEvent.findMany({
+      where: {
+        courseId: { in: courseIds },
+        deletedAt: null,
+        OR: [
+          {
+            recurrenceRule: null,
+            startDate: { gte: new Date(from.getTime() - MAX_EVENT_DAYS * DAY_MS), lt: to },
+          },
+          {
+            recurrenceRule: { not: null },
+            startDate: { lt: to },
+          },
+        ],
+      },
+      select: {
+        id: true,
+        courseId: true,
+        title: true,
+        description: true,
+        eventType: true,
+        startDate: true,
+        endDate: true,
+        location: true,
+        isAllDay: true,
+        recurrenceRule: true,
+      },
+    }),
+    db.assignment.findMany({
+      where: {
+        courseId: { in: courseIds },
+        deletedAt: null,
+        dueDate: { gte: from, lt: to },
+        ...(user.role !== 'admin' && {
+          OR: [{ isPublished: true }, { courseId: { in: staffCourseIds } }],
+        }),
+      },
+      select: {
+        id: true,
+        courseId: true,
+        title: true,
+        dueDate: true,
+        points: true,
+        assignmentType: true,
+      },
+    }),
+  ]);
+
+  const entries = [];
+
+  for (const event of events) {
+    const durationMs = event.endDate ? Math.max(event.endDate - event.startDate, 0) : 0;
+    const course = courseById.get(event.courseId);
+
+    for (const occurrence of expand({ ...event, durationMs }, from, to)) {
+      entries.push({
+        id: event.recurrenceRule ? `${event.id}:${occurrence.start.toISOString()}` : event.id,
+        eventId: event.id,
+        type: event.eventType,
+        title: event.title,
+        description: event.description,
+        location: event.location,
+        start: occurrence.start,
+        end: event.endDate ? occurrence.end : null,
+        isAllDay: event.isAllDay,
+        recurring: Boolean(event.recurrenceRule),
+        courseId: course.id,
+        courseCode: course.code,
+        courseTitle: course.title,
+      });
+    }
+  }
+
+  for (const assignment of assignments) {
+    const course = courseById.get(assignment.courseId);
+    entries.push({
+      id: `assignment-${assignment.id}`,
+      assignmentId: assignment.id,
+      type: 'assignment',
+      title: assignment.title,
+      assignmentType: assignment.assignmentType,
+      points: assignment.points,
+      start: assignment.dueDate,
+      end: null,
+      isAllDay: false,
+      recurring: false,
+      courseId: course.id,
+      courseCode: course.code,
+      courseTitle: course.title,
+    });
+  }
+
+  entries.sort((a, b) => a.start - b.start);
+
+  const days = new Map();
+  for (const entry of entries) {
+    addToDays(days, entry, from, to, timeZone);
+  }
+
+  return {
+    from,
+    to,
+    timeZone,
+    total: entries.length,
+    days: Object.fromEntries([...days].sort(([a], [b]) => (a < b ? -1 : 1))),
+  };
+};
+
+module.exports = {
+  getCalendar,
+  validateTimeZone,
+};
@@ -0,0 +1,268 @@
+const prisma = require('../config/database');
+const logger = require('../utils/logger');
+const notificationFanout = require('./notificationFanout');
+const progressSummary = require('./progressSummary');
+
+// Enrollment engine. Every seat change runs in one transaction that first
+// locks the course row (SELECT ... FOR UPDATE), so concurrent requests –
+// in this process or any other – can never oversubscribe maxEnrollment or
+// let currentEnrollment drift from the enrollment rows.
+const TX_OPTIONS = {
+  maxWait: parseInt(process.env.ENROLLMENT_TX_MAX_WAIT_MS) || 10000,
+  timeout: parseInt(process.env.ENROLLMENT_TX_TIMEOUT_MS) || 10000,
+};
+
+const httpError = (statusCode, message) => Object.assign(new Error(message), { statusCode });
+
+// Transactions for the same course queue here first, so a registration rush
+// holds one pooled connection per course instead of a convoy of them all
+// blocked on the same row lock
+const courseQueues = new Map();
+
+const lockedTransaction = (courseId, work) =>
+  prisma.$transaction(async (tx) => {
+    const [course] = await tx.$queryRaw`
+      SELECT id, max_enrollment AS "maxEnrollment", current_enrollment AS "currentEnrollment"
+      FROM courses WHERE id = ${courseId} FOR UPDATE`;
+
+    if (!course) {
+      throw httpError(404, 'Course not found');
+    }
+
+    return work(tx, course);
+  }, TX_OPTIONS);
+
+const withCourseLock = (courseId, work) => {
+  const previous = courseQueues.get(courseId) || Promise.resolve();
+  const run = previous.then(() => lockedTransaction(courseId, work));
+
+  const settled = run.catch(() => {});
+  courseQueues.set(courseId, settled);
+  settled.then(() => {
+    if (courseQueues.get(courseId) === settled) {
+      courseQueues.delete(courseId);
+    }
+  });
+
+  return run;
+};
+
+const hasSeat = (course) => course.maxEnrollment === null || course.currentEnrollment < course.maxEnrollment;
+
+// Admit the student if there is a seat, otherwise put them on the waitlist.
+// Dropped or withdrawn students may re-enroll.
+const enroll = async (courseId, userId) => {
+  const enrollment = await withCourseLock(courseId, async (tx, course) => {
+    const existing = await tx.courseEnrollment.findUnique({
+      where: {
+        courseId_userId: {
+          courseId: courseId,
+          userId: userId,
+        },
+      },
+    });
+
+    if (existing && ['enrolled', 'waitlisted'].includes(existing.enrollmentStatus)) {
+      throw httpError(409, 'Already enrolled in this course');
+    }
+
+    const admitted = hasSeat(course);
+    const data = {
+      enrollmentStatus: admitted ? 'enrolled' : 'waitlisted',
+      enrollmentType: admitted ? 'regular' : 'waitlist',
+      enrollmentDate: new Date(),
+      dropDate: null,
+    };
+
+    const enrollment = existing
+      ? await tx.courseEnrollment.update({ where: { id: existing.id }, data })
+      : await tx.courseEnrollment.create({ data: { courseId, userId, ...data } });
+
+    if (admitted) {
+      await tx.course.update({
+        where: { id: courseId },
+        data: { currentEnrollment: { increment: 1 } },
+      });
+    }
+
+    return enrollment;
+  });
+
+  progressSummary.markDirty(userId, courseId);
+  return enrollment;
+};
+
+// Promote the longest-waiting students into any free seats
+const fillSeats = async (tx, course, courseId) => {
+  const free =
+    course.maxEnrollment === null ? Infinity : Math.max(0, course.maxEnrollment - course.currentEnrollment);
+  if (free === 0) {
+    return [];
+  }
+
+  const waitlist = await tx.courseEnrollment.findMany({
+    where: {
+      courseId: courseId,
+      enrollmentStatus: 'waitlisted',
+    },
+    orderBy: {
+      enrollmentDate: 'asc',
+    },
+    ...(free !== Infinity && { take: free }),
+    select: {
+      id: true,
+      userId: true,
+    },
+  });
+
+  if (waitlist.length === 0) {
+    return [];
+  }
+
+  await tx.courseEnrollment.updateMany({
+    where: { id: { in: waitlist.map((entry) => entry.id) } },
+    data: { enrollmentStatus: 'enrolled', enrollmentType: 'regular' },
+  });
+  await tx.course.update({
+    where: { id: courseId },
+    data: { currentEnrollment: { increment: waitlist.length } },
+  });
+
+  return waitlist.map((entry) => entry.userId);
+};
+
+const notifyPromoted = (courseId, userIds) => {
+  if (userIds.length === 0) {
+    return;
+  }
+
+  userIds.forEach((userId) => progressSummary.markDirty(userId, courseId));
+
+  logger.info(`Promoted ${userIds.length} waitlisted students in course ${courseId}`);
+  notificationFanout.enqueue(
+    { userIds },
+    {
+      notificationType: 'enrollment',
+      title: 'Enrolled from Waitlist',
+      message: 'A seat opened up and you are now enrolled in the course.',
+      linkUrl: `/courses/${courseId}`,
+    }
+  );
+};
+
+// Drop the student; a freed seat goes to the head of the waitlist
+const unenroll = async (courseId, userId) => {
+  const promoted = await withCourseLock(courseId, async (tx, course) => {
+    const existing = await tx.courseEnrollment.findUnique({
+      where: {
+        courseId_userId: {
+          courseId: courseId,
+          userId: userId,
+        },
+      },
+    });
+
+    if (!existing) {
+      throw httpError(404, 'Enrollment not found');
+    }
+
+    await tx.courseEnrollment.update({
+      where: { id: existing.id },
+      data: {
+        enrollmentStatus: 'dropped',
+        dropDate: new Date(),
+      },
+    });
+
+    if (existing.enrollmentStatus !== 'enrolled') {
+      return [];
+    }
+
+    await tx.course.update({
+      where: { id: courseId },
+      data: { currentEnrollment: { decrement: 1 } },
+    });
+
+    return fillSeats(tx, { ...course, currentEnrollment: course.currentEnrollment - 1 }, courseId);
+  });
+
+  progressSummary.markDirty(userId, courseId);
+  notifyPromoted(courseId, promoted);
+};
+
+// After capacity changes (e.g. maxEnrollment raised)
+const promoteWaitlist = async (courseId) => {
+  const promoted = await withCourseLock(courseId, (tx, course) => fillSeats(tx, course, courseId));
+  notifyPromoted(courseId, promoted);
+  return promoted;
+};
+
+// Registrar roster import: admit as many new students as there are seats,
+// waitlist the rest, all in one transaction with batched writes.
+const importRoster = async (courseId, userIds) => {
+  const result = await withCourseLock(courseId, async (tx, course) => {
+    const existing = await tx.courseEnrollment.findMany({
+      where: {
+        courseId: courseId,
+        userId: { in: userIds },
+      },
+      select: {
+        userId: true,
+        enrollmentStatus: true,
+      },
+    });
+    const active = new Set(
+      existing
+        .filter((entry) => ['enrolled', 'waitlisted'].includes(entry.enrollmentStatus))
+        .map((entry) => entry.userId)
+    );
+    const inactive = new Set(existing.filter((entry) => !active.has(entry.userId)).map((entry) => entry.userId));
+
+    const incoming = [...new Set(userIds)].filter((id) => !active.has(id));
+    const free =
+      course.maxEnrollment === null ? incoming.length : Math.max(0, course.maxEnrollment - course.currentEnrollment);
+    const admit = incoming.slice(0, free);
+    const waitlist = incoming.slice(free);
+    const now = new Date();
+
+    const write = async (ids, enrollmentStatus, enrollmentType) => {
+      if (ids.length === 0) return;
+      const data = { enrollmentStatus, enrollmentType, enrollmentDate: now, dropDate: null };
+      const reactivate = ids.filter((id) => inactive.has(id));
+      const create = ids.filter((id) => !inactive.has(id));
+
+      if (reactivate.length > 0) {
+        await tx.courseEnrollment.updateMany({ where: { courseId, userId: { in: reactivate } }, data });
+      }
+      if (create.length > 0) {
+        await tx.courseEnrollment.createMany({ data: create.map((userId) => ({ courseId, userId, ...data })) });
+      }
+    };
+
+    await write(admit, 'enrolled', 'regular');
+    await write(waitlist, 'waitlisted', 'waitlist');
+
+    if (admit.length > 0) {
+      await tx.course.update({
+        where: { id: courseId },
+        data: { currentEnrollment: { increment: admit.length } },
+      });
+    }
+
+    return {
+      enrolled: admit.length,
+      waitlisted: waitlist.length,
+      alreadyEnrolled: active.size,
+    };
+  });
+
+  progressSummary.markCourseDirty(courseId);
+  return result;
+};
+
+module.exports = {
+  enroll,
+  unenroll,
+  promoteWaitlist,
+  importRoster,
+};
@@ -0,0 +1,134 @@
+const path = require('path');
+const { Prisma } = require('@prisma/client');
+const prisma = require('../config/database');
+const logger = require('../utils/logger');
+const { onShutdown } = require('../utils/shutdown');
+const { uploadDir, OBJECTS_FOLDER } = require('./fileService');
+
+// Serves uploaded files with Range support (via send, used by res.sendFile)
+// and caching tuned per folder: objects/ names are content hashes, so those
+// responses are immutable and use the hash as a strong ETag.
+const IMMUTABLE_MAX_AGE_S = 365 * 24 * 60 * 60;
+const FLUSH_INTERVAL_MS = parseInt(process.env.DOWNLOAD_FLUSH_INTERVAL_MS) || 10 * 1000;
+
+const root = path.resolve(uploadDir);
+
+// File id -> { storedName, count } of downloads not yet written to the
+// files table. Uploads of the same content share a stored object but each
+// has its own row, so counts are kept per row.
+let pendingDownloads = new Map();
+
+const UUID = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i;
+
+const isContentAddressed = (folder) => folder === OBJECTS_FOLDER;
+
+// Only whole-file downloads count; a seeking video player issues many
+// mid-file range requests for a single view
+const countsAsDownload = (req) => {
+  const range = req.headers.range;
+  return !range || /^bytes=0-/.test(range);
+};
+
+const sendOptions = (folder, filename) =>
+  isContentAddressed(folder)
+    ? {
+        root,
+        etag: false,
+        cacheControl: false,
+        headers: {
+          ETag: `"${path.parse(filename).name}"`,
+          'Cache-Control': `private, max-age=${IMMUTABLE_MAX_AGE_S}, immutable`,
+        },
+      }
+    : { root };
+
+const serveFile = (req, res, next) => {
+  const { folder, filename } = req.params;
+  const options = sendOptions(folder, filename);
+
+  // sendFile stats asynchronously and rejects paths escaping `root`
+  res.sendFile(path.join(folder, filename), options, (error) => {
+    if (error) {
+      if (error.code === 'ENOENT' || error.code === 'EISDIR' || error.status === 404) {
+        return res.headersSent ? undefined : res.status(404).json({ error: 'File not found' });
+      }
+      // Client aborted mid-transfer; nothing left to send
+      if (res.headersSent) {
+        return undefined;
+      }
+      return next(error);
+    }
+
+    if (isContentAddressed(folder) && res.statusCode !== 304 && countsAsDownload(req)) {
+      resolveFileId(req, filename)
+        .then((fileId) => fileId && addDownloads(fileId, filename, 1))
+        .catch((error) => logger.error('Failed to resolve downloaded file:', error));
+    }
+  });
+};
+
+const addDownloads = (fileId, storedName, count) => {
+  const pending = pendingDownloads.get(fileId);
+  pendingDownloads.set(fileId, { storedName, count: (pending ? pending.count : 0) + count });
+};
+
+// The row a download belongs to: named by ?file= in URLs issued since
+// uploads were recorded per row (checked against the stored name when
+// flushed), otherwise the requester's own upload or the first one
+const resolveFileId = async (req, storedName) => {
+  if (typeof req.query.file === 'string' && UUID.test(req.query.file)) {
+    return req.query.file;
+  }
+
+  const where = { storedName, deletedAt: null };
+  const record =
+    (await prisma.file.findFirst({ where: { ...where, uploaderId: req.user.userId }, select: { id: true } })) ||
+    (await prisma.file.findFirst({ where, orderBy: { createdAt: 'asc' }, select: { id: true } }));
+  return record && record.id;
+};
+
+// Cache headers for the legacy /uploads static mount in server.js
+const setStaticHeaders = (res, filePath) => {
+  const relative = path.relative(root, filePath).split(path.sep);
+  if (isContentAddressed(relative[0])) {
+    res.setHeader('Cache-Control', `public, max-age=${IMMUTABLE_MAX_AGE_S}, immutable`);
+  }
+};
+
+// One UPDATE for every file downloaded since the last flush
+const flushDownloadCounts = async () => {
+  if (pendingDownloads.size === 0) {
+    return;
+  }
+
+  const batch = pendingDownloads;
+  pendingDownloads = new Map();
+
+  const rows = [...batch].map(
+    ([fileId, { storedName, count }]) => Prisma.sql`(${fileId}, ${storedName}, ${count}::int)`
+  );
+
+  // Matching the stored name too ignores ?file= ids for some other object
+  try {
+    await prisma.$executeRaw`
+      UPDATE files SET download_count = download_count + pending.count
+      FROM (VALUES ${Prisma.join(rows)}) AS pending(id, stored_name, count)
+      WHERE files.id = pending.id AND files.stored_name = pending.stored_name`;
+  } catch (error) {
+    logger.error('Failed to flush download counts:', error);
+    for (const [fileId, { storedName, count }] of batch) {
+      addDownloads(fileId, storedName, count);
+    }
+  }
+};
+
+const timer = setInterval(flushDownloadCounts, FLUSH_INTERVAL_MS);
+timer.unref();
+
+onShutdown(flushDownloadCounts);
+
+module.exports = {
+  serveFile,
+  setStaticHeaders,
+  flushDownloadCounts,
+};
@@ -1,31 +1,79 @@
 const multer = require('multer');
 const path = require('path');
 const fs = require('fs');
+const crypto = require('crypto');
+const { Transform } = require('stream');
+const { pipeline } = require('stream/promises');
 const { v4: uuidv4 } = require('uuid');
+const prisma = require('../config/database');
 
-// Ensure upload directory exists
+// Ensure upload directories exist
 const uploadDir = process.env.UPLOAD_DIR || './uploads';
-if (!fs.existsSync(uploadDir)) {
-  fs.mkdirSync(uploadDir, { recursive: true });
-}
+// Content-addressed store: one copy per distinct file, named by its sha256
+const OBJECTS_FOLDER = 'objects';
+const objectsDir = path.join(uploadDir, OBJECTS_FOLDER);
+const tmpDir = path.join(uploadDir, 'tmp');
+fs.mkdirSync(objectsDir, { recursive: true });
+fs.mkdirSync(tmpDir, { recursive: true });
 
-// Configure storage
-const storage = multer.diskStorage({
-  destination: (req, file, cb) => {
-    const folder = req.params.folder || 'general';
-    const fullPath = path.join(uploadDir, folder);
-    
-    if (!fs.existsSync(fullPath)) {
-      fs.mkdirSync(fullPath, { recursive: true });
-    }
-    
-    cb(null, fullPath);
+const exists = (filePath) =>
+  fs.promises.access(filePath).then(
+    () => true,
+    () => false
+  );
+
+// Multer storage engine that streams each upload to a temp file while
+// hashing it, then moves it to objects/<sha256><ext>. Identical content is
+// stored once; later copies just discard their temp file.
+const contentAddressedStorage = {
+  _handleFile(req, file, cb) {
+    const tmpPath = path.join(tmpDir, uuidv4());
+    const hash = crypto.createHash('sha256');
+    let size = 0;
+
+    const hasher = new Transform({
+      transform(chunk, encoding, callback) {
+        hash.update(chunk);
+        size += chunk.length;
+        callback(null, chunk);
+      },
+    });
+
+    pipeline(file.stream, hasher, fs.createWriteStream(tmpPath))
+      .then(async () => {
+        const contentHash = hash.digest('hex');
+        const storedName = `${contentHash}${path.extname(file.originalname).toLowerCase()}`;
+        const finalPath = path.join(objectsDir, storedName);
+        const deduplicated = await exists(finalPath);
+
+        if (deduplicated) {
+          await fs.promises.unlink(tmpPath);
+        } else {
+          // Atomic; a concurrent identical upload just replaces equal bytes
+          await fs.promises.rename(tmpPath, finalPath);
+        }
+
+        cb(null, {
+          destination: objectsDir,
+          filename: storedName,
+          path: finalPath,
+          size,
+          contentHash,
+          deduplicated,
+        });
+      })
+      .catch((error) => {
+        fs.promises.unlink(tmpPath).catch(() => {});
+        cb(error);
+      });
   },
-  filename: (req, file, cb) => {
-    const uniqueName = `${uuidv4()}-${file.originalname}`;
-    cb(null, uniqueName);
+
+  // Called by multer when a later part of the request fails. Stored objects
+  // may already be shared with other uploads, so they are left in place.
+  _removeFile(req, file, cb) {
+    cb(null);
   },
-});
+};
 
 // File filter
 const fileFilter = (req, file, cb) => {
@@ -42,7 +90,7 @@ const fileFilter = (req, file, cb) => {
 
 // Create upload middleware
 const upload = multer({
-  storage: storage,
+  storage: contentAddressedStorage,
   limits: {
     fileSize: parseInt(process.env.MAX_FILE_SIZE) || 50 * 1024 * 1024, // 50MB default
   },
@@ -51,10 +99,33 @@ const upload = multer({
 
 // Helper to get file URL
 const getFileUrl = (req, filePath) => {
-  const relativePath = filePath.replace(uploadDir, '').replace(/\\/g, '/');
-  return `${req.protocol}://${req.get('host')}/api/files${relativePath}`;
+  const relativePath = path.relative(uploadDir, filePath).replace(/\\/g, '/');
+  return `${req.protocol}://${req.get('host')}/api/files/${relativePath}`;
 };
 
+// Record uploaded files in the File table, one row per upload. Uploads of
+// the same content share a stored object, so the URL names the row too and
+// downloads are counted against the upload they were served for.
+const recordFiles = (req, files) =>
+  prisma.$transaction(
+    files.map((file) => {
+      const id = uuidv4();
+      return prisma.file.create({
+        data: {
+          id,
+          originalName: file.originalname,
+          storedName: file.filename,
+          filePath: file.path,
+          fileUrl: `${getFileUrl(req, file.path)}?file=${id}`,
+          mimeType: file.mimetype,
+          fileSizeBytes: file.size,
+          contentHash: file.contentHash,
+          uploaderId: req.user.userId,
+        },
+      });
+    })
+  );
+
 // Helper to delete file
 const deleteFile = (filePath) => {
   return new Promise((resolve, reject) => {
@@ -71,7 +142,8 @@ const deleteFile = (filePath) => {
 module.exports = {
   upload,
   getFileUrl,
+  recordFiles,
   deleteFile,
   uploadDir,
+  OBJECTS_FOLDER,
 };
-
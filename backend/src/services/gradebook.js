@@ -0,0 +1,185 @@
+const prisma = require('../config/database');
+
+// Flat gradebook: one row per submission, keyset-paginated on submission id
+// so pages and exports never hold more than one chunk in memory.
+const CHUNK_SIZE = parseInt(process.env.GRADEBOOK_CHUNK_SIZE) || 500;
+
+const COLUMNS = [
+  'submissionId',
+  'assignmentId',
+  'assignmentTitle',
+  'assignmentPoints',
+  'dueDate',
+  'userId',
+  'studentId',
+  'firstName',
+  'lastName',
+  'email',
+  'submissionNumber',
+  'submissionDate',
+  'status',
+  'isLate',
+  'daysLate',
+  'pointsEarned',
+  'pointsPossible',
+  'percentage',
+  'letterGrade',
+  'gradedAt',
+  'releasedAt',
+];
+
+// `db` is the client to read from (the replica for reports, see readRouting)
+const fetchGradebookRows = async (courseId, { cursor = null, limit = CHUNK_SIZE, db = prisma } = {}) => {
+  const submissions = await db.assignmentSubmission.findMany({
+    where: {
+      assignment: {
+        courseId: courseId,
+        deletedAt: null,
+      },
+      ...(cursor && { id: { gt: cursor } }),
+    },
+    select: {
+      id: true,
+      assignmentId: true,
+      userId: true,
+      submissionNumber: true,
+      submissionDate: true,
+      status: true,
+      isLate: true,
+      daysLate: true,
+      assignment: {
+        select: {
+          title: true,
+          points: true,
+          dueDate: true,
+        },
+      },
+      user: {
+        select: {
+          studentId: true,
+          firstName: true,
+          lastName: true,
+          email: true,
+        },
+      },
+      grade: {
+        select: {
+          pointsEarned: true,
+          pointsPossible: true,
+          percentage: true,
+          letterGrade: true,
+          gradedAt: true,
+          releasedAt: true,
+        },
+      },
+    },
+    orderBy: {
+      id: 'asc',
+    },
+    take: limit,
+  });
+
+  return submissions.map((submission) => ({
+    submissionId: submission.id,
+    assignmentId: submission.assignmentId,
+    assignmentTitle: submission.assignment.title,
+    assignmentPoints: submission.assignment.points,
+    dueDate: submission.assignment.dueDate,
+    userId: submission.userId,
+    studentId: submission.user.studentId,
+    firstName: submission.user.firstName,
+    lastName: submission.user.lastName,
+    email: submission.user.email,
+    submissionNumber: submission.submissionNumber,
+    submissionDate: submission.submissionDate,
+    status: submission.status,
+    isLate: submission.isLate,
+    daysLate: submission.daysLate,
+    pointsEarned: submission.grade ? submission.grade.pointsEarned : null,
+    pointsPossible: submission.grade ? submission.grade.pointsPossible : null,
+    percentage: submission.grade ? submission.grade.percentage : null,
+    letterGrade: submission.grade ? submission.grade.letterGrade : null,
+    gradedAt: submission.grade ? submission.grade.gradedAt : null,
+    releasedAt: submission.grade ? submission.grade.releasedAt : null,
+  }));
+};
+
+const csvValue = (value) => {
+  if (value === null || value === undefined) {
+    return '';
+  }
+
+  let text = value instanceof Date ? value.toISOString() : String(value);
+  // Spreadsheets run text starting with these as a formula; names and
+  // feedback are user input, so make them plain text
+  if (typeof value === 'string' && /^[=+\-@\t\r]/.test(text)) {
+    text = `'${text}`;
+  }
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+};
+
+const formats = {
+  csv: {
+    contentType: 'text/csv; charset=utf-8',
+    header: `${COLUMNS.join(',')}\n`,
+    row: (row) => `${COLUMNS.map((column) => csvValue(row[column])).join(',')}\n`,
+  },
+  ndjson: {
+    contentType: 'application/x-ndjson; charset=utf-8',
+    header: '',
+    row: (row) => `${JSON.stringify(row)}\n`,
+  },
+};
+
+// Resolve once the chunk is flushed to the socket (or the client went away)
+const write = (res, chunk) =>
+  new Promise((resolve) => {
+    if (res.write(chunk)) {
+      return resolve();
+    }
+    const done = () => {
+      res.off('drain', done);
+      res.off('close', done);
+      resolve();
+    };
+    res.once('drain', done);
+    res.once('close', done);
+  });
+
+// Stream the whole gradebook to `res`, reading one chunk from Postgres at a
+// time and waiting for the socket to drain before reading the next.
+const streamGradebook = async (courseId, format, res, db = prisma) => {
+  const { contentType, header, row } = formats[format];
+
+  res.status(200);
+  res.setHeader('Content-Type', contentType);
+  res.setHeader('Content-Disposition', `attachment; filename="gradebook-${courseId}.${format}"`);
+
+  if (header) {
+    await write(res, header);
+  }
+
+  let cursor = null;
+  while (!res.destroyed) {
+    const rows = await fetchGradebookRows(courseId, { cursor, db });
+    if (rows.length === 0) {
+      break;
+    }
+
+    await write(res, rows.map(row).join(''));
+
+    if (rows.length < CHUNK_SIZE) {
+      break;
+    }
+    cursor = rows[rows.length - 1].submissionId;
+  }
+
+  res.end();
+};
+
+module.exports = {
+  CHUNK_SIZE,
+  formats,
+  fetchGradebookRows,
+  streamGradebook,
+};
@@ -0,0 +1,137 @@
+const { Prisma } = require('@prisma/client');
+const { v4: uuidv4 } = require('uuid');
+const prisma = require('../config/database');
+const notificationFanout = require('./notificationFanout');
+
+// Bulk grading for a single course. Submissions are validated against the
+// course in one read; grades are upserted with one INSERT ... ON CONFLICT
+// and statuses set with one UPDATE, together in a single transaction.
+const MAX_BATCH = parseInt(process.env.BULK_GRADE_MAX) || 1000;
+
+// Empty inputs become NULL; 0 is a real score
+const toNumber = (value) => (value === undefined || value === null || value === '' ? null : parseFloat(value));
+
+const gradeRow = (entry, submission, graderId, release) =>
+  Prisma.sql`(
+    ${uuidv4()},
+    ${submission.id},
+    ${graderId},
+    ${toNumber(entry.pointsEarned)}::numeric,
+    ${toNumber(entry.pointsPossible) ?? toNumber(submission.assignment.points)}::numeric,
+    ${toNumber(entry.percentage)}::numeric,
+    ${entry.letterGrade ?? null},
+    ${entry.feedback ?? null},
+    ${entry.rubricScores ? JSON.stringify(entry.rubricScores) : null}::jsonb,
+    now(),
+    ${release === true ? Prisma.sql`now()` : Prisma.sql`NULL::timestamp`}
+  )`;
+
+// entries: [{ submissionId, pointsEarned, pointsPossible, percentage,
+// letterGrade, feedback, rubricScores }]. Returns the upserted grades and
+// the submission ids that do not belong to the course.
+const bulkGrade = async (courseId, graderId, entries, { release = false } = {}) => {
+  // The last entry wins when a submission appears twice
+  const bySubmission = new Map(entries.map((entry) => [entry.submissionId, entry]));
+
+  const submissions = await prisma.assignmentSubmission.findMany({
+    where: {
+      id: { in: [...bySubmission.keys()] },
+      assignment: {
+        courseId: courseId,
+      },
+    },
+    select: {
+      id: true,
+      userId: true,
+      assignment: {
+        select: {
+          points: true,
+        },
+      },
+    },
+  });
+
+  const found = new Set(submissions.map((submission) => submission.id));
+  const notFound = [...bySubmission.keys()].filter((id) => !found.has(id));
+
+  if (submissions.length === 0) {
+    return { grades: [], notFound, userIds: [] };
+  }
+
+  const rows = submissions.map((submission) =>
+    gradeRow(bySubmission.get(submission.id), submission, graderId, release)
+  );
+
+  const [grades] = await prisma.$transaction([
+    prisma.$queryRaw`
+      INSERT INTO grades (id, submission_id, grader_id, points_earned, points_possible, percentage,
+                          letter_grade, feedback, rubric_scores, graded_at, released_at)
+      VALUES ${Prisma.join(rows)}
+      ON CONFLICT (submission_id) DO UPDATE SET
+        grader_id = EXCLUDED.grader_id,
+        points_earned = EXCLUDED.points_earned,
+        points_possible = EXCLUDED.points_possible,
+        percentage = EXCLUDED.percentage,
+        letter_grade = EXCLUDED.letter_grade,
+        feedback = EXCLUDED.feedback,
+        rubric_scores = EXCLUDED.rubric_scores,
+        graded_at = EXCLUDED.graded_at,
+        released_at = COALESCE(EXCLUDED.released_at, grades.released_at)
+      RETURNING id, submission_id AS "submissionId", grader_id AS "graderId",
+                points_earned AS "pointsEarned", points_possible AS "pointsPossible", percentage,
+                letter_grade AS "letterGrade", feedback, rubric_scores AS "rubricScores",
+                graded_at AS "gradedAt", released_at AS "releasedAt"`,
+    prisma.assignmentSubmission.updateMany({
+      where: { id: { in: [...found] } },
+      data: { status: 'graded' },
+    }),
+  ]);
+
+  return {
+    grades,
+    notFound,
+    userIds: [...new Set(submissions.map((submission) => submission.userId))],
+  };
+};
+
+// Release every unreleased grade in the course matching `submissionIds` or
+// `assignmentId`, then notify all affected students with one fan-out job.
+// Already released grades are skipped, so retries never notify twice.
+const releaseGrades = async (courseId, { submissionIds = null, assignmentId = null }) => {
+  const filter = submissionIds
+    ? Prisma.sql`s.id IN (${Prisma.join(submissionIds)})`
+    : Prisma.sql`a.id = ${assignmentId}`;
+
+  const released = await prisma.$queryRaw`
+    UPDATE grades g SET released_at = now()
+    FROM assignment_submissions s
+    JOIN assignments a ON a.id = s.assignment_id
+    WHERE g.submission_id = s.id
+      AND a.course_id = ${courseId}
+      AND g.released_at IS NULL
+      AND ${filter}
+    RETURNING s.id AS "submissionId", s.user_id AS "userId", a.id AS "assignmentId", a.title`;
+
+  if (released.length > 0) {
+    notificationFanout.enqueue({
+      notifications: released.map((grade) => ({
+        userId: grade.userId,
+        notificationType: 'grade_posted',
+        title: 'Grade Posted',
+        message: `Your grade for "${grade.title}" has been posted.`,
+        linkUrl: `/courses/${courseId}/assignments/${grade.assignmentId}`,
+      })),
+    });
+  }
+
+  return {
+    submissionIds: released.map((grade) => grade.submissionId),
+    userIds: [...new Set(released.map((grade) => grade.userId))],
+  };
+};
+
+module.exports = {
+  MAX_BATCH,
+  bulkGrade,
+  releaseGrades,
+};
@@ -0,0 +1,202 @@
+const { v4: uuidv4 } = require('uuid');
+const prisma = require('../config/database');
+const logger = require('../utils/logger');
+const { onShutdown } = require('../utils/shutdown');
+const { detached } = require('../utils/metrics');
+const unreadCounter = require('./unreadCounter');
+const realtime = require('./realtime');
+
+// In-process notification fan-out. Requests enqueue a job and return; a
+// single worker resolves recipients in keyset-paginated chunks and writes
+// one bounded createMany per chunk, so memory stays proportional to
+// FANOUT_BATCH_SIZE regardless of course size. The next chunk is only read
+// once the previous write has completed.
+const BATCH_SIZE = parseInt(process.env.FANOUT_BATCH_SIZE) || 1000;
+const RECENT_JOBS = 50;
+
+const queue = [];
+const recentJobs = [];
+const totals = { enqueued: 0, completed: 0, failed: 0, notifications: 0 };
+let running = false;
+let idleResolvers = [];
+
+// Yields arrays of recipient user ids, at most BATCH_SIZE at a time
+async function* recipientBatches(recipients) {
+  if (recipients.userIds) {
+    for (let i = 0; i < recipients.userIds.length; i += BATCH_SIZE) {
+      yield recipients.userIds.slice(i, i + BATCH_SIZE);
+    }
+    return;
+  }
+
+  let cursor = null;
+  for (;;) {
+    const enrollments = await prisma.courseEnrollment.findMany({
+      where: {
+        courseId: recipients.courseId,
+        enrollmentStatus: 'enrolled',
+        ...(cursor && { id: { gt: cursor } }),
+        user: {
+          role: 'student',
+        },
+      },
+      select: {
+        id: true,
+        userId: true,
+      },
+      orderBy: {
+        id: 'asc',
+      },
+      take: BATCH_SIZE,
+    });
+
+    if (enrollments.length === 0) {
+      return;
+    }
+
+    yield enrollments.map((enrollment) => enrollment.userId);
+
+    if (enrollments.length < BATCH_SIZE) {
+      return;
+    }
+    cursor = enrollments[enrollments.length - 1].id;
+  }
+}
+
+// Yields notification rows, at most BATCH_SIZE at a time
+async function* notificationBatches(job) {
+  if (job.recipients.notifications) {
+    const { notifications } = job.recipients;
+    for (let i = 0; i < notifications.length; i += BATCH_SIZE) {
+      yield notifications.slice(i, i + BATCH_SIZE);
+    }
+    return;
+  }
+
+  for await (const userIds of recipientBatches(job.recipients)) {
+    yield userIds.map((userId) => ({ userId, ...job.notification }));
+  }
+}
+
+const runJob = async (job) => {
+  job.startedAt = Date.now();
+  job.lagMs = job.startedAt - job.enqueuedAt;
+
+  for await (const batch of notificationBatches(job)) {
+    // Ids and timestamps are set here so the realtime payload carries them
+    const createdAt = new Date();
+    const rows = batch.map((row) => ({ ...row, id: row.id || uuidv4(), createdAt: row.createdAt || createdAt }));
+    await prisma.notification.createMany({ data: rows });
+    job.sent += rows.length;
+    await publish(rows);
+  }
+};
+
+// Bump cached unread counts and push to any connected sockets
+const publish = (rows) =>
+  Promise.all(
+    rows.map(async ({ userId, ...notification }) => {
+      const unreadCount = await unreadCounter.increment(userId);
+      realtime.emitToUser(userId, 'notification', {
+        ...notification,
+        isRead: false,
+        unreadCount: unreadCount === undefined ? null : unreadCount,
+      });
+    })
+  );
+
+const recordJob = (job) => {
+  job.finishedAt = Date.now();
+  job.durationMs = job.finishedAt - job.startedAt;
+  job.perSecond = job.durationMs > 0 ? Math.round((job.sent / job.durationMs) * 1000) : job.sent;
+
+  recentJobs.push({
+    id: job.id,
+    status: job.status,
+    sent: job.sent,
+    lagMs: job.lagMs,
+    durationMs: job.durationMs,
+    perSecond: job.perSecond,
+  });
+  if (recentJobs.length > RECENT_JOBS) {
+    recentJobs.shift();
+  }
+};
+
+const drainQueue = async () => {
+  if (running) {
+    return;
+  }
+  running = true;
+
+  while (queue.length > 0) {
+    const job = queue.shift();
+
+    try {
+      await runJob(job);
+      job.status = 'completed';
+      totals.completed++;
+    } catch (error) {
+      job.status = 'failed';
+      totals.failed++;
+      logger.error(`Notification job ${job.id} failed after ${job.sent} notifications:`, error);
+    }
+
+    totals.notifications += job.sent;
+    recordJob(job);
+    logger.info(
+      `Notification job ${job.id} ${job.status}: ${job.sent} sent in ${job.durationMs}ms ` +
+        `(${job.perSecond}/s, lag ${job.lagMs}ms)`
+    );
+  }
+
+  running = false;
+  idleResolvers.forEach((resolve) => resolve());
+  idleResolvers = [];
+};
+
+// recipients: { courseId } for all enrolled students, { userIds: [...] },
+// or { notifications: [...] } of prebuilt rows that each carry a userId
+// notification: { notificationType, title, message, linkUrl }
+const enqueue = (recipients, notification = null) => {
+  const job = {
+    id: uuidv4(),
+    recipients,
+    notification,
+    status: 'queued',
+    sent: 0,
+    enqueuedAt: Date.now(),
+  };
+
+  queue.push(job);
+  totals.enqueued++;
+  detached(() => setImmediate(drainQueue));
+
+  return job.id;
+};
+
+// Resolves once every queued job has been processed
+const whenIdle = () => {
+  if (!running && queue.length === 0) {
+    return Promise.resolve();
+  }
+  if (!running) {
+    drainQueue();
+  }
+  return new Promise((resolve) => idleResolvers.push(resolve));
+};
+
+const getStats = () => ({
+  ...totals,
+  queued: queue.length,
+  running,
+  recentJobs: [...recentJobs],
+});
+
+onShutdown(whenIdle);
+
+module.exports = {
+  enqueue,
+  whenIdle,
+  getStats,
+};
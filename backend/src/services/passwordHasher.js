@@ -0,0 +1,134 @@
+const path = require('path');
+const { Worker } = require('worker_threads');
+const logger = require('../utils/logger');
+const { onShutdown } = require('../utils/shutdown');
+
+// Password hashing on a dedicated pool of worker threads. bcrypt's async API
+// already leaves the event loop, but it shares libuv's small thread pool with
+// file and DNS work, so a login storm queued behind cost-12 hashes stalls
+// uploads too. Here hashing has its own threads and a bounded queue: once
+// BCRYPT_MAX_QUEUE jobs are waiting, new ones are refused with a 503 instead
+// of piling up behind requests whose clients have already timed out.
+const ROUNDS = 12;
+const THREADS = parseInt(process.env.BCRYPT_THREADS) || 2;
+const MAX_QUEUE = parseInt(process.env.BCRYPT_MAX_QUEUE) || 200;
+const WORKER_PATH = path.join(__dirname, '..', 'workers', 'bcrypt.js');
+
+const httpError = (statusCode, message) => Object.assign(new Error(message), { statusCode });
+
+const workers = [];
+const idle = [];
+const queue = [];
+const pending = new Map();
+const totals = { completed: 0, rejected: 0, failed: 0 };
+let nextId = 0;
+let closed = false;
+
+const spawn = () => {
+  const worker = new Worker(WORKER_PATH);
+  worker.job = null;
+  worker.unref();
+
+  worker.on('message', ({ id, result, error }) => {
+    const job = pending.get(id);
+    pending.delete(id);
+    worker.job = null;
+
+    if (job) {
+      if (error) {
+        totals.failed++;
+        job.reject(new Error(error));
+      } else {
+        totals.completed++;
+        job.resolve(result);
+      }
+    }
+    release(worker);
+  });
+
+  // A crashed thread takes its job with it; replace the thread
+  worker.on('error', (error) => {
+    logger.error('bcrypt worker failed:', error);
+  });
+  worker.on('exit', () => {
+    workers.splice(workers.indexOf(worker), 1);
+    const idleIndex = idle.indexOf(worker);
+    if (idleIndex !== -1) {
+      idle.splice(idleIndex, 1);
+    }
+    if (worker.job) {
+      pending.delete(worker.job.id);
+      totals.failed++;
+      worker.job.reject(new Error('Password hashing worker exited'));
+    }
+    if (!closed) {
+      release(spawn());
+    }
+  });
+
+  workers.push(worker);
+  return worker;
+};
+
+const dispatch = (worker, job) => {
+  worker.job = job;
+  pending.set(job.id, job);
+  worker.postMessage(job.message);
+};
+
+const release = (worker) => {
+  const job = queue.shift();
+  if (job) {
+    dispatch(worker, job);
+  } else {
+    idle.push(worker);
+  }
+};
+
+const run = (message) => {
+  if (workers.length === 0) {
+    for (let i = 0; i < THREADS; i++) {
+      idle.push(spawn());
+    }
+  }
+
+  if (idle.length === 0 && queue.length >= MAX_QUEUE) {
+    totals.rejected++;
+    return Promise.reject(httpError(503, 'Server is busy, please try again'));
+  }
+
+  return new Promise((resolve, reject) => {
+    const id = ++nextId;
+    const job = { id, message: { id, ...message }, resolve, reject };
+
+    if (idle.length > 0) {
+      dispatch(idle.pop(), job);
+    } else {
+      queue.push(job);
+    }
+  });
+};
+
+const hash = (password) => run({ op: 'hash', password, rounds: ROUNDS });
+
+const compare = (password, passwordHash) => run({ op: 'compare', password, hash: passwordHash });
+
+const getStats = () => ({
+  threads: workers.length,
+  busy: workers.length - idle.length,
+  queued: queue.length,
+  maxQueue: MAX_QUEUE,
+  ...totals,
+});
+
+// Runs after requests have drained, so nothing is waiting on a hash
+onShutdown(async () => {
+  closed = true;
+  await Promise.all(workers.map((worker) => worker.terminate()));
+}, 'close');
+
+module.exports = {
+  hash,
+  compare,
+  getStats,
+};
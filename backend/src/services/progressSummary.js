@@ -0,0 +1,271 @@
+const { Prisma } = require('@prisma/client');
+const prisma = require('../config/database');
+const logger = require('../utils/logger');
+const { onShutdown } = require('../utils/shutdown');
+
+// Materialised per-student course summaries (course_progress_summaries).
+// Writes that change a student's standing mark (user, course) dirty; dirty
+// rows are recomputed from the source tables in batches, one
+// INSERT ... SELECT ... ON CONFLICT per batch. Recomputing a single
+// student's row only touches that student's submissions and progress, so
+// it stays cheap and can never drift the way applied deltas can.
+const FLUSH_INTERVAL_MS = parseInt(process.env.SUMMARY_FLUSH_INTERVAL_MS) || 1000;
+const BATCH_SIZE = parseInt(process.env.SUMMARY_REFRESH_BATCH_SIZE) || 500;
+
+// userId -> Set of courseIds awaiting a refresh
+let dirty = new Map();
+// Courses whose every enrolled student needs a refresh (e.g. new assignment)
+let dirtyCourses = new Set();
+let flushing = null;
+
+// `targets` is a query yielding (user_id, course_id) pairs
+const upsertSql = (targets) => Prisma.sql`
+  WITH targets AS (${targets}),
+  active AS (
+    SELECT DISTINCT t.user_id, t.course_id
+    FROM targets t
+    JOIN course_enrollments e
+      ON e.user_id = t.user_id AND e.course_id = t.course_id AND e.enrollment_status = 'enrolled'
+  ),
+  content AS (
+    SELECT a.user_id, a.course_id,
+           COUNT(mc.id) AS total,
+           COUNT(cp.id) FILTER (WHERE cp.is_completed) AS completed,
+           MAX(cp.last_accessed_at) AS last_accessed
+    FROM active a
+    JOIN modules m ON m.course_id = a.course_id AND m.is_published AND m.deleted_at IS NULL
+    JOIN module_contents mc
+      ON mc.module_id = m.id AND mc.is_published AND mc.is_required AND mc.deleted_at IS NULL
+    LEFT JOIN content_progress cp ON cp.content_id = mc.id AND cp.user_id = a.user_id
+    GROUP BY a.user_id, a.course_id
+  ),
+  published AS (
+    SELECT a.user_id, a.course_id, COUNT(asg.id) AS total
+    FROM active a
+    JOIN assignments asg ON asg.course_id = a.course_id AND asg.is_published AND asg.deleted_at IS NULL
+    GROUP BY a.user_id, a.course_id
+  ),
+  latest AS (
+    SELECT DISTINCT ON (s.user_id, s.assignment_id)
+           a.user_id, a.course_id, s.id, s.submission_date, s.is_late, asg.points
+    FROM active a
+    JOIN assignments asg ON asg.course_id = a.course_id AND asg.deleted_at IS NULL
+    JOIN assignment_submissions s ON s.assignment_id = asg.id AND s.user_id = a.user_id AND NOT s.is_draft
+    ORDER BY s.user_id, s.assignment_id, s.submission_number DESC
+  ),
+  work AS (
+    SELECT l.user_id, l.course_id,
+           COUNT(*) AS submitted,
+           COUNT(g.id) FILTER (WHERE g.released_at IS NOT NULL) AS graded,
+           SUM(g.points_earned) FILTER (WHERE g.released_at IS NOT NULL) AS earned,
+           SUM(COALESCE(g.points_possible, l.points)) FILTER (WHERE g.released_at IS NOT NULL) AS possible,
+           COUNT(*) FILTER (WHERE l.is_late) AS late,
+           MAX(l.submission_date) AS last_submitted
+    FROM latest l
+    LEFT JOIN grades g ON g.submission_id = l.id
+    GROUP BY l.user_id, l.course_id
+  )
+  INSERT INTO course_progress_summaries (
+    id, user_id, course_id, content_total, content_completed, completion_percentage,
+    assignments_total, assignments_submitted, assignments_graded, points_earned, points_possible,
+    late_count, last_activity_at, updated_at
+  )
+  SELECT gen_random_uuid(), a.user_id, a.course_id,
+         COALESCE(c.total, 0),
+         COALESCE(c.completed, 0),
+         CASE WHEN COALESCE(c.total, 0) = 0 THEN 0 ELSE ROUND(100.0 * c.completed / c.total, 2) END,
+         COALESCE(p.total, 0),
+         COALESCE(w.submitted, 0),
+         COALESCE(w.graded, 0),
+         COALESCE(w.earned, 0),
+         COALESCE(w.possible, 0),
+         COALESCE(w.late, 0),
+         GREATEST(c.last_accessed, w.last_submitted),
+         now()
+  FROM active a
+  LEFT JOIN content c ON c.user_id = a.user_id AND c.course_id = a.course_id
+  LEFT JOIN published p ON p.user_id = a.user_id AND p.course_id = a.course_id
+  LEFT JOIN work w ON w.user_id = a.user_id AND w.course_id = a.course_id
+  ON CONFLICT (user_id, course_id) DO UPDATE SET
+    content_total = EXCLUDED.content_total,
+    content_completed = EXCLUDED.content_completed,
+    completion_percentage = EXCLUDED.completion_percentage,
+    assignments_total = EXCLUDED.assignments_total,
+    assignments_submitted = EXCLUDED.assignments_submitted,
+    assignments_graded = EXCLUDED.assignments_graded,
+    points_earned = EXCLUDED.points_earned,
+    points_possible = EXCLUDED.points_possible,
+    late_count = EXCLUDED.late_count,
+    last_activity_at = EXCLUDED.last_activity_at,
+    updated_at = EXCLUDED.updated_at`;
+
+// Dropped students lose their row
+const pruneSql = (targets) => Prisma.sql`
+  DELETE FROM course_progress_summaries cps
+  USING (${targets}) t
+  WHERE cps.user_id = t.user_id AND cps.course_id = t.course_id
+    AND NOT EXISTS (
+      SELECT 1 FROM course_enrollments e
+      WHERE e.user_id = cps.user_id AND e.course_id = cps.course_id AND e.enrollment_status = 'enrolled'
+    )`;
+
+const refreshTargets = (targets) =>
+  prisma.$transaction([prisma.$executeRaw(upsertSql(targets)), prisma.$executeRaw(pruneSql(targets))]);
+
+// pairs: [{ userId, courseId }]
+const refreshPairs = async (pairs) => {
+  for (let i = 0; i < pairs.length; i += BATCH_SIZE) {
+    const values = pairs
+      .slice(i, i + BATCH_SIZE)
+      .map(({ userId, courseId }) => Prisma.sql`(${userId}, ${courseId})`);
+    await refreshTargets(Prisma.sql`SELECT * FROM (VALUES ${Prisma.join(values)}) AS v(user_id, course_id)`);
+  }
+};
+
+const refreshCourse = (courseId) =>
+  refreshTargets(Prisma.sql`
+    SELECT user_id, course_id FROM course_enrollments WHERE course_id = ${courseId}`);
+
+const markDirty = (userId, courseId) => {
+  if (!dirty.has(userId)) {
+    dirty.set(userId, new Set());
+  }
+  dirty.get(userId).add(courseId);
+};
+
+const markCourseDirty = (courseId) => {
+  dirtyCourses.add(courseId);
+};
+
+const flush = async () => {
+  while (flushing) {
+    await flushing;
+  }
+  if (dirty.size === 0 && dirtyCourses.size === 0) {
+    return;
+  }
+
+  const users = dirty;
+  const courses = dirtyCourses;
+  dirty = new Map();
+  dirtyCourses = new Set();
+
+  flushing = (async () => {
+    const pairs = [...users].flatMap(([userId, courseIds]) =>
+      [...courseIds].filter((courseId) => !courses.has(courseId)).map((courseId) => ({ userId, courseId }))
+    );
+
+    try {
+      await refreshPairs(pairs);
+      for (const courseId of courses) {
+        await refreshCourse(courseId);
+      }
+    } catch (error) {
+      logger.error('Failed to refresh progress summaries:', error);
+      // Put everything back; the next interval retries
+      for (const { userId, courseId } of pairs) markDirty(userId, courseId);
+      for (const courseId of courses) markCourseDirty(courseId);
+    }
+  })();
+
+  try {
+    await flushing;
+  } finally {
+    flushing = null;
+  }
+};
+
+// Read-your-writes for the dashboard: refresh this user's pending rows now
+const flushUser = async (userId) => {
+  const courseIds = dirty.get(userId);
+  if (!courseIds) {
+    return;
+  }
+
+  dirty.delete(userId);
+  try {
+    await refreshPairs([...courseIds].map((courseId) => ({ userId, courseId })));
+  } catch (error) {
+    // Serve the previous rows; the interval flush retries
+    logger.error(`Failed to refresh progress summaries for user ${userId}:`, error);
+    courseIds.forEach((courseId) => markDirty(userId, courseId));
+  }
+};
+
+// Recompute every enrolled student's row, keyset-paginated over enrollments,
+// then drop rows for students no longer enrolled
+const rebuildAll = async ({ onBatch } = {}) => {
+  let cursor = null;
+  let rows = 0;
+
+  for (;;) {
+    const enrollments = await prisma.courseEnrollment.findMany({
+      where: {
+        enrollmentStatus: 'enrolled',
+        ...(cursor && { id: { gt: cursor } }),
+      },
+      select: {
+        id: true,
+        userId: true,
+        courseId: true,
+      },
+      orderBy: {
+        id: 'asc',
+      },
+      take: BATCH_SIZE,
+    });
+
+    if (enrollments.length === 0) {
+      break;
+    }
+
+    await refreshPairs(enrollments);
+    rows += enrollments.length;
+    if (onBatch) onBatch(rows);
+
+    cursor = enrollments[enrollments.length - 1].id;
+  }
+
+  const pruned = await prisma.$executeRaw`
+    DELETE FROM course_progress_summaries cps
+    WHERE NOT EXISTS (
+      SELECT 1 FROM course_enrollments e
+      WHERE e.user_id = cps.user_id AND e.course_id = cps.course_id AND e.enrollment_status = 'enrolled'
+    )`;
+
+  return { rows, pruned };
+};
+
+// One indexed lookup on (user_id, course_id), joined to the course by key
+const getDashboard = async (userId) => {
+  await flushUser(userId);
+
+  return prisma.$queryRaw`
+    SELECT c.id AS "courseId", c.code, c.title, c.term,
+           cps.content_total AS "contentTotal", cps.content_completed AS "contentCompleted",
+           cps.completion_percentage AS "completionPercentage",
+           cps.assignments_total AS "assignmentsTotal", cps.assignments_submitted AS "assignmentsSubmitted",
+           cps.assignments_graded AS "assignmentsGraded",
+           cps.points_earned AS "pointsEarned", cps.points_possible AS "pointsPossible",
+           cps.late_count AS "lateCount", cps.last_activity_at AS "lastActivityAt",
+           cps.updated_at AS "updatedAt"
+    FROM course_progress_summaries cps
+    JOIN courses c ON c.id = cps.course_id AND c.deleted_at IS NULL
+    WHERE cps.user_id = ${userId}
+    ORDER BY cps.last_activity_at DESC NULLS LAST, c.code`;
+};
+
+const timer = setInterval(() => {
+  flush().catch((error) => logger.error('Failed to refresh progress summaries:', error));
+}, FLUSH_INTERVAL_MS);
+timer.unref();
+
+onShutdown(flush);
+
+module.exports = {
+  markDirty,
+  markCourseDirty,
+  flush,
+  rebuildAll,
+  getDashboard,
+};
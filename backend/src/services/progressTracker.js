@@ -0,0 +1,267 @@
+const { Prisma } = require('@prisma/client');
+const prisma = require('../config/database');
+const logger = require('../utils/logger');
+const LRUCache = require('../utils/lruCache');
+const { onShutdown } = require('../utils/shutdown');
+const { detached } = require('../utils/metrics');
+const progressSummary = require('./progressSummary');
+
+// Write-behind ingestion for ContentProgress heartbeats. Players report
+// position and watch time every few seconds; heartbeats are merged per
+// (user, content) in memory and written with one
+// INSERT ... ON CONFLICT DO UPDATE per batch. Merges are monotonic, in
+// memory and in SQL: the furthest position and highest completion win,
+// watch time is summed and completion is never undone.
+const FLUSH_INTERVAL_MS = parseInt(process.env.PROGRESS_FLUSH_INTERVAL_MS) || 2000;
+const FLUSH_BATCH_SIZE = parseInt(process.env.PROGRESS_FLUSH_BATCH_SIZE) || 1000;
+const MAX_BUFFERED = FLUSH_BATCH_SIZE * 20;
+// Watch time is credited at most at wall-clock rate, with this much slack
+// for heartbeats batched client-side
+const MAX_HEARTBEAT_SECONDS = parseInt(process.env.PROGRESS_MAX_HEARTBEAT_SECONDS) || 300;
+const MAX_INT = 2147483647;
+
+// contentId -> courseId, for validating heartbeats and marking summaries
+const contentCourses = new LRUCache({ maxEntries: 50000, ttlMs: 10 * 60 * 1000 });
+// `${userId}:${courseId}` -> whether the user is enrolled in or teaches it
+const courseAccess = new LRUCache({ maxEntries: 50000, ttlMs: 60 * 1000 });
+// `${userId}:${contentId}` -> { seconds, at }: watch time that can still be
+// claimed, refilled at one second per second up to MAX_HEARTBEAT_SECONDS
+const watchBudgets = new LRUCache({ maxEntries: 100000, ttlMs: 10 * 60 * 1000 });
+
+// `${userId}:${contentId}` -> merged progress not yet written
+let buffer = new Map();
+let flushing = null;
+const totals = { heartbeats: 0, rejected: 0, secondsCredited: 0, rowsWritten: 0, flushes: 0, dropped: 0 };
+
+const clampInt = (value, min, max) => {
+  const number = Math.round(Number(value));
+  return Number.isFinite(number) ? Math.min(Math.max(number, min), max) : null;
+};
+
+const merge = (current, next) => {
+  if (!current) {
+    return next;
+  }
+
+  return {
+    ...current,
+    lastPosition:
+      current.lastPosition === null || next.lastPosition === null
+        ? current.lastPosition ?? next.lastPosition
+        : Math.max(current.lastPosition, next.lastPosition),
+    completionPercentage: Math.max(current.completionPercentage, next.completionPercentage),
+    timeSpentSeconds: current.timeSpentSeconds + next.timeSpentSeconds,
+    isCompleted: current.isCompleted || next.isCompleted,
+    completedAt: current.completedAt || next.completedAt,
+    firstAccessedAt: current.firstAccessedAt < next.firstAccessedAt ? current.firstAccessedAt : next.firstAccessedAt,
+    lastAccessedAt: current.lastAccessedAt > next.lastAccessedAt ? current.lastAccessedAt : next.lastAccessedAt,
+  };
+};
+
+// Resolve content ids to course ids, from cache or with one query
+const resolveCourses = async (contentIds) => {
+  const missing = contentIds.filter((id) => contentCourses.get(id) === undefined);
+
+  if (missing.length > 0) {
+    const contents = await prisma.moduleContent.findMany({
+      where: {
+        id: { in: missing },
+        deletedAt: null,
+      },
+      select: {
+        id: true,
+        module: {
+          select: {
+            courseId: true,
+          },
+        },
+      },
+    });
+    contents.forEach((content) => contentCourses.set(content.id, content.module.courseId));
+  }
+
+  return new Map(contentIds.map((id) => [id, contentCourses.get(id)]).filter(([, courseId]) => courseId));
+};
+
+// Course ids the user is enrolled in or teaches, from cache or with one query
+const accessibleCourses = async (userId, courseIds) => {
+  const missing = courseIds.filter((courseId) => courseAccess.get(`${userId}:${courseId}`) === undefined);
+
+  if (missing.length > 0) {
+    const allowed = await prisma.course.findMany({
+      where: {
+        id: { in: missing },
+        OR: [{ instructorId: userId }, { enrollments: { some: { userId, enrollmentStatus: 'enrolled' } } }],
+      },
+      select: { id: true },
+    });
+    const allowedIds = new Set(allowed.map(({ id }) => id));
+    missing.forEach((courseId) => courseAccess.set(`${userId}:${courseId}`, allowedIds.has(courseId)));
+  }
+
+  return new Set(courseIds.filter((courseId) => courseAccess.get(`${userId}:${courseId}`)));
+};
+
+// Grant up to `requested` seconds from the (user, content) budget, so
+// repeated heartbeats can not claim more than the time that has passed
+const takeWatchTime = (key, requested, now) => {
+  const budget = watchBudgets.get(key);
+  const available = budget
+    ? Math.min(MAX_HEARTBEAT_SECONDS, budget.seconds + (now - budget.at) / 1000)
+    : MAX_HEARTBEAT_SECONDS;
+  const granted = Math.min(requested, Math.floor(available));
+  watchBudgets.set(key, { seconds: available - granted, at: now });
+  totals.secondsCredited += granted;
+  return granted;
+};
+
+// heartbeats: [{ contentId, position, secondsSpent, completionPercentage, completed }]
+// Heartbeats for content outside the user's courses are rejected.
+const recordHeartbeats = async (userId, heartbeats) => {
+  const courses = await resolveCourses([...new Set(heartbeats.map((heartbeat) => heartbeat.contentId))]);
+  const allowed = await accessibleCourses(userId, [...new Set(courses.values())]);
+  const now = new Date();
+  let accepted = 0;
+
+  for (const heartbeat of heartbeats) {
+    const courseId = courses.get(heartbeat.contentId);
+    if (!courseId || !allowed.has(courseId)) {
+      continue;
+    }
+
+    const completionPercentage = clampInt(heartbeat.completionPercentage, 0, 100) ?? 0;
+    const isCompleted = heartbeat.completed === true || completionPercentage === 100;
+    const key = `${userId}:${heartbeat.contentId}`;
+
+    if (!buffer.has(key) && buffer.size >= MAX_BUFFERED) {
+      totals.dropped++;
+      continue;
+    }
+
+    buffer.set(
+      key,
+      merge(buffer.get(key), {
+        userId,
+        contentId: heartbeat.contentId,
+        courseId,
+        lastPosition: clampInt(heartbeat.position, 0, MAX_INT),
+        completionPercentage,
+        timeSpentSeconds: takeWatchTime(key, clampInt(heartbeat.secondsSpent, 0, MAX_HEARTBEAT_SECONDS) ?? 0, now),
+        isCompleted,
+        completedAt: isCompleted ? now : null,
+        firstAccessedAt: now,
+        lastAccessedAt: now,
+      })
+    );
+    accepted++;
+  }
+
+  totals.heartbeats += accepted;
+  totals.rejected += heartbeats.length - accepted;
+
+  if (buffer.size >= FLUSH_BATCH_SIZE) {
+    detached(flush).catch((error) => logger.error('Failed to flush content progress:', error));
+  }
+
+  return { accepted, rejected: heartbeats.length - accepted };
+};
+
+const upsertChunk = (chunk) => {
+  const rows = chunk.map(
+    (entry) => Prisma.sql`(
+      gen_random_uuid(), ${entry.userId}, ${entry.contentId}, ${entry.completionPercentage}::int,
+      ${entry.lastPosition}::int, ${entry.isCompleted}, ${entry.completedAt}::timestamp,
+      ${entry.timeSpentSeconds}::int, ${entry.firstAccessedAt}::timestamp, ${entry.lastAccessedAt}::timestamp, now()
+    )`
+  );
+
+  return prisma.$executeRaw`
+    INSERT INTO content_progress (id, user_id, content_id, completion_percentage, last_position, is_completed,
+                                  completed_at, time_spent_seconds, first_accessed_at, last_accessed_at, updated_at)
+    VALUES ${Prisma.join(rows)}
+    ON CONFLICT (user_id, content_id) DO UPDATE SET
+      completion_percentage = GREATEST(content_progress.completion_percentage, EXCLUDED.completion_percentage),
+      last_position = GREATEST(content_progress.last_position, EXCLUDED.last_position),
+      is_completed = content_progress.is_completed OR EXCLUDED.is_completed,
+      completed_at = COALESCE(content_progress.completed_at, EXCLUDED.completed_at),
+      time_spent_seconds = content_progress.time_spent_seconds + EXCLUDED.time_spent_seconds,
+      first_accessed_at = LEAST(content_progress.first_accessed_at, EXCLUDED.first_accessed_at),
+      last_accessed_at = GREATEST(content_progress.last_accessed_at, EXCLUDED.last_accessed_at),
+      updated_at = EXCLUDED.updated_at`;
+};
+
+const flush = async () => {
+  while (flushing) {
+    await flushing;
+  }
+  if (buffer.size === 0) {
+    return;
+  }
+
+  const batch = buffer;
+  buffer = new Map();
+
+  flushing = (async () => {
+    const entries = [...batch.values()];
+
+    for (let i = 0; i < entries.length; i += FLUSH_BATCH_SIZE) {
+      const chunk = entries.slice(i, i + FLUSH_BATCH_SIZE);
+      try {
+        await upsertChunk(chunk);
+        totals.rowsWritten += chunk.length;
+        // Completion feeds the dashboard rollup
+        chunk
+          .filter((entry) => entry.isCompleted)
+          .forEach((entry) => progressSummary.markDirty(entry.userId, entry.courseId));
+      } catch (error) {
+        logger.error('Failed to flush content progress:', error);
+        // Foreign key failures (deleted user/content) would fail forever
+        if (error.meta?.code !== '23503') {
+          requeue(chunk);
+        }
+      }
+    }
+    totals.flushes++;
+  })();
+
+  try {
+    await flushing;
+  } finally {
+    flushing = null;
+  }
+};
+
+// Merge a failed chunk back in with anything that arrived meanwhile
+const requeue = (entries) => {
+  for (const entry of entries) {
+    const key = `${entry.userId}:${entry.contentId}`;
+    if (!buffer.has(key) && buffer.size >= MAX_BUFFERED) {
+      totals.dropped++;
+      continue;
+    }
+    buffer.set(key, buffer.has(key) ? merge(entry, buffer.get(key)) : entry);
+  }
+};
+
+const getStats = () => ({
+  ...totals,
+  buffered: buffer.size,
+});
+
+const timer = setInterval(() => {
+  flush().catch((error) => logger.error('Failed to flush content progress:', error));
+}, FLUSH_INTERVAL_MS);
+timer.unref();
+
+// The summary service registered its own hook first, so refresh the rows
+// this final flush marked dirty here
+onShutdown(async () => {
+  await flush();
+  await progressSummary.flush();
+});
+
+module.exports = {
+  recordHeartbeats,
+  flush,
+  getStats,
+};
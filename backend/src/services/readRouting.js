@@ -0,0 +1,71 @@
+const prisma = require('../config/database');
+const replica = require('../config/replica');
+const LRUCache = require('../utils/lruCache');
+const clusterBus = require('../utils/clusterBus');
+
+// Routes read-only controller queries to the replica, except for users who
+// changed something within the last STICKY_MS: their reads stay on the
+// primary so they always see their own writes despite replication lag.
+// STICKY_MS should exceed the worst expected replication lag. Writes are
+// tracked per process and shared with other cluster workers.
+const STICKY_MS = parseInt(process.env.DB_REPLICA_STICKY_MS) || 5000;
+const SAFE_METHODS = new Set(['GET', 'HEAD', 'OPTIONS']);
+
+// userId -> true while their recent write may not have replicated yet
+const recentWriters = new LRUCache({ maxEntries: 100000, ttlMs: STICKY_MS });
+const totals = { replica: 0, primary: 0, sticky: 0 };
+
+const pinToPrimary = (userId) => {
+  recentWriters.set(userId, true);
+};
+
+const recordWrite = (userId) => {
+  pinToPrimary(userId);
+  clusterBus.publish('readRouting:write', userId);
+};
+
+clusterBus.subscribe('readRouting:write', pinToPrimary);
+
+// Client to use for a read-only query on behalf of `req`
+const forRead = (req) => {
+  if (!replica) {
+    totals.primary++;
+    return prisma;
+  }
+
+  if (req.user && recentWriters.get(req.user.userId)) {
+    totals.sticky++;
+    return prisma;
+  }
+
+  totals.replica++;
+  return replica;
+};
+
+// Express middleware: any mutating request pins the user to the primary.
+// req.user is only known once the router's authenticate has run, so the
+// mark is made as the response finishes, before the client can issue its
+// next request.
+const trackWrites = (req, res, next) => {
+  if (replica && !SAFE_METHODS.has(req.method)) {
+    res.once('finish', () => {
+      if (req.user) {
+        recordWrite(req.user.userId);
+      }
+    });
+  }
+  next();
+};
+
+const getStats = () => ({
+  replicaConfigured: replica !== null,
+  stickyMs: STICKY_MS,
+  reads: { ...totals },
+});
+
+module.exports = {
+  forRead,
+  recordWrite,
+  trackWrites,
+  getStats,
+};
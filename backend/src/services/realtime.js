@@ -0,0 +1,105 @@
+const { Server } = require('socket.io');
+const logger = require('../utils/logger');
+const clusterBus = require('../utils/clusterBus');
+const { verifyToken, getPrincipal } = require('./authCache');
+
+// WebSocket push channel. Each authenticated socket joins `user:<id>`, and
+// server code publishes to those rooms with emitToUser(). Pass a socket.io
+// adapter (e.g. a Redis adapter) to attach() to share rooms across processes;
+// without one, cluster workers relay emits to each other over the cluster bus.
+let io = null;
+let hasAdapter = false;
+
+const userRoom = (userId) => `user:${userId}`;
+
+// Same token and account checks as middleware/auth.js
+const authenticateSocket = async (socket, next) => {
+  try {
+    const header = socket.handshake.headers.authorization;
+    const token =
+      socket.handshake.auth?.token ||
+      (header && header.startsWith('Bearer ') ? header.split(' ')[1] : null);
+
+    if (!token) {
+      return next(new Error('No token provided'));
+    }
+
+    const decoded = verifyToken(token);
+    const user = await getPrincipal(decoded.userId);
+
+    if (!user || !user.isActive || user.isSuspended) {
+      return next(new Error('User account is inactive or suspended'));
+    }
+
+    socket.data.userId = user.id;
+    next();
+  } catch (error) {
+    if (error.name === 'TokenExpiredError') {
+      return next(new Error('Token expired'));
+    }
+    if (error.name === 'JsonWebTokenError') {
+      return next(new Error('Invalid token'));
+    }
+    next(error);
+  }
+};
+
+// transports: pass ['websocket'] behind a load balancer without sticky
+// sessions, since long-polling needs every request on the same process
+const attach = (httpServer, { origins, adapter, transports } = {}) => {
+  io = new Server(httpServer, {
+    cors: {
+      origin: origins,
+      credentials: true,
+    },
+    ...(transports && { transports }),
+  });
+
+  if (adapter) {
+    io.adapter(adapter);
+    hasAdapter = true;
+  }
+
+  io.use(authenticateSocket);
+
+  io.on('connection', (socket) => {
+    socket.join(userRoom(socket.data.userId));
+    logger.debug(`Socket connected for user ${socket.data.userId}`);
+  });
+
+  return io;
+};
+
+const emitLocal = (userId, event, payload) => {
+  if (io) {
+    io.to(userRoom(userId)).emit(event, payload);
+  }
+};
+
+const emitToUser = (userId, event, payload) => {
+  emitLocal(userId, event, payload);
+  if (!hasAdapter) {
+    clusterBus.publish('realtime:emit', userId, event, payload);
+  }
+};
+
+clusterBus.subscribe('realtime:emit', emitLocal);
+
+// Close every socket on shutdown; clients reconnect to another process
+const disconnectAll = () => {
+  if (io) {
+    io.disconnectSockets(true);
+  }
+};
+
+const getStats = () => ({
+  enabled: Boolean(io),
+  connections: io ? io.engine.clientsCount : 0,
+});
+
+module.exports = {
+  attach,
+  emitToUser,
+  disconnectAll,
+  getStats,
+};
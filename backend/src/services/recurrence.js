@@ -0,0 +1,181 @@
+// Expansion of CalendarEvent.recurrenceRule (an RFC 5545 RRULE subset:
+// FREQ=DAILY|WEEKLY|MONTHLY|YEARLY with INTERVAL, COUNT, UNTIL, BYDAY and
+// BYMONTHDAY) into the occurrences that overlap a date window. Open-ended
+// rules jump straight to the period containing the window instead of
+// walking from the series start; rules with COUNT are walked from the start,
+// since skipped occurrences still count. Times are expanded in UTC.
+const DAY_MS = 24 * 60 * 60 * 1000;
+const WEEK_MS = 7 * DAY_MS;
+// Hard cap on occurrences produced per event per call
+const MAX_OCCURRENCES = 5000;
+const WEEKDAYS = ['SU', 'MO', 'TU', 'WE', 'TH', 'FR', 'SA'];
+const FREQUENCIES = ['DAILY', 'WEEKLY', 'MONTHLY', 'YEARLY'];
+
+// '20241215' or '20241215T235959Z'
+const parseDate = (value) => {
+  const match = /^(\d{4})(\d{2})(\d{2})(?:T(\d{2})(\d{2})(\d{2})Z?)?$/.exec(value);
+  if (!match) {
+    return null;
+  }
+  const [, year, month, day, hour = '23', minute = '59', second = '59'] = match;
+  return new Date(Date.UTC(+year, +month - 1, +day, +hour, +minute, +second));
+};
+
+// Returns null for rules this engine can not expand
+const parseRule = (rule) => {
+  const parts = Object.fromEntries(
+    String(rule)
+      .replace(/^RRULE:/i, '')
+      .split(';')
+      .filter(Boolean)
+      .map((part) => {
+        const [key, value = ''] = part.split('=');
+        return [key.trim().toUpperCase(), value.trim().toUpperCase()];
+      })
+  );
+
+  if (!FREQUENCIES.includes(parts.FREQ)) {
+    return null;
+  }
+
+  const byDay = parts.BYDAY ? parts.BYDAY.split(',').map((day) => WEEKDAYS.indexOf(day)) : null;
+  // Ordinal weekdays (e.g. 2TU) are not supported
+  if (byDay && byDay.includes(-1)) {
+    return null;
+  }
+
+  const byMonthDay = parts.BYMONTHDAY ? parts.BYMONTHDAY.split(',').map(Number) : null;
+  if (byMonthDay && byMonthDay.some((day) => !Number.isInteger(day) || day < 1 || day > 31)) {
+    return null;
+  }
+
+  return {
+    freq: parts.FREQ,
+    interval: Math.max(parseInt(parts.INTERVAL) || 1, 1),
+    count: parts.COUNT ? parseInt(parts.COUNT) : null,
+    until: parts.UNTIL ? parseDate(parts.UNTIL) : null,
+    byDay: byDay ? [...new Set(byDay)].sort((a, b) => a - b) : null,
+    byMonthDay,
+  };
+};
+
+const startOfUtcDay = (ms) => ms - (((ms % DAY_MS) + DAY_MS) % DAY_MS);
+
+// Candidate start times in period `k`, ascending
+const periodCandidates = (rule, start, k) => {
+  const timeOfDay = start.getTime() - startOfUtcDay(start.getTime());
+
+  switch (rule.freq) {
+    case 'DAILY': {
+      const day = startOfUtcDay(start.getTime()) + k * rule.interval * DAY_MS;
+      const weekday = new Date(day).getUTCDay();
+      return !rule.byDay || rule.byDay.includes(weekday) ? [day + timeOfDay] : [];
+    }
+    case 'WEEKLY': {
+      // Weeks start on Monday (RFC 5545 default WKST)
+      const dayStart = startOfUtcDay(start.getTime());
+      const weekStart = dayStart - ((start.getUTCDay() + 6) % 7) * DAY_MS + k * rule.interval * WEEK_MS;
+      const days = rule.byDay || [start.getUTCDay()];
+      return days
+        .map((weekday) => weekStart + ((weekday + 6) % 7) * DAY_MS + timeOfDay)
+        .sort((a, b) => a - b);
+    }
+    case 'MONTHLY': {
+      const months = start.getUTCMonth() + k * rule.interval;
+      const year = start.getUTCFullYear() + Math.floor(months / 12);
+      const month = ((months % 12) + 12) % 12;
+      const days = rule.byMonthDay || [start.getUTCDate()];
+      return days
+        .map((day) => Date.UTC(year, month, day) + timeOfDay)
+        // Skip days the month does not have (e.g. the 31st rolls over)
+        .filter((ms) => new Date(ms).getUTCMonth() === month)
+        .sort((a, b) => a - b);
+    }
+    default: {
+      // YEARLY: same month and day; Feb 29 only occurs in leap years
+      const year = start.getUTCFullYear() + k * rule.interval;
+      const ms = Date.UTC(year, start.getUTCMonth(), start.getUTCDate()) + timeOfDay;
+      return new Date(ms).getUTCMonth() === start.getUTCMonth() ? [ms] : [];
+    }
+  }
+};
+
+// First period that can overlap a window starting at `from`
+const firstPeriod = (rule, start, from) => {
+  if (rule.count !== null || from <= start.getTime()) {
+    return 0;
+  }
+
+  const elapsed = from - start.getTime();
+  switch (rule.freq) {
+    case 'DAILY':
+      return Math.floor(elapsed / (rule.interval * DAY_MS));
+    case 'WEEKLY':
+      return Math.floor(elapsed / (rule.interval * WEEK_MS));
+    case 'MONTHLY': {
+      const fromDate = new Date(from);
+      const months =
+        (fromDate.getUTCFullYear() - start.getUTCFullYear()) * 12 + fromDate.getUTCMonth() - start.getUTCMonth();
+      return Math.floor(months / rule.interval);
+    }
+    default:
+      return Math.floor((new Date(from).getUTCFullYear() - start.getUTCFullYear()) / rule.interval);
+  }
+};
+
+// Occurrences of an event overlapping [from, to), as [{ start, end }] Dates.
+// `durationMs` extends each occurrence (endDate - startDate of the series).
+const expand = ({ startDate, recurrenceRule, durationMs = 0 }, from, to) => {
+  const start = new Date(startDate);
+  const rule = recurrenceRule ? parseRule(recurrenceRule) : null;
+  const windowStart = from.getTime();
+  const windowEnd = to.getTime();
+  const overlaps = (ms) => ms < windowEnd && ms + durationMs >= windowStart && (durationMs > 0 || ms >= windowStart);
+
+  // One-off events, and rules we can not expand, occur once
+  if (!rule) {
+    return overlaps(start.getTime()) ? [{ start, end: new Date(start.getTime() + durationMs) }] : [];
+  }
+
+  const occurrences = [];
+  const last = Math.min(windowEnd, rule.until ? rule.until.getTime() + 1 : Infinity);
+  let seen = 0;
+  let emptyPeriods = 0;
+
+  // Back off one period so occurrences that started before the window but
+  // are still running are included
+  for (let k = Math.max(firstPeriod(rule, start, windowStart - durationMs) - 1, 0); ; k++) {
+    const candidates = periodCandidates(rule, start, k);
+    if (candidates.length > 0 && candidates[0] >= last) {
+      break;
+    }
+    // Rules that never produce a date (e.g. BYMONTHDAY=30 every February)
+    emptyPeriods = candidates.length === 0 ? emptyPeriods + 1 : 0;
+    if (emptyPeriods > 1000) {
+      break;
+    }
+
+    for (const ms of candidates) {
+      if (ms < start.getTime() || ms >= last) {
+        continue;
+      }
+      seen++;
+      if (rule.count !== null && seen > rule.count) {
+        return occurrences;
+      }
+      if (overlaps(ms)) {
+        occurrences.push({ start: new Date(ms), end: new Date(ms + durationMs) });
+        if (occurrences.length >= MAX_OCCURRENCES) {
+          return occurrences;
+        }
+      }
+    }
+  }
+
+  return occurrences;
+};
+
+module.exports = {
+  parseRule,
+  expand,
+};
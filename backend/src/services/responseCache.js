@@ -0,0 +1,104 @@
+const crypto = require('crypto');
+const LRUCache = require('../utils/lruCache');
+const clusterBus = require('../utils/clusterBus');
+
+// Serialized-response cache for read-heavy endpoints. Each entry is keyed by
+// the current version of every resource it was built from (e.g.
+// `course:<id>`), so invalidate() only has to bump a version number; stale
+// entries are never looked up again and age out of the LRU.
+const MAX_ENTRIES = parseInt(process.env.RESPONSE_CACHE_MAX_ENTRIES) || 5000;
+const TTL_MS = parseInt(process.env.RESPONSE_CACHE_TTL_MS) || 5 * 60 * 1000;
+// Resources whose version is tracked individually; see bumpVersions
+const MAX_VERSIONS = parseInt(process.env.RESPONSE_CACHE_MAX_VERSIONS) || MAX_ENTRIES * 10;
+
+const cache = new LRUCache({ maxEntries: MAX_ENTRIES, ttlMs: TTL_MS });
+const versions = new Map();
+let clock = 0;
+// Version of every resource not in `versions`
+let floor = 0;
+let notModified = 0;
+
+const cacheKey = (resources, variant) =>
+  `${resources.map((resource) => `${resource}@${versions.get(resource) ?? floor}`).join('|')}#${variant}`;
+
+// Return the cached entry for (resources, variant), building it with
+// loader() on a miss. Returns null without caching when loader() does.
+// `meta` extracts anything the handler still needs from the data on a hit.
+const load = async (resources, variant, loader, { ttlMs = TTL_MS, meta } = {}) => {
+  const key = cacheKey(resources, variant);
+  const cached = cache.get(key);
+  if (cached) {
+    return cached;
+  }
+
+  const data = await loader();
+  if (data === null || data === undefined) {
+    return null;
+  }
+
+  const body = JSON.stringify(data);
+  const entry = {
+    body,
+    etag: `"${crypto.createHash('sha1').update(body).digest('base64')}"`,
+    meta: meta ? meta(data) : undefined,
+  };
+
+  // Only store if nothing was invalidated while the loader ran
+  if (cacheKey(resources, variant) === key) {
+    cache.set(key, entry, ttlMs);
+  }
+
+  return entry;
+};
+
+// Send a cached entry, answering 304 when If-None-Match matches
+const send = (req, res, entry) => {
+  res.set('ETag', entry.etag);
+  res.set('Cache-Control', 'private, no-cache');
+
+  if (req.fresh) {
+    notModified++;
+    return res.status(304).end();
+  }
+
+  res.type('json').send(entry.body);
+};
+
+// Versions are kept for the MAX_VERSIONS most recently invalidated
+// resources. Dropping one raises the floor to its version, which moves every
+// untracked resource past anything cached for it: a few extra misses, never
+// a stale hit.
+const bumpVersions = (...resources) => {
+  for (const resource of resources) {
+    versions.delete(resource);
+    versions.set(resource, ++clock);
+  }
+
+  while (versions.size > MAX_VERSIONS) {
+    const [oldest, version] = versions.entries().next().value;
+    versions.delete(oldest);
+    floor = Math.max(floor, version);
+  }
+};
+
+// Other cluster workers bump their own versions for the same resources
+const invalidate = (...resources) => {
+  bumpVersions(...resources);
+  clusterBus.publish('responseCache:invalidate', ...resources);
+};
+
+clusterBus.subscribe('responseCache:invalidate', bumpVersions);
+
+const getStats = () => ({
+  ...cache.stats(),
+  notModified,
+  trackedResources: versions.size,
+  versionFloor: floor,
+});
+
+module.exports = {
+  load,
+  send,
+  invalidate,
+  getStats,
+};
@@ -0,0 +1,256 @@
+const { Prisma } = require('@prisma/client');
+const prisma = require('../config/database');
+const logger = require('../utils/logger');
+const { onShutdown } = require('../utils/shutdown');
+
+// Full-text search over search_documents, one row per course, announcement,
+// assignment and module content. Each row carries a weighted tsvector
+// (title 'A', body 'B') under a GIN index, plus the course and student
+// visibility needed to filter results. Writes mark entities dirty; dirty
+// rows are rebuilt from their source tables in batches, one
+// INSERT ... SELECT ... ON CONFLICT per batch, and rows whose source was
+// deleted are removed.
+const FLUSH_INTERVAL_MS = parseInt(process.env.SEARCH_FLUSH_INTERVAL_MS) || 1000;
+const BATCH_SIZE = parseInt(process.env.SEARCH_REFRESH_BATCH_SIZE) || 500;
+const MAX_LIMIT = 50;
+const CONFIG = 'english';
+
+// Each source selects (id, course_id, title, body, is_visible, visible_until)
+// for the given ids, skipping soft-deleted rows
+const SOURCES = {
+  course: {
+    model: 'course',
+    select: (ids) => Prisma.sql`
+      SELECT c.id, c.id AS course_id, c.code || ' ' || c.title AS title, c.description AS body,
+             TRUE AS is_visible, NULL::timestamp AS visible_until
+      FROM courses c
+      WHERE c.id IN (${Prisma.join(ids)}) AND c.deleted_at IS NULL`,
+  },
+  announcement: {
+    model: 'announcement',
+    select: (ids) => Prisma.sql`
+      SELECT a.id, a.course_id, a.title, a.content AS body, a.is_published AS is_visible,
+             a.expires_at AS visible_until
+      FROM announcements a
+      WHERE a.id IN (${Prisma.join(ids)}) AND a.deleted_at IS NULL`,
+  },
+  assignment: {
+    model: 'assignment',
+    select: (ids) => Prisma.sql`
+      SELECT a.id, a.course_id, a.title, concat_ws(' ', a.description, a.instructions) AS body,
+             a.is_published AS is_visible, NULL::timestamp AS visible_until
+      FROM assignments a
+      WHERE a.id IN (${Prisma.join(ids)}) AND a.deleted_at IS NULL`,
+  },
+  content: {
+    model: 'moduleContent',
+    select: (ids) => Prisma.sql`
+      SELECT mc.id, m.course_id, mc.title, concat_ws(' ', m.title, mc.description) AS body,
+             mc.is_published AND m.is_published AS is_visible, NULL::timestamp AS visible_until
+      FROM module_contents mc
+      JOIN modules m ON m.id = mc.module_id AND m.deleted_at IS NULL
+      WHERE mc.id IN (${Prisma.join(ids)}) AND mc.deleted_at IS NULL`,
+  },
+};
+
+// entityType -> Set of ids awaiting a refresh
+let dirty = new Map();
+let flushing = null;
+const totals = { refreshed: 0, flushes: 0, queries: 0 };
+
+const upsertSql = (entityType, ids) => Prisma.sql`
+  INSERT INTO search_documents (id, entity_type, entity_id, course_id, title, body, is_visible,
+                                visible_until, search_vector, updated_at)
+  SELECT gen_random_uuid(), ${entityType}, s.id, s.course_id, s.title, s.body, s.is_visible, s.visible_until,
+         setweight(to_tsvector(${CONFIG}::regconfig, coalesce(s.title, '')), 'A') ||
+         setweight(to_tsvector(${CONFIG}::regconfig, coalesce(s.body, '')), 'B'),
+         now()
+  FROM (${SOURCES[entityType].select(ids)}) s
+  ON CONFLICT (entity_type, entity_id) DO UPDATE SET
+    course_id = EXCLUDED.course_id,
+    title = EXCLUDED.title,
+    body = EXCLUDED.body,
+    is_visible = EXCLUDED.is_visible,
+    visible_until = EXCLUDED.visible_until,
+    search_vector = EXCLUDED.search_vector,
+    updated_at = EXCLUDED.updated_at`;
+
+// Deleted (or soft-deleted) sources lose their document
+const pruneSql = (entityType, ids) => Prisma.sql`
+  DELETE FROM search_documents sd
+  WHERE sd.entity_type = ${entityType} AND sd.entity_id IN (${Prisma.join(ids)})
+    AND sd.entity_id NOT IN (SELECT s.id FROM (${SOURCES[entityType].select(ids)}) s)`;
+
+const refresh = async (entityType, ids) => {
+  for (let i = 0; i < ids.length; i += BATCH_SIZE) {
+    const chunk = ids.slice(i, i + BATCH_SIZE);
+    await prisma.$transaction([
+      prisma.$executeRaw(upsertSql(entityType, chunk)),
+      prisma.$executeRaw(pruneSql(entityType, chunk)),
+    ]);
+    totals.refreshed += chunk.length;
+  }
+};
+
+const markDirty = (entityType, id) => {
+  if (!dirty.has(entityType)) {
+    dirty.set(entityType, new Set());
+  }
+  dirty.get(entityType).add(id);
+};
+
+const flush = async () => {
+  while (flushing) {
+    await flushing;
+  }
+  if (dirty.size === 0) {
+    return;
+  }
+
+  const batch = dirty;
+  dirty = new Map();
+
+  flushing = (async () => {
+    for (const [entityType, ids] of batch) {
+      try {
+        await refresh(entityType, [...ids]);
+      } catch (error) {
+        logger.error(`Failed to refresh ${entityType} search documents:`, error);
+        // The next interval retries
+        ids.forEach((id) => markDirty(entityType, id));
+      }
+    }
+    totals.flushes++;
+  })();
+
+  try {
+    await flushing;
+  } finally {
+    flushing = null;
+  }
+};
+
+// Re-index every source row, keyset-paginated by id, then drop documents
+// whose course no longer exists
+const rebuildAll = async ({ types = Object.keys(SOURCES), onBatch } = {}) => {
+  let rows = 0;
+
+  for (const entityType of types) {
+    let cursor = null;
+
+    for (;;) {
+      const batch = await prisma[SOURCES[entityType].model].findMany({
+        where: {
+          deletedAt: null,
+          ...(cursor && { id: { gt: cursor } }),
+        },
+        select: { id: true },
+        orderBy: { id: 'asc' },
+        take: BATCH_SIZE,
+      });
+
+      if (batch.length === 0) {
+        break;
+      }
+
+      await refresh(entityType, batch.map(({ id }) => id));
+      rows += batch.length;
+      if (onBatch) onBatch(entityType, rows);
+
+      cursor = batch[batch.length - 1].id;
+    }
+  }
+
+  const pruned = await prisma.$executeRaw`
+    DELETE FROM search_documents sd
+    USING courses c
+    WHERE c.id = sd.course_id AND c.deleted_at IS NOT NULL`;
+
+  return { rows, pruned };
+};
+
+// Courses whose documents `user` may see. Staff (instructor or TA) see
+// unpublished documents too; enrolled students only published ones.
+const accessSql = ({ userId, role }) =>
+  role === 'admin'
+    ? Prisma.sql`SELECT c.id AS course_id, TRUE AS staff FROM courses c WHERE c.deleted_at IS NULL`
+    : Prisma.sql`
+        SELECT c.id AS course_id, TRUE AS staff
+        FROM courses c
+        WHERE c.instructor_id = ${userId} AND c.deleted_at IS NULL
+        UNION ALL
+        SELECT e.course_id, e.role = 'ta' AS staff
+        FROM course_enrollments e
+        JOIN courses c ON c.id = e.course_id AND c.deleted_at IS NULL
+        WHERE e.user_id = ${userId} AND e.enrollment_status = 'enrolled'`;
+
+// Ranked, paginated search. Ranks every match, pages, then builds
+// highlighted snippets for the returned page only (ts_headline re-parses
+// the text, so it is the expensive part).
+const search = async (db, user, { q, types, courseId, limit = 20, offset = 0 }) => {
+  const pageSize = Math.min(Math.max(parseInt(limit) || 20, 1), MAX_LIMIT);
+  const skip = Math.max(parseInt(offset) || 0, 0);
+  totals.queries++;
+
+  const filters = [
+    Prisma.sql`sd.search_vector @@ query`,
+    Prisma.sql`(a.staff OR (sd.is_visible AND (sd.visible_until IS NULL OR sd.visible_until > now())))`,
+  ];
+  if (types && types.length > 0) {
+    filters.push(Prisma.sql`sd.entity_type IN (${Prisma.join(types)})`);
+  }
+  if (courseId) {
+    filters.push(Prisma.sql`sd.course_id = ${courseId}`);
+  }
+
+  // One extra row tells whether there is a next page without counting
+  const rows = await db.$queryRaw`
+    WITH access AS (
+      SELECT course_id, bool_or(staff) AS staff FROM (${accessSql(user)}) x GROUP BY course_id
+    ),
+    page AS (
+      SELECT sd.entity_type, sd.entity_id, sd.course_id, sd.title, sd.body,
+             ts_rank_cd(sd.search_vector, query) AS rank, query
+      FROM search_documents sd
+      JOIN access a ON a.course_id = sd.course_id,
+           websearch_to_tsquery(${CONFIG}::regconfig, ${q}) query
+      WHERE ${Prisma.join(filters, ' AND ')}
+      ORDER BY rank DESC, sd.entity_id
+      LIMIT ${pageSize + 1} OFFSET ${skip}
+    )
+    SELECT p.entity_type AS "type", p.entity_id AS "id", p.course_id AS "courseId",
+           c.code AS "courseCode", p.title, p.rank::float8 AS "rank",
+           ts_headline(${CONFIG}::regconfig, coalesce(p.body, ''), p.query,
+                       'MaxWords=30, MinWords=10, MaxFragments=2') AS "snippet"
+    FROM page p
+    JOIN courses c ON c.id = p.course_id
+    ORDER BY p.rank DESC, p.entity_id`;
+
+  return {
+    results: rows.slice(0, pageSize),
+    limit: pageSize,
+    offset: skip,
+    hasMore: rows.length > pageSize,
+  };
+};
+
+const getStats = () => ({
+  ...totals,
+  pending: [...dirty.values()].reduce((sum, ids) => sum + ids.size, 0),
+});
+
+const timer = setInterval(() => {
+  flush().catch((error) => logger.error('Failed to refresh search documents:', error));
+}, FLUSH_INTERVAL_MS);
+timer.unref();
+
+onShutdown(flush);
+
+module.exports = {
+  ENTITY_TYPES: Object.keys(SOURCES),
+  markDirty,
+  flush,
+  rebuildAll,
+  search,
+  getStats,
+};
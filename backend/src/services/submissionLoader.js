@@ -0,0 +1,34 @@
+const prisma = require('../config/database');
+
+// Latest submission (highest submissionNumber) per assignment for one user,
+// fetched in a single query. Returns a Map of assignmentId -> submission.
+const loadLatestSubmissions = async (userId, assignmentIds, include = { grade: true }) => {
+  const latest = new Map();
+
+  if (assignmentIds.length === 0) {
+    return latest;
+  }
+
+  const submissions = await prisma.assignmentSubmission.findMany({
+    where: {
+      userId: userId,
+      assignmentId: { in: assignmentIds },
+    },
+    orderBy: {
+      submissionNumber: 'desc',
+    },
+    include,
+  });
+
+  for (const submission of submissions) {
+    if (!latest.has(submission.assignmentId)) {
+      latest.set(submission.assignmentId, submission);
+    }
+  }
+
+  return latest;
+};
+
+module.exports = {
+  loadLatestSubmissions,
+};
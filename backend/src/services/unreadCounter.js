@@ -0,0 +1,92 @@
+const prisma = require('../config/database');
+const LRUCache = require('../utils/lruCache');
+const clusterBus = require('../utils/clusterBus');
+
+// Per-user unread notification counts, so the count endpoint does not run
+// count(*) on every poll. Counts live in a pluggable store; the default is
+// process-local. Multi-process deployments can call setStore() with a
+// shared implementation of the same async interface (get, set, incrBy, del);
+// incrBy must keep the entry's expiry, so counts are recounted every TTL
+// even for users who keep receiving notifications.
+// In cluster mode the memory store stays per worker: a change made in one
+// worker drops the others' copies, which recount on their next read.
+const COUNT_TTL_MS = parseInt(process.env.UNREAD_COUNT_TTL_MS) || 5 * 60 * 1000;
+const MAX_USERS = parseInt(process.env.UNREAD_COUNT_MAX_USERS) || 50000;
+
+const createMemoryStore = () => {
+  const cache = new LRUCache({ maxEntries: MAX_USERS, ttlMs: COUNT_TTL_MS });
+
+  // Entries are { count, expiresAt }
+  return {
+    get: async (userId) => cache.get(userId)?.count,
+    set: async (userId, count) => cache.set(userId, { count, expiresAt: Date.now() + COUNT_TTL_MS }),
+    // Only adjusts counts already loaded; unknown users are counted on next read
+    incrBy: async (userId, delta) => {
+      const entry = cache.get(userId);
+      if (entry === undefined) {
+        return undefined;
+      }
+      const next = Math.max(0, entry.count + delta);
+      cache.set(userId, { count: next, expiresAt: entry.expiresAt }, entry.expiresAt - Date.now());
+      return next;
+    },
+    del: async (userId) => {
+      cache.delete(userId);
+    },
+    stats: () => cache.stats(),
+  };
+};
+
+const memoryStore = createMemoryStore();
+let store = memoryStore;
+
+const setStore = (nextStore) => {
+  store = nextStore;
+};
+
+const getUnreadCount = async (userId) => {
+  const cached = await store.get(userId);
+  if (cached !== undefined) {
+    return cached;
+  }
+
+  const count = await prisma.notification.count({
+    where: {
+      userId: userId,
+      isRead: false,
+    },
+  });
+  await store.set(userId, count);
+
+  return count;
+};
+
+const publishChange = (userId) => {
+  if (store === memoryStore) {
+    clusterBus.publish('unreadCounter:changed', userId);
+  }
+};
+
+const increment = async (userId, delta = 1) => {
+  const count = await store.incrBy(userId, delta);
+  publishChange(userId);
+  return count;
+};
+
+const reset = async (userId) => {
+  await store.set(userId, 0);
+  publishChange(userId);
+};
+
+clusterBus.subscribe('unreadCounter:changed', (userId) => memoryStore.del(userId));
+
+const getStats = () => (store.stats ? store.stats() : {});
+
+module.exports = {
+  createMemoryStore,
+  setStore,
+  getUnreadCount,
+  increment,
+  reset,
+  getStats,
+};
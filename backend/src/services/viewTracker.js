@@ -0,0 +1,96 @@
+const prisma = require('../config/database');
+const logger = require('../utils/logger');
+const { onShutdown } = require('../utils/shutdown');
+const { detached } = require('../utils/metrics');
+
+// Write-behind buffer for announcement views. Reads record views here and
+// return immediately; views are coalesced across requests and written with
+// one INSERT ... ON CONFLICT DO NOTHING per batch.
+const FLUSH_INTERVAL_MS = parseInt(process.env.VIEW_FLUSH_INTERVAL_MS) || 5000;
+const FLUSH_BATCH_SIZE = parseInt(process.env.VIEW_FLUSH_BATCH_SIZE) || 500;
+const MAX_BUFFERED_VIEWS = FLUSH_BATCH_SIZE * 20;
+
+// `${announcementId}:${userId}` -> first time the view was seen
+let buffer = new Map();
+let flushing = null;
+
+const flush = async () => {
+  while (flushing) {
+    await flushing;
+  }
+  if (buffer.size === 0) {
+    return;
+  }
+
+  const batch = buffer;
+  buffer = new Map();
+
+  flushing = (async () => {
+    const rows = [...batch].map(([key, viewedAt]) => {
+      const [announcementId, userId] = key.split(':');
+      return { announcementId, userId, viewedAt };
+    });
+
+    for (let i = 0; i < rows.length; i += FLUSH_BATCH_SIZE) {
+      const chunk = rows.slice(i, i + FLUSH_BATCH_SIZE);
+      try {
+        await prisma.announcementView.createMany({
+          data: chunk,
+          skipDuplicates: true,
+        });
+      } catch (error) {
+        logger.error('Failed to flush announcement views:', error);
+        // Foreign key failures (deleted user/announcement) would fail forever
+        if (error.code !== 'P2003') {
+          requeue(chunk);
+        }
+      }
+    }
+  })();
+
+  try {
+    await flushing;
+  } finally {
+    flushing = null;
+  }
+};
+
+const requeue = (rows) => {
+  for (const { announcementId, userId, viewedAt } of rows) {
+    if (buffer.size >= MAX_BUFFERED_VIEWS) {
+      logger.warn(`Announcement view buffer full, dropping ${rows.length} views`);
+      return;
+    }
+    const key = `${announcementId}:${userId}`;
+    if (!buffer.has(key)) {
+      buffer.set(key, viewedAt);
+    }
+  }
+};
+
+const recordViews = (userId, announcementIds) => {
+  const viewedAt = new Date();
+
+  for (const announcementId of announcementIds) {
+    const key = `${announcementId}:${userId}`;
+    if (!buffer.has(key)) {
+      buffer.set(key, viewedAt);
+    }
+  }
+
+  if (buffer.size >= FLUSH_BATCH_SIZE) {
+    detached(flush).catch((error) => logger.error('Failed to flush announcement views:', error));
+  }
+};
+
+const timer = setInterval(() => {
+  flush().catch((error) => logger.error('Failed to flush announcement views:', error));
+}, FLUSH_INTERVAL_MS);
+timer.unref();
+
+onShutdown(flush);
+
+module.exports = {
+  recordViews,
+  flush,
+};
@@ -0,0 +1,58 @@
+const cluster = require('cluster');
+
+// Cross-worker messages for cluster mode (src/cluster.js). Workers publish
+// through process.send(); the primary's relay() forwards every message to
+// the other workers, whose subscribers run it locally. Outside a cluster
+// worker publish() is a no-op, so single-process deployments are unchanged.
+// Delivery is best effort and asynchronous: it is for cache invalidation and
+// similar hints, not for anything that must not be lost.
+const TAG = 'conceptspro:bus';
+
+const handlers = new Map();
+let listening = false;
+
+const enabled = () => cluster.isWorker && typeof process.send === 'function';
+
+const subscribe = (channel, handler) => {
+  if (!enabled()) {
+    return;
+  }
+
+  if (!listening) {
+    listening = true;
+    process.on('message', (message) => {
+      if (message && message.tag === TAG) {
+        (handlers.get(message.channel) || []).forEach((fn) => fn(...message.args));
+      }
+    });
+  }
+
+  handlers.set(channel, [...(handlers.get(channel) || []), handler]);
+};
+
+const publish = (channel, ...args) => {
+  if (enabled() && process.connected) {
+    process.send({ tag: TAG, channel, args });
+  }
+};
+
+// Called in the primary: fan each worker's messages out to its siblings
+const relay = (clusterModule = cluster) => {
+  clusterModule.on('message', (sender, message) => {
+    if (!message || message.tag !== TAG) {
+      return;
+    }
+
+    for (const worker of Object.values(clusterModule.workers)) {
+      if (worker !== sender && worker.isConnected()) {
+        worker.send(message);
+      }
+    }
+  });
+};
+
+module.exports = {
+  subscribe,
+  publish,
+  relay,
+};
@@ -0,0 +1,84 @@
+const logger = require('./logger');
+
+// Graceful HTTP shutdown. track() keeps a set of responses still in flight
+// (including uploads being streamed to disk); drain() stops accepting
+// connections, lets those responses finish, and closes keep-alive sockets as
+// they go idle so clients reconnect to another worker. Anything still open
+// after DRAIN_TIMEOUT_MS is cut off.
+const DRAIN_TIMEOUT_MS = parseInt(process.env.DRAIN_TIMEOUT_MS) || 25 * 1000;
+
+const inFlight = new Set();
+let draining = false;
+let idleWaiters = [];
+
+const settle = () => {
+  if (inFlight.size === 0) {
+    idleWaiters.forEach((resolve) => resolve());
+    idleWaiters = [];
+  }
+};
+
+const track = (req, res, next) => {
+  inFlight.add(res);
+  res.once('close', () => {
+    inFlight.delete(res);
+    settle();
+  });
+
+  // Requests arriving on a kept-alive socket during a drain still run, but
+  // the client is told not to reuse the connection
+  if (draining) {
+    res.setHeader('Connection', 'close');
+  }
+  next();
+};
+
+const whenIdle = () => (inFlight.size === 0 ? Promise.resolve() : new Promise((resolve) => idleWaiters.push(resolve)));
+
+const drain = async (server, { timeoutMs = DRAIN_TIMEOUT_MS } = {}) => {
+  draining = true;
+  const started = Date.now();
+  logger.info(`Draining ${inFlight.size} in-flight requests`);
+
+  for (const res of inFlight) {
+    if (!res.headersSent) {
+      res.setHeader('Connection', 'close');
+    }
+  }
+
+  const closed = new Promise((resolve) => server.close(resolve));
+  server.closeIdleConnections();
+
+  // Sockets become idle as their last response finishes
+  const sweep = setInterval(() => server.closeIdleConnections(), 100);
+  let timer;
+  const timedOut = new Promise((resolve) => {
+    timer = setTimeout(() => resolve(true), timeoutMs);
+  });
+
+  try {
+    if (await Promise.race([whenIdle().then(() => false), timedOut])) {
+      logger.warn(`Drain timed out with ${inFlight.size} requests in flight`);
+    }
+    server.closeIdleConnections();
+    if (await Promise.race([closed.then(() => false), timedOut])) {
+      server.closeAllConnections();
+    }
+  } finally {
+    clearInterval(sweep);
+    clearTimeout(timer);
+  }
+
+  logger.info(`HTTP server drained in ${Date.now() - started}ms`);
+};
+
+const getStats = () => ({
+  draining,
+  inFlight: inFlight.size,
+});
+
+module.exports = {
+  track,
+  drain,
+  getStats,
+};
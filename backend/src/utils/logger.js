@@ -1,19 +1,116 @@
-const logger = {
-  info: (message, ...args) => {
-    console.log(`[INFO] ${new Date().toISOString()} - ${message}`, ...args);
-  },
-  error: (message, ...args) => {
-    console.error(`[ERROR] ${new Date().toISOString()} - ${message}`, ...args);
-  },
-  warn: (message, ...args) => {
-    console.warn(`[WARN] ${new Date().toISOString()} - ${message}`, ...args);
-  },
-  debug: (message, ...args) => {
-    if (process.env.NODE_ENV === 'development') {
-      console.log(`[DEBUG] ${new Date().toISOString()} - ${message}`, ...args);
+// Structured, buffered logger. Lines are queued in memory and written with
+// one stream write per event-loop turn (or once LOG_BUFFER_BYTES is
+// reached), so logging does not block request handling. Set
+// LOG_FORMAT=pretty for human-readable lines; the default outside
+// development is one JSON object per line.
+const fs = require('fs');
+
+const LEVELS = { debug: 10, info: 20, warn: 30, error: 40 };
+const FORMAT = process.env.LOG_FORMAT || (process.env.NODE_ENV === 'development' ? 'pretty' : 'json');
+const MIN_LEVEL = LEVELS[process.env.LOG_LEVEL] || (process.env.NODE_ENV === 'development' ? LEVELS.debug : LEVELS.info);
+const BUFFER_BYTES = parseInt(process.env.LOG_BUFFER_BYTES) || 64 * 1024;
+
+const buffers = {
+  stdout: { stream: process.stdout, fd: 1, lines: [], bytes: 0, scheduled: false },
+  stderr: { stream: process.stderr, fd: 2, lines: [], bytes: 0, scheduled: false },
+};
+
+const flushBuffer = (buffer) => {
+  buffer.scheduled = false;
+  if (buffer.lines.length === 0) {
+    return;
+  }
+
+  const chunk = buffer.lines.join('');
+  buffer.lines = [];
+  buffer.bytes = 0;
+  buffer.stream.write(chunk);
+};
+
+const enqueue = (buffer, line) => {
+  buffer.lines.push(line);
+  buffer.bytes += line.length;
+
+  if (buffer.bytes >= BUFFER_BYTES) {
+    flushBuffer(buffer);
+  } else if (!buffer.scheduled) {
+    buffer.scheduled = true;
+    setImmediate(flushBuffer, buffer);
+  }
+};
+
+const serializeError = (error) => ({
+  name: error.name,
+  message: error.message,
+  ...(error.code && { code: error.code }),
+  stack: error.stack,
+});
+
+// Errors become `err`, plain objects are merged in, anything else goes to `args`
+const toFields = (args) => {
+  const fields = {};
+  const rest = [];
+
+  for (const arg of args) {
+    if (arg instanceof Error) {
+      fields.err = serializeError(arg);
+    } else if (arg && typeof arg === 'object' && !Array.isArray(arg)) {
+      Object.assign(fields, arg);
+    } else {
+      rest.push(arg);
+    }
+  }
+
+  if (rest.length > 0) {
+    fields.args = rest;
+  }
+
+  return fields;
+};
+
+const format = (level, message, fields) => {
+  if (FORMAT === 'pretty') {
+    const { err, ...extra } = fields;
+    const details = Object.keys(extra).length > 0 ? ` ${JSON.stringify(extra)}` : '';
+    const stack = err ? `\n${err.stack || err.message}` : '';
+    return `[${level.toUpperCase()}] ${new Date().toISOString()} - ${message}${details}${stack}\n`;
+  }
+
+  return `${JSON.stringify({ level, time: Date.now(), msg: message, ...fields })}\n`;
+};
+
+const log = (level, message, args) => {
+  if (LEVELS[level] < MIN_LEVEL) {
+    return;
+  }
+
+  let line;
+  try {
+    line = format(level, message, toFields(args));
+  } catch (error) {
+    // Circular or otherwise unserializable arguments
+    line = format(level, message, {});
+  }
+
+  enqueue(LEVELS[level] >= LEVELS.error ? buffers.stderr : buffers.stdout, line);
+};
+
+// Write anything still queued synchronously when the process exits
+process.on('exit', () => {
+  for (const buffer of Object.values(buffers)) {
+    if (buffer.lines.length > 0) {
+      fs.writeSync(buffer.fd, buffer.lines.join(''));
+      buffer.lines = [];
     }
-  },
+  }
+});
+
+const logger = {
+  info: (message, ...args) => log('info', message, args),
+  error: (message, ...args) => log('error', message, args),
+  warn: (message, ...args) => log('warn', message, args),
+  debug: (message, ...args) => log('debug', message, args),
+  flush: () => Object.values(buffers).forEach(flushBuffer),
 };
 
 module.exports = logger;
-
@@ -0,0 +1,77 @@
+// Bounded in-process cache with per-entry TTL and least-recently-used eviction.
+// A Map keeps insertion order, so re-inserting on every hit makes the first
+// key the least recently used one.
+class LRUCache {
+  constructor({ maxEntries = 1000, ttlMs = 60 * 1000 } = {}) {
+    this.maxEntries = maxEntries;
+    this.ttlMs = ttlMs;
+    this.entries = new Map();
+    this.hits = 0;
+    this.misses = 0;
+    this.evictions = 0;
+  }
+
+  get(key) {
+    const entry = this.entries.get(key);
+
+    if (!entry) {
+      this.misses++;
+      return undefined;
+    }
+
+    if (entry.expiresAt <= Date.now()) {
+      this.entries.delete(key);
+      this.misses++;
+      return undefined;
+    }
+
+    // Move to most recently used position
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    this.hits++;
+
+    return entry.value;
+  }
+
+  set(key, value, ttlMs = this.ttlMs) {
+    if (ttlMs <= 0) {
+      return;
+    }
+
+    this.entries.delete(key);
+    this.entries.set(key, { value, expiresAt: Date.now() + ttlMs });
+
+    while (this.entries.size > this.maxEntries) {
+      const oldestKey = this.entries.keys().next().value;
+      this.entries.delete(oldestKey);
+      this.evictions++;
+    }
+  }
+
+  delete(key) {
+    return this.entries.delete(key);
+  }
+
+  clear() {
+    this.entries.clear();
+  }
+
+  get size() {
+    return this.entries.size;
+  }
+
+  stats() {
+    const lookups = this.hits + this.misses;
+
+    return {
+      size: this.entries.size,
+      maxEntries: this.maxEntries,
+      hits: this.hits,
+      misses: this.misses,
+      evictions: this.evictions,
+      hitRate: lookups > 0 ? this.hits / lookups : 0,
+    };
+  }
+}
+
+module.exports = LRUCache;
@@ -0,0 +1,184 @@
+const { AsyncLocalStorage } = require('async_hooks');
+const { monitorEventLoopDelay } = require('perf_hooks');
+
+// Minimal Prometheus-style registry: histograms, plus gauges that are read
+// at scrape time, rendered in the text exposition format.
+const metrics = [];
+
+// Per-request context that follows async calls, so Prisma queries can be
+// attributed to the route that issued them
+const requestContext = new AsyncLocalStorage();
+
+const DEFAULT_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10];
+
+const labelKey = (labels) =>
+  Object.keys(labels)
+    .sort()
+    .map((name) => `${name}="${String(labels[name]).replace(/["\\\n]/g, '\\$&')}"`)
+    .join(',');
+
+const withLabels = (name, key, extra) => {
+  const all = [key, extra].filter(Boolean).join(',');
+  return all ? `${name}{${all}}` : name;
+};
+
+const histogram = (name, help, buckets = DEFAULT_BUCKETS) => {
+  const series = new Map();
+  const metric = {
+    name,
+    help,
+    type: 'histogram',
+    observe: (labels, value) => {
+      const key = labelKey(labels);
+      let entry = series.get(key);
+      if (!entry) {
+        entry = { counts: new Array(buckets.length).fill(0), sum: 0, count: 0 };
+        series.set(key, entry);
+      }
+      for (let i = 0; i < buckets.length; i++) {
+        if (value <= buckets[i]) entry.counts[i]++;
+      }
+      entry.sum += value;
+      entry.count++;
+    },
+    render: () =>
+      [...series].flatMap(([key, entry]) => [
+        ...buckets.map((bound, i) => `${withLabels(`${name}_bucket`, key, `le="${bound}"`)} ${entry.counts[i]}`),
+        `${withLabels(`${name}_bucket`, key, 'le="+Inf"')} ${entry.count}`,
+        `${withLabels(`${name}_sum`, key)} ${entry.sum}`,
+        `${withLabels(`${name}_count`, key)} ${entry.count}`,
+      ]),
+  };
+  metrics.push(metric);
+  return metric;
+};
+
+// collect() returns (or resolves to) a number, or an array of
+// [labels, value] pairs
+const collected = (type) => (name, help, collect) => {
+  metrics.push({
+    name,
+    help,
+    type,
+    render: async () => {
+      const value = await collect();
+      const samples = Array.isArray(value) ? value : [[{}, value]];
+      return samples.map(([labels, sample]) => `${withLabels(name, labelKey(labels))} ${sample}`);
+    },
+  });
+};
+
+const gauge = collected('gauge');
+// Monotonic totals read from a service's stats, so rate() applies
+const counter = collected('counter');
+
+const render = async () => {
+  const sections = await Promise.all(
+    metrics.map(async (metric) =>
+      [`# HELP ${metric.name} ${metric.help}`, `# TYPE ${metric.name} ${metric.type}`, ...(await metric.render())].join(
+        '\n'
+      )
+    )
+  );
+  return `${sections.join('\n')}\n`;
+};
+
+// HTTP and database metrics
+
+const httpDuration = histogram('http_request_duration_seconds', 'HTTP request latency by route');
+const httpQueries = histogram(
+  'http_request_db_queries',
+  'Database queries issued per HTTP request',
+  [0, 1, 2, 5, 10, 25, 50, 100]
+);
+const dbDuration = histogram('db_query_duration_seconds', 'Prisma query latency by model, action and route');
+
+const routeOf = (req) => (req.route ? `${req.baseUrl}${req.route.path}` : 'unmatched');
+
+// Express middleware: time each request and label it by route template.
+// Query timings are held until the response finishes, because the route is
+// only known once the router has matched (after authenticate has run).
+const httpMetrics = (req, res, next) => {
+  const start = process.hrtime.bigint();
+  const context = { queries: [] };
+
+  res.on('finish', () => {
+    // Anything still running in this context is no longer the request's
+    context.done = true;
+    const route = routeOf(req);
+    httpDuration.observe(
+      { method: req.method, route, status: `${Math.floor(res.statusCode / 100)}xx` },
+      Number(process.hrtime.bigint() - start) / 1e9
+    );
+    httpQueries.observe({ method: req.method, route }, context.queries.length);
+    for (const { model, action, seconds } of context.queries) {
+      dbDuration.observe({ model, action, route }, seconds);
+    }
+  });
+
+  requestContext.run(context, next);
+};
+
+// Run fn outside any request context, for work a request only triggers
+// (queue drains, buffer flushes), so its queries count as 'background'
+const detached = (fn) => requestContext.exit(fn);
+
+// Prisma middleware: time every query; outside a request it is 'background'
+const instrumentPrisma = (prisma) => {
+  prisma.$use(async (params, next) => {
+    const start = process.hrtime.bigint();
+
+    try {
+      return await next(params);
+    } finally {
+      const query = {
+        model: params.model || 'raw',
+        action: params.action,
+        seconds: Number(process.hrtime.bigint() - start) / 1e9,
+      };
+      const context = requestContext.getStore();
+
+      if (context && !context.done) {
+        context.queries.push(query);
+      } else {
+        dbDuration.observe({ model: query.model, action: query.action, route: 'background' }, query.seconds);
+      }
+    }
+  });
+};
+
+// Process metrics
+
+const eventLoopDelay = monitorEventLoopDelay({ resolution: 20 });
+eventLoopDelay.enable();
+
+gauge('nodejs_eventloop_lag_seconds', 'Event loop delay percentiles since the last scrape', () => {
+  const samples = [
+    [{ quantile: '0.5' }, eventLoopDelay.percentile(50) / 1e9],
+    [{ quantile: '0.99' }, eventLoopDelay.percentile(99) / 1e9],
+    [{ quantile: '1' }, eventLoopDelay.max / 1e9],
+  ];
+  eventLoopDelay.reset();
+  return samples;
+});
+
+gauge('nodejs_memory_bytes', 'Process memory usage', () => {
+  const { rss, heapUsed, heapTotal, external } = process.memoryUsage();
+  return [
+    [{ type: 'rss' }, rss],
+    [{ type: 'heap_used' }, heapUsed],
+    [{ type: 'heap_total' }, heapTotal],
+    [{ type: 'external' }, external],
+  ];
+});
+
+module.exports = {
+  histogram,
+  gauge,
+  counter,
+  render,
+  httpMetrics,
+  detached,
+  instrumentPrisma,
+  requestContext,
+};
@@ -0,0 +1,60 @@
+const logger = require('./logger');
+
+// Hooks run once, phase by phase and in registration order within a phase:
+//   drain - stop accepting work and wait for in-flight requests
+//   flush - write buffered data (the default)
+//   close - release connections (see config/database.js)
+const PHASES = ['drain', 'flush', 'close'];
+// Hard limit for the whole shutdown, after which the process exits anyway
+const SHUTDOWN_TIMEOUT_MS = parseInt(process.env.SHUTDOWN_TIMEOUT_MS) || 30 * 1000;
+
+const hooks = Object.fromEntries(PHASES.map((phase) => [phase, []]));
+let shutdownPromise = null;
+let signalsHandled = false;
+
+const onShutdown = (hook, phase = 'flush') => {
+  hooks[phase].push(hook);
+};
+
+const runShutdownHooks = () => {
+  if (!shutdownPromise) {
+    shutdownPromise = (async () => {
+      for (const phase of PHASES) {
+        for (const hook of hooks[phase]) {
+          try {
+            await hook();
+          } catch (error) {
+            logger.error(`Shutdown hook failed (${phase}):`, error);
+          }
+        }
+      }
+    })();
+  }
+
+  return shutdownPromise;
+};
+
+// Run every hook on SIGINT/SIGTERM, then exit
+const exitOnSignals = () => {
+  if (signalsHandled) {
+    return;
+  }
+  signalsHandled = true;
+
+  ['SIGINT', 'SIGTERM'].forEach((signal) => {
+    process.once(signal, async () => {
+      logger.info(`${signal} received, shutting down`);
+
+      const timer = setTimeout(() => {
+        logger.error(`Shutdown did not finish within ${SHUTDOWN_TIMEOUT_MS}ms, exiting`);
+        process.exit(1);
+      }, SHUTDOWN_TIMEOUT_MS);
+      timer.unref();
+
+      await runShutdownHooks();
+      process.exit(0);
+    });
+  });
+};
+
+module.exports = { onShutdown, runShutdownHooks, exitOnSignals, SHUTDOWN_TIMEOUT_MS };
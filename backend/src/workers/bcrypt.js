@@ -0,0 +1,13 @@
+const { parentPort } = require('worker_threads');
+const bcrypt = require('bcrypt');
+
+// Runs one bcrypt operation at a time, off the main event loop. The sync API
+// is deliberate: this thread has nothing else to do while it hashes.
+parentPort.on('message', ({ id, op, password, hash, rounds }) => {
+  try {
+    const result = op === 'hash' ? bcrypt.hashSync(password, rounds) : bcrypt.compareSync(password, hash);
+    parentPort.postMessage({ id, result });
+  } catch (error) {
+    parentPort.postMessage({ id, error: error.message });
+  }
+});
@@ -0,0 +1,89 @@
+// Initial vs lazily loaded JavaScript in the production build.
+// Builds the app twice into temp directories: as shipped (each framework
+// visual in its own chunk, fetched when its topic is opened) and with every
+// dynamic import inlined, which is what an eager import of the visuals costs
+// on first load. Sizes are raw and gzipped.
+// Run: npm run bench:bundle
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import zlib from 'zlib';
+import { fileURLToPath } from 'url';
+import { build } from 'vite';
+
+const root = path.resolve(path.dirname(fileURLToPath(import.meta.url)), '..');
+
+const sizeOf = (file) => {
+  const contents = fs.readFileSync(file);
+  return { raw: contents.length, gzip: zlib.gzipSync(contents).length };
+};
+
+const add = (a, b) => ({ raw: a.raw + b.raw, gzip: a.gzip + b.gzip });
+
+const kb = (bytes) => `${(bytes / 1024).toFixed(1)} kB`;
+
+// Vite 4 writes manifest.json to outDir, Vite 5 to outDir/.vite
+const readManifest = (outDir) => {
+  const file = [path.join(outDir, 'manifest.json'), path.join(outDir, '.vite', 'manifest.json')].find(fs.existsSync);
+  return JSON.parse(fs.readFileSync(file, 'utf8'));
+};
+
+async function measureBuild(label, output = {}) {
+  const outDir = fs.mkdtempSync(path.join(os.tmpdir(), 'conceptspro-bundle-'));
+
+  try {
+    await build({
+      root,
+      logLevel: 'warn',
+      build: { outDir, emptyOutDir: true, manifest: true, rollupOptions: { output } },
+    });
+
+    const manifest = readManifest(outDir);
+    const entry = Object.keys(manifest).find((key) => manifest[key].isEntry);
+
+    // Entry chunk plus everything it imports statically
+    const initialFiles = new Set();
+    const visit = (key) => {
+      const chunk = manifest[key];
+      if (chunk && !initialFiles.has(chunk.file)) {
+        initialFiles.add(chunk.file);
+        (chunk.imports || []).forEach(visit);
+      }
+    };
+    visit(entry);
+
+    const jsFiles = [...new Set(Object.values(manifest).map((chunk) => chunk.file))].filter((file) => file.endsWith('.js'));
+    let initial = { raw: 0, gzip: 0 };
+    let lazy = { raw: 0, gzip: 0 };
+    for (const file of jsFiles) {
+      const size = sizeOf(path.join(outDir, file));
+      if (initialFiles.has(file)) {
+        initial = add(initial, size);
+      } else {
+        lazy = add(lazy, size);
+      }
+    }
+
+    console.log(
+      `${label.padEnd(24)} initial ${kb(initial.raw).padStart(10)} (${kb(initial.gzip)} gzip)` +
+        `   lazy ${kb(lazy.raw).padStart(10)} (${kb(lazy.gzip)} gzip) in ${jsFiles.length - initialFiles.size} chunks`
+    );
+    return initial;
+  } finally {
+    fs.rmSync(outDir, { recursive: true, force: true });
+  }
+}
+
+async function main() {
+  const split = await measureBuild('code-split visuals');
+  const eager = await measureBuild('eager (inlined)', { inlineDynamicImports: true });
+
+  console.log(
+    `${''.padEnd(24)} initial JS saved: ${kb(eager.raw - split.raw)} (${kb(eager.gzip - split.gzip)} gzip)`
+  );
+}
+
+main().catch((e) => {
+  console.error(e);
+  process.exit(1);
+});
@@ -0,0 +1,81 @@
+// Signal engine throughput and main-thread frame time, in the browser.
+// For each stream length from 8 bits to 1M bits and each scheme, runs the
+// modulate/noise/demodulate pass for a 1200 px plot in the signal worker
+// while a requestAnimationFrame loop records frame times, then draws the
+// returned envelope. The same job run on the main thread is shown for
+// comparison: its frame time is how long the page would freeze.
+// Reports samples/s, worker time, draw time and worst frame per run.
+// Run: npm run bench:signal (opens this page on the Vite dev server)
+import { compute } from '../src/services/signalEngine';
+import { computeSignal, MODULATION_SCHEMES } from '../src/utils/signal';
+import { drawEnvelope } from '../src/components/visuals/SignalPlot';
+
+const LENGTHS = [8, 64, 1024, 16384, 131072, 1 << 20];
+const WIDTH = 1200;
+const FRAME_MS = 1000 / 60;
+
+const canvas = document.getElementById('plot');
+const results = document.getElementById('results');
+const lines = [];
+
+const print = (line) => {
+  lines.push(line);
+  results.textContent = lines.join('\n');
+  console.log(line);
+};
+
+const nextFrame = () => new Promise((resolve) => requestAnimationFrame(resolve));
+
+// Frame intervals until `work` settles
+const watchFrames = async (work) => {
+  const frames = [];
+  let last = await nextFrame();
+  let done = false;
+
+  const loop = (async () => {
+    while (!done) {
+      const now = await nextFrame();
+      frames.push(now - last);
+      last = now;
+    }
+  })();
+
+  const result = await work();
+  done = true;
+  await loop;
+  return { result, worstFrame: Math.max(0, ...frames), dropped: frames.filter((ms) => ms > FRAME_MS * 1.5).length };
+};
+
+const rate = (samples, ms) => `${(samples / Math.max(ms, 0.001) / 1000).toFixed(1)}M`;
+
+async function main() {
+  print(`${WIDTH} px plot, 32 samples per symbol, ${FRAME_MS.toFixed(1)} ms frame budget`);
+  print(`${'bits'.padStart(8)} ${'scheme'.padEnd(6)} ${'samples/s'.padStart(10)} ${'worker'.padStart(10)} ${'draw'.padStart(8)} ${'worst frame'.padStart(12)} ${'dropped'.padStart(8)} ${'main-thread frame'.padStart(18)}`);
+
+  for (const bits of LENGTHS) {
+    for (const scheme of MODULATION_SCHEMES) {
+      const request = { kind: 'modulation', scheme, random: bits, width: WIDTH, options: {} };
+
+      const { result, worstFrame, dropped } = await watchFrames(() => compute('bench', request));
+
+      const drawStarted = performance.now();
+      drawEnvelope(canvas, result.waveform, { range: [-2, 2] });
+      const drawMs = performance.now() - drawStarted;
+
+      // The same job blocking the main thread
+      await nextFrame();
+      const blockedStarted = performance.now();
+      computeSignal(request);
+      const blockedMs = performance.now() - blockedStarted;
+
+      print(
+        `${String(bits).padStart(8)} ${scheme.padEnd(6)} ${rate(result.samples, result.elapsedMs).padStart(10)}` +
+          ` ${`${result.elapsedMs.toFixed(1)} ms`.padStart(10)} ${`${drawMs.toFixed(2)} ms`.padStart(8)}` +
+          ` ${`${worstFrame.toFixed(1)} ms`.padStart(12)} ${String(dropped).padStart(8)}` +
+          ` ${`${blockedMs.toFixed(1)} ms`.padStart(18)}`
+      );
+    }
+  }
+}
+
+main().catch((e) => print(`Failed: ${e.stack || e}`));
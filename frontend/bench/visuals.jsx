@@ -0,0 +1,88 @@
+// Render cost of one animation step in each framework visual, measured
+// with the React Profiler in the browser. Compares the visuals as rendered
+// now (memoised, updated in place, so only the Stages whose highlight flips
+// re-render) against remounting the whole visual on every step, which is
+// what defining the visuals inside the animated component did.
+// Reports Profiler render time per step next to the base duration (the
+// cost of rendering the whole visual with nothing memoised) and the number
+// of DOM mutations per step.
+// Run: npm run bench:visuals (opens this page on the Vite dev server)
+import React, { Profiler } from 'react';
+import { flushSync } from 'react-dom';
+import { createRoot } from 'react-dom/client';
+import EncryptionVisual from '../src/components/visuals/EncryptionVisual';
+import EncodingVisual from '../src/components/visuals/EncodingVisual';
+import ModulationVisual from '../src/components/visuals/ModulationVisual';
+import MultiplexingVisual from '../src/components/visuals/MultiplexingVisual';
+
+const STEPS = parseInt(new URLSearchParams(location.search).get('steps')) || 400;
+
+const visuals = {
+  encryption: EncryptionVisual,
+  encoding: EncodingVisual,
+  modulation: ModulationVisual,
+  multiplexing: MultiplexingVisual,
+};
+
+const measure = (Visual, { remount }) => {
+  const container = document.getElementById('stage');
+  const root = createRoot(container);
+  const observer = new MutationObserver(() => {});
+  let renderMs = 0;
+  let baseMs = 0;
+
+  const onRender = (id, phase, actualDuration, baseDuration) => {
+    renderMs += actualDuration;
+    baseMs += baseDuration;
+  };
+
+  const render = (step) => {
+    flushSync(() => {
+      root.render(
+        <Profiler id="visual" onRender={onRender}>
+          <Visual key={remount ? step : 'visual'} isAnimating animationStep={step % 4} />
+        </Profiler>
+      );
+    });
+  };
+
+  render(0);
+  renderMs = 0;
+  baseMs = 0;
+  observer.observe(container, { subtree: true, childList: true, attributes: true, characterData: true });
+
+  let mutations = 0;
+  for (let step = 1; step <= STEPS; step++) {
+    render(step);
+    mutations += observer.takeRecords().length;
+  }
+
+  observer.disconnect();
+  root.unmount();
+
+  return {
+    renderMs: renderMs / STEPS,
+    baseMs: baseMs / STEPS,
+    mutations: mutations / STEPS,
+  };
+};
+
+const format = (label, { renderMs, baseMs, mutations }) =>
+  `${label.padEnd(32)} render ${renderMs.toFixed(3).padStart(7)} ms/step` +
+  ` (full tree ${baseMs.toFixed(3)} ms)` +
+  `   DOM mutations/step ${mutations.toFixed(1).padStart(6)}`;
+
+const lines = [`${STEPS} animation steps per run`];
+
+for (const [name, Visual] of Object.entries(visuals)) {
+  const memoised = measure(Visual, { remount: false });
+  const remounted = measure(Visual, { remount: true });
+  lines.push(
+    format(`${name} (memoised, in place)`, memoised),
+    format(`${name} (remount per step)`, remounted),
+    `${''.padEnd(32)} ${(remounted.renderMs / Math.max(memoised.renderMs, 0.001)).toFixed(1)}x less render time`
+  );
+}
+
+document.getElementById('results').textContent = lines.join('\n');
+console.log(lines.join('\n'));
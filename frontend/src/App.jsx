@@ -17,10 +17,6 @@ const AppContent = () => {
   const [selectedCourse, setSelectedCourse] = useState(null);
   const [completedConcepts, setCompletedConcepts] = useState([]);
   const [mobileMenuOpen, setMobileMenuOpen] = useState(false);
-  
-  // Animation states for framework visualization
-  const [isAnimating, setIsAnimating] = useState(false);
-  const [animationStep, setAnimationStep] = useState(0);
 
   useEffect(() => {
     // Redirect to dashboard if authenticated
@@ -33,21 +29,6 @@ const AppContent = () => {
     }
   }, [isAuthenticated, currentPage]);
 
-  useEffect(() => {
-    let interval;
-    if (isAnimating) {
-      interval = setInterval(() => {
-        setAnimationStep(prev => (prev + 1) % 4);
-      }, 1500);
-    }
-    return () => clearInterval(interval);
-  }, [isAnimating]);
-
-  const resetAnimation = () => {
-    setAnimationStep(0);
-    setIsAnimating(false);
-  };
-
   // Load saved data
   useEffect(() => {
     const savedCompleted = localStorage.getItem('conceptspro-completed');
@@ -123,10 +104,6 @@ const AppContent = () => {
           setSelectedCourse={setSelectedCourse}
           completedConcepts={completedConcepts}
           toggleConceptCompletion={toggleConceptCompletion}
-          isAnimating={isAnimating}
-          setIsAnimating={setIsAnimating}
-          animationStep={animationStep}
-          resetAnimation={resetAnimation}
         />
       )}
       
@@ -0,0 +1,110 @@
+import React, { useState } from 'react';
+import SignalPlot from './SignalPlot';
+import { useSignal } from '../../hooks/useSignal';
+import { MODULATION_SCHEMES } from '../../utils/signal';
+
+const SCHEME_NOTES = {
+  ASK: 'Amplitude shift keying: carrier on for 1, off for 0',
+  FSK: 'Frequency shift keying: a higher carrier frequency for 1',
+  PSK: 'Binary phase shift keying: carrier phase flips 180° for 0',
+  QAM: '16-QAM: 4 bits per symbol on in-phase and quadrature amplitudes',
+};
+
+// Generated streams for trying long inputs; 0 means use the typed data
+const STREAMS = [
+  { label: 'Typed data', bits: 0 },
+  { label: '1,024 random bits', bits: 1024 },
+  { label: '65,536 random bits', bits: 65536 },
+  { label: '1M random bits', bits: 1 << 20 },
+];
+
+/**
+ * Modulate arbitrary input, add channel noise and demodulate it again,
+ * computed in the signal worker
+ */
+const ModulationLab = () => {
+  const [input, setInput] = useState('101010');
+  const [scheme, setScheme] = useState('ASK');
+  const [random, setRandom] = useState(0);
+  const [noise, setNoise] = useState(0);
+  const [width, setWidth] = useState(800);
+
+  const { result, error, busy } = useSignal(
+    'modulation',
+    () => ({ kind: 'modulation', scheme, input, random, width, options: { noise } }),
+    [scheme, input, random, width, noise]
+  );
+
+  return (
+    <div className="bg-white p-4 rounded-lg border-2 border-orange-200 space-y-4">
+      <h4 className="font-bold text-gray-800">Try It: Modulate Your Own Data</h4>
+
+      <div className="grid md:grid-cols-2 gap-4">
+        <label className="block text-sm text-gray-700">
+          Data (text, or a string of 0s and 1s)
+          <input
+            value={input}
+            onChange={(e) => setInput(e.target.value)}
+            disabled={random > 0}
+            className="mt-1 w-full px-3 py-2 border border-gray-300 rounded-lg font-mono disabled:bg-gray-100"
+          />
+        </label>
+        <label className="block text-sm text-gray-700">
+          Stream
+          <select
+            value={random}
+            onChange={(e) => setRandom(Number(e.target.value))}
+            className="mt-1 w-full px-3 py-2 border border-gray-300 rounded-lg"
+          >
+            {STREAMS.map((stream) => (
+              <option key={stream.bits} value={stream.bits}>{stream.label}</option>
+            ))}
+          </select>
+        </label>
+      </div>
+
+      <div className="flex flex-wrap items-center gap-2">
+        {MODULATION_SCHEMES.map((name) => (
+          <button
+            key={name}
+            onClick={() => setScheme(name)}
+            className={`px-4 py-2 rounded-lg font-semibold transition ${
+              scheme === name ? 'bg-orange-600 text-white' : 'bg-gray-100 text-gray-700 hover:bg-gray-200'
+            }`}
+          >
+            {name}
+          </button>
+        ))}
+        <label className="flex items-center gap-2 text-sm text-gray-700 ml-auto">
+          Channel noise
+          <input type="range" min="0" max="1.5" step="0.05" value={noise} onChange={(e) => setNoise(Number(e.target.value))} />
+          <span className="font-mono w-10">{noise.toFixed(2)}</span>
+        </label>
+      </div>
+      <p className="text-sm text-gray-600">{SCHEME_NOTES[scheme]}</p>
+
+      <SignalPlot label="Digital input" envelope={result?.input} range={[0, 1]} mode="step" color="#16a34a" height={60} onResize={setWidth} />
+      <SignalPlot label={`${scheme} waveform`} envelope={result?.waveform} range={[-2.5, 2.5]} color="#2563eb" />
+
+      {error && <p className="text-sm text-red-600">{error.message}</p>}
+      {result && (
+        <div className="text-sm text-gray-700 space-y-1">
+          <div>
+            <strong>Recovered:</strong>{' '}
+            <span className="font-mono break-all">{result.recovered || '(empty)'}</span>
+          </div>
+          <div className={result.errors ? 'text-red-600' : 'text-green-700'}>
+            {result.errors} bit error{result.errors === 1 ? '' : 's'} in {result.bits.toLocaleString()} bits
+          </div>
+          <div className="text-xs text-gray-500">
+            {result.samples.toLocaleString()} samples in {result.elapsedMs.toFixed(1)} ms
+            {result.elapsedMs > 0 && ` (${((result.samples / result.elapsedMs) / 1000).toFixed(1)}M samples/s)`}
+            {busy && ' · updating...'}
+          </div>
+        </div>
+      )}
+    </div>
+  );
+};
+
+export default ModulationLab;
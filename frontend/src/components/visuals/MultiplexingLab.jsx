@@ -0,0 +1,106 @@
+import React, { useState } from 'react';
+import SignalPlot from './SignalPlot';
+import { useSignal } from '../../hooks/useSignal';
+import { MULTIPLEXING_SCHEMES } from '../../utils/signal';
+
+const SCHEME_NOTES = {
+  TDM: 'Time division: one bit from each signal per frame, in turn, on one line',
+  FDM: 'Frequency division: every signal at once, each on its own carrier frequency, summed',
+};
+
+const SIGNALS = [
+  { name: 'Signal A', text: 'text-red-900' },
+  { name: 'Signal B', text: 'text-blue-900' },
+  { name: 'Signal C', text: 'text-green-900' },
+  { name: 'Signal D', text: 'text-yellow-900' },
+];
+
+/**
+ * Multiplex four user-supplied signals onto one channel and separate them
+ * again, computed in the signal worker
+ */
+const MultiplexingLab = () => {
+  const [inputs, setInputs] = useState(['Voice', 'Video', 'Data', 'Web']);
+  const [scheme, setScheme] = useState('TDM');
+  const [noise, setNoise] = useState(0);
+  const [width, setWidth] = useState(800);
+
+  const { result, error, busy } = useSignal(
+    'multiplexing',
+    () => ({ kind: 'multiplexing', scheme, inputs, width, options: { noise } }),
+    [scheme, inputs, width, noise]
+  );
+
+  const setInput = (index, value) => {
+    setInputs((previous) => previous.map((input, i) => (i === index ? value : input)));
+  };
+
+  return (
+    <div className="bg-white p-4 rounded-lg border-2 border-teal-200 space-y-4">
+      <h4 className="font-bold text-gray-800">Try It: Multiplex Your Own Signals</h4>
+
+      <div className="grid sm:grid-cols-2 lg:grid-cols-4 gap-3">
+        {SIGNALS.map((signal, i) => (
+          <label key={signal.name} className={`block text-sm font-semibold ${signal.text}`}>
+            {signal.name}
+            <input
+              value={inputs[i]}
+              onChange={(e) => setInput(i, e.target.value)}
+              className="mt-1 w-full px-3 py-2 border border-gray-300 rounded-lg font-mono font-normal text-gray-800"
+            />
+          </label>
+        ))}
+      </div>
+
+      <div className="flex flex-wrap items-center gap-2">
+        {MULTIPLEXING_SCHEMES.map((name) => (
+          <button
+            key={name}
+            onClick={() => setScheme(name)}
+            className={`px-4 py-2 rounded-lg font-semibold transition ${
+              scheme === name ? 'bg-teal-600 text-white' : 'bg-gray-100 text-gray-700 hover:bg-gray-200'
+            }`}
+          >
+            {name}
+          </button>
+        ))}
+        <label className="flex items-center gap-2 text-sm text-gray-700 ml-auto">
+          Channel noise
+          <input type="range" min="0" max="1.5" step="0.05" value={noise} onChange={(e) => setNoise(Number(e.target.value))} />
+          <span className="font-mono w-10">{noise.toFixed(2)}</span>
+        </label>
+      </div>
+      <p className="text-sm text-gray-600">{SCHEME_NOTES[scheme]}</p>
+
+      <SignalPlot
+        label={`${scheme} channel`}
+        envelope={result?.waveform}
+        range={scheme === 'TDM' ? [-2, 2] : [-5, 5]}
+        mode={scheme === 'TDM' ? 'step' : 'line'}
+        color="#0d9488"
+        onResize={setWidth}
+      />
+
+      {error && <p className="text-sm text-red-600">{error.message}</p>}
+      {result && (
+        <div className="text-sm text-gray-700 space-y-1">
+          {result.channels.map((channel, i) => (
+            <div key={SIGNALS[i].name}>
+              <strong className={SIGNALS[i].text}>{SIGNALS[i].name}:</strong>{' '}
+              <span className="font-mono break-all">{channel.recovered || '(empty)'}</span>{' '}
+              <span className={channel.errors ? 'text-red-600' : 'text-green-700'}>
+                ({channel.errors} bit error{channel.errors === 1 ? '' : 's'})
+              </span>
+            </div>
+          ))}
+          <div className="text-xs text-gray-500">
+            {result.bits.toLocaleString()} bits, {result.samples.toLocaleString()} samples in {result.elapsedMs.toFixed(1)} ms
+            {busy && ' · updating...'}
+          </div>
+        </div>
+      )}
+    </div>
+  );
+};
+
+export default MultiplexingLab;
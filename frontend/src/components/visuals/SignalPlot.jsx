@@ -0,0 +1,108 @@
+import React, { memo, useEffect, useRef } from 'react';
+
+/**
+ * SVG polyline points for a small envelope, for static thumbnails
+ */
+export const toPolyline = (envelope, width, height, [low, high] = [-1, 1], mode = 'line') => {
+  const columns = envelope.length / 2;
+  const step = width / columns;
+  const y = (value) => (((high - value) / (high - low)) * height).toFixed(1);
+  const points = [];
+  for (let c = 0; c < columns; c++) {
+    const value = (envelope[c * 2] + envelope[c * 2 + 1]) / 2;
+    if (mode === 'step') {
+      points.push(`${(c * step).toFixed(1)},${y(value)}`, `${((c + 1) * step).toFixed(1)},${y(value)}`);
+    } else {
+      points.push(`${((c + 0.5) * step).toFixed(1)},${y(value)}`);
+    }
+  }
+  return points.join(' ');
+};
+
+/**
+ * Draw an envelope onto a canvas, sized to its CSS width and `height`
+ */
+export const drawEnvelope = (canvas, envelope, { range: [low, high] = [-1, 1], mode = 'line', color = '#2563eb', height = 120 } = {}) => {
+  const ratio = window.devicePixelRatio || 1;
+  const width = canvas.clientWidth;
+  canvas.width = Math.round(width * ratio);
+  canvas.height = Math.round(height * ratio);
+
+  const context = canvas.getContext('2d');
+  context.setTransform(ratio, 0, 0, ratio, 0, 0);
+  context.clearRect(0, 0, width, height);
+
+  const pad = 6;
+  const y = (value) => pad + ((high - value) / (high - low)) * (height - pad * 2);
+
+  context.strokeStyle = '#e5e7eb';
+  context.lineWidth = 1;
+  context.beginPath();
+  context.moveTo(0, y(0));
+  context.lineTo(width, y(0));
+  context.stroke();
+
+  const columns = envelope.length / 2;
+  const step = width / columns;
+  context.strokeStyle = color;
+  context.lineWidth = 1.5;
+  context.beginPath();
+  for (let c = 0; c < columns; c++) {
+    const min = envelope[c * 2];
+    const max = envelope[c * 2 + 1];
+    if (mode === 'step') {
+      const x = c * step;
+      context.lineTo(x, y(min === max ? min : max));
+      if (min !== max) context.lineTo(x, y(min));
+      context.lineTo(x + step, y(min));
+    } else {
+      const x = (c + 0.5) * step;
+      context.lineTo(x, y(min));
+      if (min !== max) context.lineTo(x, y(max));
+    }
+  }
+  context.stroke();
+};
+
+/**
+ * Canvas plot of a min/max envelope from the signal engine (interleaved
+ * [min, max] per column, at most one column per pixel). Drawing is one
+ * path over the columns on the next animation frame, so the cost does not
+ * depend on how many samples the envelope summarises.
+ *
+ * mode 'line' joins column extremes (waveforms); 'step' holds each column's
+ * level across its width (bit streams). onResize reports the CSS width so
+ * the caller can ask the engine for that many columns.
+ */
+const SignalPlot = ({ envelope, range = [-1, 1], mode = 'line', color = '#2563eb', height = 120, label, onResize }) => {
+  const canvasRef = useRef(null);
+
+  useEffect(() => {
+    const canvas = canvasRef.current;
+    if (!onResize || typeof ResizeObserver === 'undefined') {
+      return undefined;
+    }
+    const observer = new ResizeObserver(([entry]) => onResize(Math.round(entry.contentRect.width)));
+    observer.observe(canvas);
+    return () => observer.disconnect();
+  }, [onResize]);
+
+  useEffect(() => {
+    const canvas = canvasRef.current;
+    if (!envelope || !canvas) {
+      return undefined;
+    }
+
+    const frame = requestAnimationFrame(() => drawEnvelope(canvas, envelope, { range, mode, color, height }));
+    return () => cancelAnimationFrame(frame);
+  }, [envelope, range[0], range[1], mode, color, height]);
+
+  return (
+    <div>
+      {label && <div className="text-xs font-semibold text-gray-600 mb-1">{label}</div>}
+      <canvas ref={canvasRef} className="w-full bg-white border border-gray-300 rounded" style={{ height }} />
+    </div>
+  );
+};
+
+export default memo(SignalPlot);
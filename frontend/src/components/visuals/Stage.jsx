@@ -0,0 +1,16 @@
+import React, { memo } from 'react';
+
+/**
+ * An element of a visual that changes on some animation steps.
+ *
+ * Visuals pass static content as children hoisted to module scope, so the
+ * element is the same object on every render and a step change only
+ * re-renders the Stages whose `active` flag flipped.
+ */
+const Stage = memo(({ active, className, activeClassName, children }) => (
+  <div className={`${className} ${active ? activeClassName : ''}`}>{children}</div>
+));
+
+Stage.displayName = 'Stage';
+
+export default Stage;
@@ -0,0 +1,62 @@
+import { useCallback, useEffect, useState } from 'react';
+
+/**
+ * Step counter for the framework visuals.
+ *
+ * Advances every intervalMs while `running`, on requestAnimationFrame so a
+ * step lands on a frame. Frames are cancelled while the document is hidden
+ * (rather than ticking in the background like setInterval) and the step
+ * interval restarts when it becomes visible again.
+ */
+export const useAnimationStep = (running, { steps = 4, intervalMs = 1500 } = {}) => {
+  const [step, setStep] = useState(0);
+
+  useEffect(() => {
+    if (!running) {
+      return undefined;
+    }
+
+    let frame = null;
+    let last = null;
+
+    const tick = (now) => {
+      if (last === null) {
+        last = now;
+      } else if (now - last >= intervalMs) {
+        last = now;
+        setStep((previous) => (previous + 1) % steps);
+      }
+      frame = requestAnimationFrame(tick);
+    };
+
+    const start = () => {
+      if (frame === null && !document.hidden) {
+        last = null;
+        frame = requestAnimationFrame(tick);
+      }
+    };
+
+    const stop = () => {
+      if (frame !== null) {
+        cancelAnimationFrame(frame);
+        frame = null;
+      }
+    };
+
+    const onVisibilityChange = () => (document.hidden ? stop() : start());
+
+    document.addEventListener('visibilitychange', onVisibilityChange);
+    start();
+
+    return () => {
+      stop();
+      document.removeEventListener('visibilitychange', onVisibilityChange);
+    };
+  }, [running, steps, intervalMs]);
+
+  const reset = useCallback(() => setStep(0), []);
+
+  return [step, reset];
+};
+
+export default useAnimationStep;
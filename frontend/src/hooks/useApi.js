@@ -0,0 +1,36 @@
+import { useEffect, useState } from 'react';
+
+/**
+ * Load data through the cached API client.
+ *
+ * fetcher receives request options ({ signal, onUpdate }) to pass to an API
+ * method, e.g.
+ *   const { data, loading } = useApi((options) => coursesAPI.getAll(options), []);
+ * The request is aborted when deps change or the component unmounts, and
+ * data updates in place when a background revalidation returns a change.
+ * Pages still render static data (see README), so nothing calls this yet.
+ */
+export const useApi = (fetcher, deps = []) => {
+  const [state, setState] = useState({ data: undefined, error: null, loading: true });
+
+  useEffect(() => {
+    const controller = new AbortController();
+    const onUpdate = (data) => setState({ data, error: null, loading: false });
+
+    setState((previous) => ({ ...previous, loading: true }));
+    fetcher({ signal: controller.signal, onUpdate })
+      .then(onUpdate)
+      .catch((error) => {
+        if (error.name !== 'AbortError') {
+          setState({ data: undefined, error, loading: false });
+        }
+      });
+
+    return () => controller.abort();
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, deps);
+
+  return state;
+};
+
+export default useApi;
@@ -0,0 +1,39 @@
+import { useEffect, useRef, useState } from 'react';
+import { compute } from '../services/signalEngine';
+
+/**
+ * Result of a signal engine request, recomputed in the worker whenever
+ * deps change. Keeps showing the previous result while the next one is
+ * computed; results for superseded requests are dropped.
+ */
+export const useSignal = (key, buildRequest, deps) => {
+  const [state, setState] = useState({ result: null, error: null, busy: true });
+  const latest = useRef(0);
+
+  useEffect(() => {
+    const request = buildRequest();
+    if (!request) {
+      return;
+    }
+
+    const id = ++latest.current;
+    setState((previous) => ({ ...previous, busy: true }));
+
+    compute(key, request)
+      .then((result) => {
+        if (result && id === latest.current) {
+          setState({ result, error: null, busy: false });
+        }
+      })
+      .catch((error) => {
+        if (id === latest.current) {
+          setState((previous) => ({ ...previous, error, busy: false }));
+        }
+      });
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, deps);
+
+  return state;
+};
+
+export default useSignal;
@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useMemo, useState } from 'react';
 import { Calendar, Clock, FileText, GraduationCap, ChevronLeft, ChevronRight } from 'lucide-react';
 import { useUser } from '../context/UserContext';
 import { courses } from '../config/data/courses';
@@ -7,17 +7,17 @@ const CalendarPage = ({ setCurrentPage, setSelectedCourse }) => {
   const { user } = useUser();
   const [currentDate, setCurrentDate] = useState(new Date());
 
-  if (!user) return null;
+  // Get all events from enrolled courses (only rebuilt when the user changes)
+  const allEvents = useMemo(() => {
+    if (!user) return [];
 
-  const enrolledCourses = courses.filter(course => 
-    user.role === 'student' 
-      ? course.enrolled && user.enrolledCourses?.includes(course.id)
-      : user.role === 'instructor' && course.instructor.id === user.id
-  );
+    const enrolledCourses = courses.filter(course => 
+      user.role === 'student' 
+        ? course.enrolled && user.enrolledCourses?.includes(course.id)
+        : user.role === 'instructor' && course.instructor.id === user.id
+    );
 
-  // Get all events from enrolled courses
-  const allEvents = enrolledCourses.flatMap(course => 
-    [
+    return enrolledCourses.flatMap(course => [
       ...course.events.map(event => ({
         ...event,
         courseCode: course.code,
@@ -34,12 +34,24 @@ const CalendarPage = ({ setCurrentPage, setSelectedCourse }) => {
         course: course,
         assignment: assignment
       }))
-    ]
-  );
+    ]);
+  }, [user]);
+
+  // Bucket events by date once, so each day is a lookup instead of a scan
+  const eventsByDate = useMemo(() => {
+    const buckets = new Map();
+    allEvents.forEach(event => {
+      if (!buckets.has(event.date)) buckets.set(event.date, []);
+      buckets.get(event.date).push(event);
+    });
+    return buckets;
+  }, [allEvents]);
+
+  if (!user) return null;
 
   const getEventsForDate = (date) => {
     const dateStr = date.toISOString().split('T')[0];
-    return allEvents.filter(event => event.date === dateStr);
+    return eventsByDate.get(dateStr) || [];
   };
 
   const getEventsForMonth = () => {
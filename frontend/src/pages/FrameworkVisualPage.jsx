@@ -1,9 +1,56 @@
-import React from 'react';
+import React, { Suspense, lazy, useState } from 'react';
 import { ChevronRight, CheckCircle, Circle, Play, Pause, RotateCcw } from 'lucide-react';
-import EncryptionVisual from '../components/visuals/EncryptionVisual';
-import EncodingVisual from '../components/visuals/EncodingVisual';
-import ModulationVisual from '../components/visuals/ModulationVisual';
-import MultiplexingVisual from '../components/visuals/MultiplexingVisual';
+import { useAnimationStep } from '../hooks/useAnimationStep';
+
+// One chunk per visual, fetched the first time its topic is opened
+const visuals = {
+  encryption: lazy(() => import('../components/visuals/EncryptionVisual')),
+  encoding: lazy(() => import('../components/visuals/EncodingVisual')),
+  modulation: lazy(() => import('../components/visuals/ModulationVisual')),
+  multiplexing: lazy(() => import('../components/visuals/MultiplexingVisual')),
+};
+
+/**
+ * Controls and visual for one concept. Owns the animation state, so a step
+ * re-renders only this subtree and not the page or the app around it.
+ */
+const FrameworkAnimation = ({ conceptId }) => {
+  const [isAnimating, setIsAnimating] = useState(false);
+  const [animationStep, resetStep] = useAnimationStep(isAnimating);
+  const Visual = visuals[conceptId];
+
+  const resetAnimation = () => {
+    resetStep();
+    setIsAnimating(false);
+  };
+
+  return (
+    <>
+      <div className="bg-white rounded-lg p-4 mb-6 flex flex-wrap items-center justify-center gap-4 border-2 border-gray-200">
+        <button
+          onClick={() => setIsAnimating(!isAnimating)}
+          className="flex items-center gap-2 px-6 py-3 bg-blue-600 text-white rounded-lg font-semibold hover:bg-blue-700 transition-all shadow-md"
+        >
+          {isAnimating ? <Pause className="w-5 h-5" /> : <Play className="w-5 h-5" />}
+          {isAnimating ? 'Pause' : 'Start'} Animation
+        </button>
+        <button
+          onClick={resetAnimation}
+          className="flex items-center gap-2 px-6 py-3 bg-gray-600 text-white rounded-lg font-semibold hover:bg-gray-700 transition-all shadow-md"
+        >
+          <RotateCcw className="w-5 h-5" />
+          Reset
+        </button>
+      </div>
+
+      {Visual && (
+        <Suspense fallback={<div className="py-24 text-center text-gray-500">Loading visual...</div>}>
+          <Visual isAnimating={isAnimating} animationStep={animationStep} />
+        </Suspense>
+      )}
+    </>
+  );
+};
 
 const FrameworkVisualPage = ({ 
   selectedTopic, 
@@ -11,11 +58,7 @@ const FrameworkVisualPage = ({
   setCurrentPage, 
   setSelectedCourse,
   completedConcepts, 
-  toggleConceptCompletion, 
-  isAnimating, 
-  setIsAnimating, 
-  animationStep, 
-  resetAnimation 
+  toggleConceptCompletion 
 }) => {
   if (!selectedTopic) return null;
 
@@ -65,27 +108,7 @@ const FrameworkVisualPage = ({
             <span className="text-gray-600">{selectedTopic.duration}</span>
           </div>
 
-          <div className="bg-white rounded-lg p-4 mb-6 flex flex-wrap items-center justify-center gap-4 border-2 border-gray-200">
-            <button
-              onClick={() => setIsAnimating(!isAnimating)}
-              className="flex items-center gap-2 px-6 py-3 bg-blue-600 text-white rounded-lg font-semibold hover:bg-blue-700 transition-all shadow-md"
-            >
-              {isAnimating ? <Pause className="w-5 h-5" /> : <Play className="w-5 h-5" />}
-              {isAnimating ? 'Pause' : 'Start'} Animation
-            </button>
-            <button
-              onClick={resetAnimation}
-              className="flex items-center gap-2 px-6 py-3 bg-gray-600 text-white rounded-lg font-semibold hover:bg-gray-700 transition-all shadow-md"
-            >
-              <RotateCcw className="w-5 h-5" />
-              Reset
-            </button>
-          </div>
-
-          {selectedTopic.conceptId === 'encryption' && <EncryptionVisual isAnimating={isAnimating} animationStep={animationStep} />}
-          {selectedTopic.conceptId === 'encoding' && <EncodingVisual isAnimating={isAnimating} animationStep={animationStep} />}
-          {selectedTopic.conceptId === 'modulation' && <ModulationVisual isAnimating={isAnimating} animationStep={animationStep} />}
-          {selectedTopic.conceptId === 'multiplexing' && <MultiplexingVisual isAnimating={isAnimating} animationStep={animationStep} />}
+          <FrameworkAnimation key={selectedTopic.id} conceptId={selectedTopic.conceptId} />
         </div>
 
         <div className="bg-gradient-to-r from-blue-600 to-purple-600 text-white rounded-xl p-6 text-center">
@@ -2,6 +2,8 @@
  * API Service - Handles all HTTP requests to the backend
  */
 
+import * as apiCache from './apiCache';
+
 const API_BASE_URL = import.meta.env.VITE_API_URL || 'http://localhost:5000/api';
 
 /**
@@ -12,40 +14,251 @@ const getToken = () => {
 };
 
 /**
- * Make an API request
+ * Parse a response body and throw on HTTP errors
  */
-const request = async (endpoint, options = {}) => {
+const parseResponse = async (response) => {
+  // Handle non-JSON responses
+  const contentType = response.headers.get('content-type');
+  const data = contentType?.includes('application/json')
+    ? await response.json()
+    : await response.text();
+
+  if (!response.ok) {
+    throw new Error(data.error || data.message || `HTTP error! status: ${response.status}`);
+  }
+
+  return data;
+};
+
+const authHeaders = () => {
   const token = getToken();
-  
-  const config = {
-    ...options,
+  return {
+    'Content-Type': 'application/json',
+    ...(token && { Authorization: `Bearer ${token}` }),
+  };
+};
+
+const abortError = () => new DOMException('The request was aborted', 'AbortError');
+
+/**
+ * GETs queued in the same tick are sent as one POST /batch when batching
+ */
+let batchingEnabled = false;
+let batchQueue = [];
+
+export const setBatching = (enabled) => {
+  batchingEnabled = enabled;
+};
+
+const flushBatch = async () => {
+  const queued = batchQueue;
+  batchQueue = [];
+
+  // Nothing to combine; send it directly rather than queueing it again
+  if (queued.length === 1) {
+    const [{ endpoint, etag, signal, resolve, reject }] = queued;
+    sendGet(endpoint, etag, signal).then(resolve, reject);
+    return;
+  }
+
+  apiCache.stats.batches++;
+  try {
+    const response = await fetch(`${API_BASE_URL}/batch`, {
+      method: 'POST',
+      headers: authHeaders(),
+      body: JSON.stringify({ requests: queued.map(({ endpoint, etag }) => ({ path: endpoint, etag })) }),
+    });
+    const { responses } = await parseResponse(response);
+
+    queued.forEach(({ resolve, reject }, i) => {
+      const { status, etag, body } = responses[i];
+      if (status === 304) {
+        resolve({ notModified: true });
+      } else if (status >= 400) {
+        reject(new Error(body?.error || body?.message || `HTTP error! status: ${status}`));
+      } else {
+        resolve({ data: body, etag });
+      }
+    });
+  } catch (error) {
+    queued.forEach(({ reject }) => reject(error));
+  }
+};
+
+/**
+ * One network GET, conditional on etag. Resolves { data, etag } or
+ * { notModified: true }.
+ */
+const sendGet = async (endpoint, etag, signal) => {
+  const response = await fetch(`${API_BASE_URL}${endpoint}`, {
     headers: {
-      'Content-Type': 'application/json',
-      ...(token && { Authorization: `Bearer ${token}` }),
-      ...options.headers,
+      ...authHeaders(),
+      ...(etag && { 'If-None-Match': etag }),
     },
-  };
+    signal,
+  });
+
+  // Not modified since our cached copy
+  if (response.status === 304) {
+    return { notModified: true };
+  }
+
+  return { data: await parseResponse(response), etag: response.headers.get('etag') };
+};
+
+/**
+ * A GET, queued for the next batch when batching, otherwise sent now
+ */
+const fetchGet = (endpoint, etag, { batch, signal } = {}) => {
+  apiCache.stats.requests++;
+
+  if (batch || batchingEnabled) {
+    return new Promise((resolve, reject) => {
+      if (batchQueue.length === 0) {
+        setTimeout(flushBatch, 0);
+      }
+      batchQueue.push({ endpoint, etag, signal, resolve, reject });
+    });
+  }
+
+  return sendGet(endpoint, etag, signal);
+};
+
+/**
+ * GETs currently on the network, by endpoint. Callers asking for the same
+ * endpoint share one request, which is only cancelled once every caller
+ * waiting on it has aborted.
+ */
+const inFlight = new Map();
+
+const revalidate = (endpoint, options) => {
+  const existing = inFlight.get(endpoint);
+  if (existing) {
+    apiCache.stats.deduped++;
+    return existing;
+  }
+
+  const controller = new AbortController();
+  const { entry } = apiCache.lookup(endpoint);
+
+  const pending = fetchGet(endpoint, entry?.etag, { ...options, signal: controller.signal })
+    .then((result) => {
+      if (result.notModified && entry) {
+        apiCache.stats.notModified++;
+        apiCache.touch(endpoint);
+        return entry.data;
+      }
+      apiCache.store(endpoint, result.data, result.etag);
+      return result.data;
+    })
+    .finally(() => {
+      inFlight.delete(endpoint);
+    });
+
+  pending.controller = controller;
+  pending.waiters = 0;
+  inFlight.set(endpoint, pending);
+  return pending;
+};
+
+/**
+ * Wait for a shared request, rejecting early with an AbortError if signal
+ * aborts
+ */
+const waitFor = (pending, signal) => {
+  if (!signal) {
+    pending.waiters++;
+    return pending;
+  }
+  if (signal.aborted) {
+    return Promise.reject(abortError());
+  }
+
+  pending.waiters++;
+  return new Promise((resolve, reject) => {
+    const onAbort = () => {
+      apiCache.stats.aborted++;
+      if (--pending.waiters === 0) {
+        pending.controller.abort();
+      }
+      reject(abortError());
+    };
+    signal.addEventListener('abort', onAbort, { once: true });
+    pending.then(resolve, reject).finally(() => signal.removeEventListener('abort', onAbort));
+  });
+};
+
+/**
+ * Endpoint prefixes a mutation makes stale: its collection (e.g. /courses
+ * for PUT /courses/:id), unless the caller lists them explicitly
+ */
+const defaultInvalidations = (endpoint) => [`/${endpoint.split(/[/?]/)[1]}`];
+
+/**
+ * Make an API request
+ *
+ * GETs go through the cache (see apiCache.js). Extra options:
+ *   signal      - AbortSignal; aborting rejects this call with an AbortError
+ *   onUpdate    - called with fresh data when a background revalidation
+ *                 changes the response (until signal aborts)
+ *   cache       - false to skip the cache and always hit the network
+ *   batch       - send with other reads from the same tick as one request
+ *   invalidates - endpoint prefixes a mutation makes stale
+ */
+const request = async (endpoint, options = {}) => {
+  const { signal, onUpdate, cache = true, batch, invalidates, ...fetchOptions } = options;
+  const isGet = !fetchOptions.method || fetchOptions.method === 'GET';
 
   try {
-    const response = await fetch(`${API_BASE_URL}${endpoint}`, config);
-    
-    // Handle non-JSON responses
-    const contentType = response.headers.get('content-type');
-    const data = contentType?.includes('application/json')
-      ? await response.json()
-      : await response.text();
-
-    if (!response.ok) {
-      throw new Error(data.error || data.message || `HTTP error! status: ${response.status}`);
+    if (!isGet) {
+      const response = await fetch(`${API_BASE_URL}${endpoint}`, {
+        ...fetchOptions,
+        headers: { ...authHeaders(), ...fetchOptions.headers },
+        signal,
+      });
+      const data = await parseResponse(response);
+      apiCache.invalidate(...(invalidates || defaultInvalidations(endpoint)));
+      return data;
+    }
+
+    apiCache.checkOwner(getToken());
+    if (onUpdate) {
+      apiCache.listen(endpoint, onUpdate, signal);
+    }
+
+    const { entry, state } = cache ? apiCache.lookup(endpoint) : { entry: null, state: 'expired' };
+
+    if (state === 'fresh') {
+      apiCache.stats.hits++;
+      return entry.data;
     }
 
-    return data;
+    if (state === 'stale') {
+      apiCache.stats.staleHits++;
+      // Serve the cached copy now and refresh it in the background
+      waitFor(revalidate(endpoint, { batch })).catch(() => {});
+      return entry.data;
+    }
+
+    apiCache.stats.misses++;
+    return await waitFor(revalidate(endpoint, { batch }), signal);
   } catch (error) {
-    console.error('API request failed:', error);
+    if (error.name !== 'AbortError') {
+      console.error('API request failed:', error);
+    }
     throw error;
   }
 };
 
+export const getCacheStats = apiCache.getStats;
+export const invalidateCache = apiCache.invalidate;
+export const clearCache = apiCache.clear;
+
+if (import.meta.env.DEV) {
+  // Read from the browser console or a dev overlay
+  window.__apiCache = { getStats: apiCache.getStats, clear: apiCache.clear };
+}
+
 // Auth API
 export const authAPI = {
   register: (userData) => request('/auth/register', {
@@ -58,7 +271,7 @@ export const authAPI = {
     body: JSON.stringify({ email, password }),
   }),
   
-  getMe: () => request('/auth/me'),
+  getMe: (options) => request('/auth/me', options),
   
   updateMe: (userData) => request('/auth/me', {
     method: 'PUT',
@@ -68,9 +281,9 @@ export const authAPI = {
 
 // Courses API
 export const coursesAPI = {
-  getAll: () => request('/courses'),
+  getAll: (options) => request('/courses', options),
   
-  getById: (id) => request(`/courses/${id}`),
+  getById: (id, options) => request(`/courses/${id}`, options),
   
   create: (courseData) => request('/courses', {
     method: 'POST',
@@ -80,86 +293,109 @@ export const coursesAPI = {
   update: (id, courseData) => request(`/courses/${id}`, {
     method: 'PUT',
     body: JSON.stringify(courseData),
+    invalidates: ['/courses', '/calendar', '/search'],
   }),
   
   enroll: (id) => request(`/courses/${id}/enroll`, {
     method: 'POST',
+    invalidates: ['/courses', '/progress', '/calendar'],
   }),
   
   unenroll: (id) => request(`/courses/${id}/unenroll`, {
     method: 'POST',
+    invalidates: ['/courses', '/progress', '/calendar'],
   }),
   
-  getStudents: (id) => request(`/courses/${id}/students`),
+  getStudents: (id, options) => request(`/courses/${id}/students`, options),
 };
 
 // Assignments API
 export const assignmentsAPI = {
-  getByCourse: (courseId) => request(`/courses/${courseId}/assignments`),
+  getByCourse: (courseId, options) => request(`/courses/${courseId}/assignments`, options),
   
-  getById: (id) => request(`/assignments/${id}`),
+  getById: (id, options) => request(`/assignments/${id}`, options),
   
   create: (courseId, assignmentData) => request(`/courses/${courseId}/assignments`, {
     method: 'POST',
     body: JSON.stringify(assignmentData),
+    invalidates: [`/courses/${courseId}`, '/calendar', '/progress'],
   }),
   
   update: (id, assignmentData) => request(`/assignments/${id}`, {
     method: 'PUT',
     body: JSON.stringify(assignmentData),
+    invalidates: [`/assignments/${id}`, '/courses', '/calendar', '/progress'],
   }),
   
   submit: (id, submissionData) => request(`/assignments/${id}/submit`, {
     method: 'POST',
     body: JSON.stringify(submissionData),
+    invalidates: [`/assignments/${id}`, '/courses', '/progress'],
   }),
   
-  getSubmissions: (id) => request(`/assignments/${id}/submissions`),
+  getSubmissions: (id, options) => request(`/assignments/${id}/submissions`, options),
 };
 
 // Grades API
 export const gradesAPI = {
-  getMyGrades: () => request('/grades/me'),
+  getMyGrades: (options) => request('/grades/me', options),
   
-  getCourseGrades: (courseId) => request(`/courses/${courseId}/grades`),
+  getCourseGrades: (courseId, options) => request(`/courses/${courseId}/grades`, options),
   
   gradeSubmission: (submissionId, gradeData) => request(`/submissions/${submissionId}/grade`, {
     method: 'POST',
     body: JSON.stringify(gradeData),
+    invalidates: ['/assignments', '/courses', '/grades'],
   }),
   
   releaseGrade: (submissionId) => request(`/submissions/${submissionId}/release`, {
     method: 'POST',
+    invalidates: ['/courses', '/grades'],
+  }),
+};
+
+// Progress API
+export const progressAPI = {
+  getDashboard: (options) => request('/progress/dashboard', options),
+  
+  // Buffered server-side; nothing cached goes stale immediately
+  sendHeartbeats: (heartbeats) => request('/progress/heartbeats', {
+    method: 'POST',
+    body: JSON.stringify({ heartbeats }),
+    invalidates: [],
   }),
 };
 
 // Announcements API
 export const announcementsAPI = {
-  getByCourse: (courseId) => request(`/courses/${courseId}/announcements`),
+  getByCourse: (courseId, options) => request(`/courses/${courseId}/announcements`, options),
   
   create: (courseId, announcementData) => request(`/courses/${courseId}/announcements`, {
     method: 'POST',
     body: JSON.stringify(announcementData),
+    invalidates: [`/courses/${courseId}/announcements`, '/search'],
   }),
   
   update: (id, announcementData) => request(`/announcements/${id}`, {
     method: 'PUT',
     body: JSON.stringify(announcementData),
+    invalidates: ['/courses', '/search'],
   }),
   
   delete: (id) => request(`/announcements/${id}`, {
     method: 'DELETE',
+    invalidates: ['/courses', '/search'],
   }),
 };
 
 // Notifications API
 export const notificationsAPI = {
-  getAll: (params = {}) => {
+  getAll: (params = {}, options) => {
     const queryString = new URLSearchParams(params).toString();
-    return request(`/notifications${queryString ? `?${queryString}` : ''}`);
+    return request(`/notifications${queryString ? `?${queryString}` : ''}`, options);
   },
   
-  getUnreadCount: () => request('/notifications/unread/count'),
+  getUnreadCount: (options) => request('/notifications/unread/count', options),
   
   markAsRead: (id) => request(`/notifications/${id}/read`, {
     method: 'POST',
@@ -221,13 +457,43 @@ export const filesAPI = {
   getFileUrl: (folder, filename) => `${API_BASE_URL}/files/${folder}/${filename}`,
 };
 
+// Calendar API
+export const calendarAPI = {
+  // Events and assignment due dates in [from, to), bucketed by day in timeZone
+  getEvents: (from, to, { courseId, timeZone = Intl.DateTimeFormat().resolvedOptions().timeZone, ...options } = {}) => {
+    const params = new URLSearchParams({
+      from: new Date(from).toISOString(),
+      to: new Date(to).toISOString(),
+      tz: timeZone,
+    });
+    if (courseId) params.set('courseId', courseId);
+    return request(`/calendar?${params}`, options);
+  },
+};
+
+// Search API
+export const searchAPI = {
+  // type: comma-separated subset of course, announcement, assignment, content
+  search: (q, { type, courseId, limit, offset, ...options } = {}) => {
+    const params = new URLSearchParams({ q });
+    if (type) params.set('type', type);
+    if (courseId) params.set('courseId', courseId);
+    if (limit) params.set('limit', limit);
+    if (offset) params.set('offset', offset);
+    return request(`/search?${params}`, options);
+  },
+};
+
 export default {
   auth: authAPI,
   courses: coursesAPI,
   assignments: assignmentsAPI,
   grades: gradesAPI,
+  progress: progressAPI,
   announcements: announcementsAPI,
   notifications: notificationsAPI,
   files: filesAPI,
+  calendar: calendarAPI,
+  search: searchAPI,
 };
 
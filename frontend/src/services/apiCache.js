@@ -0,0 +1,149 @@
+/**
+ * In-memory cache for GET responses, used by request() in api.js.
+ *
+ * Entries are keyed by endpoint and follow a per-endpoint policy:
+ *   ttl    - ms an entry is fresh and served without a network request
+ *   maxAge - ms a stale entry may still be served while it is revalidated
+ *            in the background (stale-while-revalidate)
+ * Past maxAge the caller waits for the network. Revalidation sends the
+ * stored ETag, so an unchanged resource costs a 304 and no body.
+ */
+
+const MINUTE = 60 * 1000;
+
+const DEFAULT_POLICY = { ttl: 0, maxAge: 5 * MINUTE };
+
+// First match wins; endpoints are relative to API_BASE_URL
+const POLICIES = [
+  [/^\/auth\/me$/, { ttl: MINUTE, maxAge: 10 * MINUTE }],
+  [/^\/courses(\/[^/?]+)?$/, { ttl: 30 * 1000, maxAge: 10 * MINUTE }],
+  [/^\/courses\/[^/]+\/(assignments|announcements|students)$/, { ttl: 30 * 1000, maxAge: 5 * MINUTE }],
+  [/^\/notifications\/unread\/count$/, { ttl: 5 * 1000, maxAge: MINUTE }],
+  [/^\/notifications/, { ttl: 0, maxAge: MINUTE }],
+  [/^\/progress\/dashboard$/, { ttl: 10 * 1000, maxAge: 5 * MINUTE }],
+  [/^\/calendar\?/, { ttl: MINUTE, maxAge: 10 * MINUTE }],
+  [/^\/search\?/, { ttl: 30 * 1000, maxAge: MINUTE }],
+];
+
+const MAX_ENTRIES = 500;
+
+const entries = new Map();
+const listeners = new Map();
+// Token the cached data was fetched with; a different user starts empty
+let owner = null;
+
+export const stats = {
+  hits: 0,
+  staleHits: 0,
+  misses: 0,
+  deduped: 0,
+  requests: 0,
+  notModified: 0,
+  batches: 0,
+  invalidations: 0,
+  aborted: 0,
+};
+
+const policyFor = (key) => {
+  const match = POLICIES.find(([pattern]) => pattern.test(key));
+  return match ? match[1] : DEFAULT_POLICY;
+};
+
+/**
+ * Drop everything if the signed-in user changed since the last request
+ */
+export const checkOwner = (token) => {
+  if (token !== owner) {
+    entries.clear();
+    owner = token;
+  }
+};
+
+/**
+ * Cached entry for key and whether it is 'fresh', 'stale' or 'expired'
+ */
+export const lookup = (key) => {
+  const entry = entries.get(key);
+  if (!entry) {
+    return { entry: null, state: 'expired' };
+  }
+
+  const age = Date.now() - entry.fetchedAt;
+  const { ttl, maxAge } = policyFor(key);
+  const state = entry.invalidated || age > maxAge ? 'expired' : age > ttl ? 'stale' : 'fresh';
+  return { entry, state };
+};
+
+/**
+ * Store a response and tell listeners if the data changed
+ */
+export const store = (key, data, etag) => {
+  const previous = entries.get(key);
+  const changed = !previous || !etag || previous.etag !== etag;
+
+  entries.delete(key);
+  entries.set(key, { data, etag, fetchedAt: Date.now(), invalidated: false });
+
+  // Oldest first in insertion order
+  if (entries.size > MAX_ENTRIES) {
+    entries.delete(entries.keys().next().value);
+  }
+
+  if (changed && previous) {
+    (listeners.get(key) || []).forEach((listener) => listener(data));
+  }
+};
+
+/**
+ * A 304 confirmed the cached copy; restart its ttl
+ */
+export const touch = (key) => {
+  const entry = entries.get(key);
+  if (entry) {
+    entry.fetchedAt = Date.now();
+    entry.invalidated = false;
+  }
+};
+
+/**
+ * Mark every entry under the given endpoint prefixes as expired. The data
+ * and ETag are kept, so the next read revalidates with a conditional GET.
+ */
+export const invalidate = (...prefixes) => {
+  for (const [key, entry] of entries) {
+    if (prefixes.some((prefix) => key === prefix || key.startsWith(`${prefix}/`) || key.startsWith(`${prefix}?`))) {
+      entry.invalidated = true;
+      stats.invalidations++;
+    }
+  }
+};
+
+/**
+ * Call listener with new data whenever key is revalidated with a change,
+ * until signal aborts
+ */
+export const listen = (key, listener, signal) => {
+  if (!listeners.has(key)) {
+    listeners.set(key, new Set());
+  }
+  listeners.get(key).add(listener);
+
+  signal?.addEventListener('abort', () => {
+    listeners.get(key)?.delete(listener);
+  });
+};
+
+export const clear = () => {
+  entries.clear();
+};
+
+/**
+ * Counters plus current size, for the dev overlay
+ */
+export const getStats = () => ({
+  ...stats,
+  entries: entries.size,
+  hitRate: stats.hits + stats.staleHits + stats.misses
+    ? (stats.hits + stats.staleHits) / (stats.hits + stats.staleHits + stats.misses)
+    : 0,
+});
@@ -0,0 +1,90 @@
+/**
+ * Client for the signal engine worker.
+ *
+ * compute(key, request) runs computeSignal (utils/signal.js) in a shared
+ * Web Worker. Requests with the same key coalesce: while one is running,
+ * only the newest waiting request is kept and older waiting ones resolve
+ * with null, so typing into an input never queues up stale work.
+ */
+
+import { computeSignal } from '../utils/signal';
+
+let worker = null;
+let nextId = 0;
+const pending = new Map();
+// key -> { running: boolean, queued: { request, resolve, reject } | null }
+const channels = new Map();
+
+const getWorker = () => {
+  if (!worker) {
+    worker = new Worker(new URL('../workers/signal.worker.js', import.meta.url), { type: 'module' });
+
+    worker.onmessage = ({ data }) => {
+      const job = pending.get(data.id);
+      pending.delete(data.id);
+      if (data.error) {
+        job?.reject(new Error(data.error));
+      } else {
+        job?.resolve(data.result);
+      }
+    };
+
+    worker.onerror = (event) => {
+      event.preventDefault();
+      const error = new Error(event.message || 'Signal worker failed');
+      pending.forEach((job) => job.reject(error));
+      pending.clear();
+      worker.terminate();
+      worker = null;
+    };
+  }
+  return worker;
+};
+
+const run = (request) => {
+  // No workers (e.g. server rendering): compute in place
+  if (typeof Worker === 'undefined') {
+    return Promise.resolve().then(() => computeSignal(request));
+  }
+
+  return new Promise((resolve, reject) => {
+    const id = ++nextId;
+    pending.set(id, { resolve, reject });
+    getWorker().postMessage({ id, ...request });
+  });
+};
+
+const start = (key, { request, resolve, reject }) => {
+  const channel = channels.get(key);
+  channel.running = true;
+
+  run(request)
+    .then(resolve, reject)
+    .finally(() => {
+      channel.running = false;
+      const next = channel.queued;
+      channel.queued = null;
+      if (next) {
+        start(key, next);
+      }
+    });
+};
+
+export const compute = (key, request) => {
+  if (!channels.has(key)) {
+    channels.set(key, { running: false, queued: null });
+  }
+  const channel = channels.get(key);
+
+  return new Promise((resolve, reject) => {
+    const job = { request, resolve, reject };
+    if (!channel.running) {
+      start(key, job);
+      return;
+    }
+    channel.queued?.resolve(null);
+    channel.queued = job;
+  });
+};
+
+export default { compute };
@@ -0,0 +1,452 @@
+/**
+ * Signal-processing engine for the modulation and multiplexing visuals.
+ *
+ * Pure functions over typed arrays, run off the main thread by
+ * workers/signal.worker.js. Waveforms are generated a batch of symbols at a
+ * time into one reused Float32Array, and each batch is folded straight into
+ * a min/max envelope the width of the plot and demodulated in the same
+ * pass. Memory stays bounded for million-bit streams, and the main thread
+ * only receives an array as wide as the canvas.
+ */
+
+export const MODULATION_SCHEMES = ['ASK', 'FSK', 'PSK', 'QAM'];
+export const MULTIPLEXING_SCHEMES = ['TDM', 'FDM'];
+
+export const BITS_PER_SYMBOL = { ASK: 1, FSK: 1, PSK: 1, QAM: 4 };
+
+export const DEFAULT_OPTIONS = {
+  samplesPerSymbol: 32,
+  carrierCycles: 2,
+  noise: 0,
+};
+
+const BATCH_SYMBOLS = 4096;
+const TWO_PI = 2 * Math.PI;
+
+// 16-QAM amplitude per Gray-coded bit pair: 00 -> -3, 01 -> -1, 11 -> 1, 10 -> 3
+const QAM_LEVELS = [-3, -1, 3, 1];
+
+/**
+ * Bits from user input: a string of 0s and 1s is taken as bits, anything
+ * else as text (UTF-8, 8 bits per byte, most significant bit first)
+ */
+export const isBitString = (input) => /^[01\s]*[01][01\s]*$/.test(String(input ?? ''));
+
+export const parseBits = (input) => {
+  const value = String(input ?? '');
+
+  if (isBitString(value)) {
+    const compact = value.replace(/\s+/g, '');
+    const bits = new Uint8Array(compact.length);
+    for (let i = 0; i < compact.length; i++) {
+      bits[i] = compact.charCodeAt(i) === 49 ? 1 : 0;
+    }
+    return bits;
+  }
+
+  const bytes = new TextEncoder().encode(value);
+  const bits = new Uint8Array(bytes.length * 8);
+  for (let i = 0; i < bytes.length; i++) {
+    for (let b = 0; b < 8; b++) {
+      bits[i * 8 + b] = (bytes[i] >> (7 - b)) & 1;
+    }
+  }
+  return bits;
+};
+
+/**
+ * Text from bits, the inverse of parseBits for text input
+ */
+export const bitsToText = (bits) => {
+  const bytes = new Uint8Array(Math.floor(bits.length / 8));
+  for (let i = 0; i < bytes.length; i++) {
+    let byte = 0;
+    for (let b = 0; b < 8; b++) {
+      byte = (byte << 1) | bits[i * 8 + b];
+    }
+    bytes[i] = byte;
+  }
+  return new TextDecoder().decode(bytes);
+};
+
+export const bitsToString = (bits, limit = bits.length) => {
+  let text = '';
+  for (let i = 0; i < Math.min(bits.length, limit); i++) {
+    text += bits[i] ? '1' : '0';
+  }
+  return text;
+};
+
+export const randomBits = (count) => {
+  const bits = new Uint8Array(count);
+  for (let i = 0; i < count; i++) {
+    bits[i] = Math.random() < 0.5 ? 0 : 1;
+  }
+  return bits;
+};
+
+const carriers = new Map();
+
+// One symbol period of sin/cos at `cycles` cycles per symbol
+const carrier = (cycles, samples) => {
+  const key = `${cycles}:${samples}`;
+  if (!carriers.has(key)) {
+    const sin = new Float32Array(samples);
+    const cos = new Float32Array(samples);
+    for (let n = 0; n < samples; n++) {
+      const phase = (TWO_PI * cycles * n) / samples;
+      sin[n] = Math.sin(phase);
+      cos[n] = Math.cos(phase);
+    }
+    carriers.set(key, { sin, cos });
+  }
+  return carriers.get(key);
+};
+
+// Standard normal samples (Box-Muller, both outputs used)
+let spareGaussian = null;
+const gaussian = () => {
+  if (spareGaussian !== null) {
+    const value = spareGaussian;
+    spareGaussian = null;
+    return value;
+  }
+  const radius = Math.sqrt(-2 * Math.log(1 - Math.random()));
+  const angle = TWO_PI * Math.random();
+  spareGaussian = radius * Math.sin(angle);
+  return radius * Math.cos(angle);
+};
+
+const addNoise = (buffer, length, noise) => {
+  if (noise > 0) {
+    for (let i = 0; i < length; i++) {
+      buffer[i] += noise * gaussian();
+    }
+  }
+};
+
+/**
+ * Running min/max of a sample stream in `width` columns (fewer if the
+ * stream is shorter). Returns { add(buffer, length), finish() }; finish()
+ * gives a Float32Array of interleaved [min, max] per column.
+ */
+export const createEnvelope = (width, totalSamples) => {
+  const columns = Math.max(1, Math.min(width, totalSamples));
+  const envelope = new Float32Array(columns * 2);
+  const scale = columns / Math.max(totalSamples, 1);
+  let index = 0;
+
+  for (let c = 0; c < columns; c++) {
+    envelope[c * 2] = Infinity;
+    envelope[c * 2 + 1] = -Infinity;
+  }
+
+  const add = (buffer, length) => {
+    let i = 0;
+    while (i < length) {
+      // Walk one column at a time so the inner loop is a plain min/max
+      const column = Math.min((index * scale) | 0, columns - 1);
+      const columnEnd = column === columns - 1 ? Infinity : Math.ceil((column + 1) / scale);
+      const start = i;
+      const end = Math.min(length, i + Math.max(columnEnd - index, 1));
+      let min = envelope[column * 2];
+      let max = envelope[column * 2 + 1];
+      for (; i < end; i++) {
+        const value = buffer[i];
+        if (value < min) min = value;
+        if (value > max) max = value;
+      }
+      envelope[column * 2] = min;
+      envelope[column * 2 + 1] = max;
+      index += end - start;
+    }
+  };
+
+  const finish = () => {
+    for (let c = 0; c < columns * 2; c += 2) {
+      if (envelope[c] > envelope[c + 1]) {
+        envelope[c] = 0;
+        envelope[c + 1] = 0;
+      }
+    }
+    return envelope;
+  };
+
+  return { add, finish };
+};
+
+/**
+ * Min/max of a bit stream in `width` columns, as a 0/1 level envelope
+ */
+export const bitEnvelope = (bits, width) => {
+  const envelope = createEnvelope(width, bits.length);
+  const levels = new Float32Array(BATCH_SYMBOLS);
+  for (let first = 0; first < bits.length; first += BATCH_SYMBOLS) {
+    const count = Math.min(BATCH_SYMBOLS, bits.length - first);
+    for (let i = 0; i < count; i++) {
+      levels[i] = bits[first + i];
+    }
+    envelope.add(levels, count);
+  }
+  return envelope.finish();
+};
+
+// Write `count` symbols starting at symbol `first` into `out`
+const modulateSymbols = (bits, scheme, first, count, out, { samplesPerSymbol: sps, carrierCycles }) => {
+  const { sin, cos } = carrier(carrierCycles, sps);
+
+  switch (scheme) {
+    case 'ASK':
+      for (let s = 0; s < count; s++) {
+        const amplitude = bits[first + s];
+        for (let n = 0, o = s * sps; n < sps; n++, o++) out[o] = amplitude * sin[n];
+      }
+      break;
+    case 'FSK': {
+      // Mark and space at carrierCycles and twice that: orthogonal over a symbol
+      const mark = carrier(carrierCycles * 2, sps).sin;
+      for (let s = 0; s < count; s++) {
+        const wave = bits[first + s] ? mark : sin;
+        for (let n = 0, o = s * sps; n < sps; n++, o++) out[o] = wave[n];
+      }
+      break;
+    }
+    case 'PSK':
+      for (let s = 0; s < count; s++) {
+        const sign = bits[first + s] ? 1 : -1;
+        for (let n = 0, o = s * sps; n < sps; n++, o++) out[o] = sign * sin[n];
+      }
+      break;
+    case 'QAM':
+      for (let s = 0; s < count; s++) {
+        const b = (first + s) * 4;
+        const i = QAM_LEVELS[(bits[b] << 1) | bits[b + 1]] / 3;
+        const q = QAM_LEVELS[(bits[b + 2] << 1) | bits[b + 3]] / 3;
+        for (let n = 0, o = s * sps; n < sps; n++, o++) out[o] = i * cos[n] + q * sin[n];
+      }
+      break;
+    default:
+      throw new Error(`Unknown modulation scheme: ${scheme}`);
+  }
+};
+
+// 16-QAM amplitude back to its bit pair
+const sliceQam = (value) => {
+  const level = value * 3;
+  if (level < -2) return [0, 0];
+  if (level < 0) return [0, 1];
+  if (level < 2) return [1, 1];
+  return [1, 0];
+};
+
+// Coherent correlation receiver: recover the bits of `count` symbols
+const demodulateSymbols = (samples, scheme, first, count, out, { samplesPerSymbol: sps, carrierCycles }) => {
+  const { sin, cos } = carrier(carrierCycles, sps);
+  // Second reference: the mark tone for FSK, the in-phase carrier otherwise
+  const reference = scheme === 'FSK' ? carrier(carrierCycles * 2, sps).sin : cos;
+  const gain = 2 / sps;
+
+  for (let s = 0; s < count; s++) {
+    const o = s * sps;
+    let quadrature = 0;
+    let other = 0;
+    for (let n = 0; n < sps; n++) {
+      const sample = samples[o + n];
+      quadrature += sample * sin[n];
+      other += sample * reference[n];
+    }
+
+    switch (scheme) {
+      case 'ASK':
+        out[first + s] = quadrature * gain > 0.5 ? 1 : 0;
+        break;
+      case 'FSK':
+        out[first + s] = Math.abs(other) > Math.abs(quadrature) ? 1 : 0;
+        break;
+      case 'PSK':
+        out[first + s] = quadrature > 0 ? 1 : 0;
+        break;
+      default: {
+        const b = (first + s) * 4;
+        [out[b], out[b + 1]] = sliceQam(other * gain);
+        [out[b + 2], out[b + 3]] = sliceQam(quadrature * gain);
+      }
+    }
+  }
+};
+
+const countErrors = (expected, actual) => {
+  let errors = 0;
+  for (let i = 0; i < expected.length; i++) {
+    if (expected[i] !== actual[i]) errors++;
+  }
+  return errors;
+};
+
+/**
+ * Modulate `bits` with `scheme`, pass them through a channel with optional
+ * Gaussian noise and demodulate them again.
+ *
+ * Returns the transmitted waveform and the input bits as `width`-column
+ * envelopes, the recovered bits and the bit error count.
+ */
+export const runModulation = (bits, scheme, { width = 800, ...options } = {}) => {
+  const settings = { ...DEFAULT_OPTIONS, ...options };
+  const sps = settings.samplesPerSymbol;
+  const bitsPerSymbol = BITS_PER_SYMBOL[scheme];
+  if (!bitsPerSymbol) {
+    throw new Error(`Unknown modulation scheme: ${scheme}`);
+  }
+
+  const symbols = Math.ceil(bits.length / bitsPerSymbol);
+  // QAM needs whole symbols; pad the last one with zeros
+  const padded = symbols * bitsPerSymbol === bits.length ? bits : new Uint8Array(symbols * bitsPerSymbol);
+  if (padded !== bits) {
+    padded.set(bits);
+  }
+
+  const recovered = new Uint8Array(padded.length);
+  const buffer = new Float32Array(Math.min(symbols, BATCH_SYMBOLS) * sps);
+  const waveform = createEnvelope(width, symbols * sps);
+
+  for (let first = 0; first < symbols; first += BATCH_SYMBOLS) {
+    const count = Math.min(BATCH_SYMBOLS, symbols - first);
+    const length = count * sps;
+    modulateSymbols(padded, scheme, first, count, buffer, settings);
+    addNoise(buffer, length, settings.noise);
+    waveform.add(buffer, length);
+    demodulateSymbols(buffer, scheme, first, count, recovered, settings);
+  }
+
+  const output = recovered.subarray(0, bits.length);
+  return {
+    waveform: waveform.finish(),
+    input: bitEnvelope(bits, width),
+    recovered: output,
+    errors: countErrors(bits, output),
+    samples: symbols * sps,
+  };
+};
+
+/**
+ * Multiplex several bit streams onto one channel and separate them again.
+ *
+ * TDM interleaves one bit per stream per frame as an NRZ (+1/-1) line; FDM
+ * sends every stream at once, each PSK-modulated on its own carrier, and
+ * sums them. Shorter streams are padded with zeros.
+ */
+export const runMultiplexing = (streams, scheme, { width = 800, ...options } = {}) => {
+  const settings = { ...DEFAULT_OPTIONS, ...options };
+  const sps = settings.samplesPerSymbol;
+  const channels = streams.length;
+  const longest = Math.max(0, ...streams.map((stream) => stream.length));
+  const recovered = streams.map(() => new Uint8Array(longest));
+  const bit = (channel, index) => (index < streams[channel].length ? streams[channel][index] : 0);
+
+  if (scheme !== 'TDM' && scheme !== 'FDM') {
+    throw new Error(`Unknown multiplexing scheme: ${scheme}`);
+  }
+  if (channels === 0 || longest === 0) {
+    return { waveform: new Float32Array(2), recovered, errors: streams.map(() => 0), samples: 0 };
+  }
+
+  // TDM has one slot per channel per frame; FDM one symbol per frame
+  const slots = scheme === 'TDM' ? longest * channels : longest;
+  const buffer = new Float32Array(Math.min(slots, BATCH_SYMBOLS) * sps);
+  const waveform = createEnvelope(width, slots * sps);
+  const tones = streams.map((_, channel) => carrier(settings.carrierCycles * (channel + 1), sps).sin);
+  const gain = 2 / sps;
+
+  for (let first = 0; first < slots; first += BATCH_SYMBOLS) {
+    const count = Math.min(BATCH_SYMBOLS, slots - first);
+    const length = count * sps;
+
+    for (let s = 0; s < count; s++) {
+      const slot = first + s;
+      const o = s * sps;
+      if (scheme === 'TDM') {
+        const level = bit(slot % channels, Math.floor(slot / channels)) ? 1 : -1;
+        buffer.fill(level, o, o + sps);
+      } else {
+        buffer.fill(0, o, o + sps);
+        for (let channel = 0; channel < channels; channel++) {
+          const sign = bit(channel, slot) ? 1 : -1;
+          const tone = tones[channel];
+          for (let n = 0; n < sps; n++) buffer[o + n] += sign * tone[n];
+        }
+      }
+    }
+
+    addNoise(buffer, length, settings.noise);
+    waveform.add(buffer, length);
+
+    for (let s = 0; s < count; s++) {
+      const slot = first + s;
+      const o = s * sps;
+      if (scheme === 'TDM') {
+        let sum = 0;
+        for (let n = 0; n < sps; n++) sum += buffer[o + n];
+        recovered[slot % channels][Math.floor(slot / channels)] = sum > 0 ? 1 : 0;
+      } else {
+        for (let channel = 0; channel < channels; channel++) {
+          const tone = tones[channel];
+          let correlation = 0;
+          for (let n = 0; n < sps; n++) correlation += buffer[o + n] * tone[n];
+          recovered[channel][slot] = correlation * gain > 0 ? 1 : 0;
+        }
+      }
+    }
+  }
+
+  const outputs = recovered.map((bits, channel) => bits.subarray(0, streams[channel].length));
+  return {
+    waveform: waveform.finish(),
+    recovered: outputs,
+    errors: outputs.map((bits, channel) => countErrors(streams[channel], bits)),
+    samples: slots * sps,
+  };
+};
+
+// Recovered data as the user entered it: text for text input, else bits
+const PREVIEW_BITS = 256;
+const preview = (bits, input) => {
+  if (input !== null && !isBitString(input)) {
+    return bitsToText(bits);
+  }
+  const text = bitsToString(bits, PREVIEW_BITS);
+  return bits.length > PREVIEW_BITS ? `${text}...` : text;
+};
+
+/**
+ * Run one request from the visuals and summarise it for display:
+ *   { kind: 'modulation', scheme, input | random, width, options }
+ *   { kind: 'multiplexing', scheme, inputs, width, options }
+ * `random` is a bit count to generate instead of parsing `input`.
+ */
+export const computeSignal = ({ kind, scheme, input, inputs, random, width, options }) => {
+  const started = performance.now();
+
+  if (kind === 'multiplexing') {
+    const streams = inputs.map(parseBits);
+    const result = runMultiplexing(streams, scheme, { ...options, width });
+    return {
+      waveform: result.waveform,
+      samples: result.samples,
+      bits: streams.reduce((total, stream) => total + stream.length, 0),
+      channels: result.recovered.map((bits, i) => ({ recovered: preview(bits, inputs[i]), errors: result.errors[i] })),
+      elapsedMs: performance.now() - started,
+    };
+  }
+
+  const bits = random ? randomBits(random) : parseBits(input);
+  const result = runModulation(bits, scheme, { ...options, width });
+  return {
+    waveform: result.waveform,
+    input: result.input,
+    samples: result.samples,
+    bits: bits.length,
+    recovered: preview(result.recovered, random ? null : input),
+    errors: result.errors,
+    elapsedMs: performance.now() - started,
+  };
+};
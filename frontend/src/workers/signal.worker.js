@@ -0,0 +1,19 @@
+/**
+ * Web Worker running the signal engine (utils/signal.js) off the main
+ * thread. Messages are { id, ...request } for computeSignal; replies are
+ * { id, result } or { id, error }. Envelopes come back as transferred
+ * Float32Arrays the width of the plot.
+ */
+
+import { computeSignal } from '../utils/signal';
+
+self.onmessage = ({ data }) => {
+  const { id, ...request } = data;
+  try {
+    const result = computeSignal(request);
+    const transfers = [result.waveform.buffer, ...(result.input ? [result.input.buffer] : [])];
+    self.postMessage({ id, result }, transfers);
+  } catch (error) {
+    self.postMessage({ id, error: error.message });
+  }
+};